@@ -3,38 +3,50 @@ Multilingual Prompt Optimizer (MPO)
 
 A tool for cultural adaptation of LLM prompts across languages,
 demonstrating measurable performance improvements.
+
+Public names are imported lazily (PEP 562): provider SDKs such as anthropic
+and openai are only loaded when a symbol that needs them is first accessed.
 """
 
-__version__ = "1.0.0"
+from importlib import import_module
 
-from .core.prompt import (
-    PromptTemplate,
-    PromptVariant,
-    LLMResponse,
-    PromptDomain,
-    FormalityLevel
-)
+__version__ = "1.0.0"
 
-from .core.adapter import CulturalAdapter
-from .adapters import (
-    EnglishAdapter,
-    GermanAdapter,
-    SpanishAdapter,
-    get_adapter
-)
+# Public name -> submodule that defines it (resolved on first access)
+_LAZY_IMPORTS = {
+    # Core
+    "PromptTemplate": ".core.prompt",
+    "PromptVariant": ".core.prompt",
+    "LLMResponse": ".core.prompt",
+    "PromptDomain": ".core.prompt",
+    "FormalityLevel": ".core.prompt",
 
-from .core.evaluator import PromptEvaluator
+    # Adapters
+    "CulturalAdapter": ".core.adapter",
+    "EnglishAdapter": ".adapters",
+    "GermanAdapter": ".adapters",
+    "SpanishAdapter": ".adapters",
+    "get_adapter": ".adapters",
 
-from .providers.base import AbstractLLMProvider, GenerationConfig
-from .providers.anthropic_provider import AnthropicProvider, MockAnthropicProvider
-from .providers.openai_provider import OpenAIProvider, MockOpenAIProvider
-from .providers.local_provider import LocalLLMProvider
+    # Evaluator
+    "PromptEvaluator": ".core.evaluator",
 
-from .storage.cache_manager import CacheManager
-from .storage.experiment_tracker import ExperimentTracker, ExperimentConfig, ExperimentRun
+    # Providers
+    "AbstractLLMProvider": ".providers.base",
+    "GenerationConfig": ".providers.base",
+    "AnthropicProvider": ".providers.anthropic_provider",
+    "MockAnthropicProvider": ".providers.anthropic_provider",
+    "OpenAIProvider": ".providers.openai_provider",
+    "MockOpenAIProvider": ".providers.openai_provider",
+    "LocalLLMProvider": ".providers.local_provider",
 
-# Import constants module for easy access
-from . import constants
+    # Storage
+    "CacheManager": ".storage.cache_manager",
+    "ExperimentTracker": ".storage.experiment_tracker",
+    "ExperimentConfig": ".storage.experiment_tracker",
+    "ExperimentRun": ".storage.experiment_tracker",
+    "SQLiteExperimentTracker": ".storage.experiment_tracker_sqlite",
+}
 
 __all__ = [
     # Version
@@ -71,7 +83,27 @@ __all__ = [
     "ExperimentTracker",
     "ExperimentConfig",
     "ExperimentRun",
+    "SQLiteExperimentTracker",
 
     # Constants
     "constants",
 ]
+
+
+def __getattr__(name: str):
+    """Import public names on first access (PEP 562)."""
+    if name == "constants":
+        return import_module(".constants", __name__)
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir(mpo)."""
+    return sorted(set(globals()) | set(__all__))
@@ -7,11 +7,15 @@ This package contains language-specific cultural adaptation implementations.
 from .en_adapter import EnglishAdapter
 from .de_adapter import GermanAdapter
 from .es_adapter import SpanishAdapter
-from .factory import get_adapter
+from .factory import get_adapter, batch_adapt, clear_adapter_cache
+from .batch_runner import run_batch
 
 __all__ = [
     'EnglishAdapter',
     'GermanAdapter',
     'SpanishAdapter',
-    'get_adapter'
+    'get_adapter',
+    'batch_adapt',
+    'clear_adapter_cache',
+    'run_batch'
 ]
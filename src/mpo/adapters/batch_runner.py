@@ -0,0 +1,102 @@
+"""
+Offline bulk adaptation through provider Batch APIs.
+
+For non-interactive workloads (evaluations, experiments) the Phase 2 LLM
+refinement of many templates can be submitted as a single batch job, which
+providers bill at a discount and process with far higher throughput than
+individual online calls. Results arrive asynchronously (up to hours later),
+so this path is not suitable for interactive use.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from ..core.adapter import CulturalAdapter
+from ..core.prompt import PromptTemplate, PromptVariant, FormalityLevel
+from ..providers.base import AbstractLLMProvider
+
+logger = logging.getLogger(__name__)
+
+# Characters not allowed in batch custom_id values (Anthropic: [a-zA-Z0-9_-]{1,64})
+_INVALID_CUSTOM_ID_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+def run_batch(
+    adapters_and_templates: List[Tuple[CulturalAdapter, PromptTemplate, FormalityLevel]],
+    provider: AbstractLLMProvider,
+    poll_interval: float = 30.0
+) -> List[PromptVariant]:
+    """
+    Adapt many templates, routing all Phase 2 refinements through one batch job.
+
+    Phase 1 (programmatic) runs locally for every item. Items whose adapter
+    has LLM refinement enabled are grouped by system prompt and generation
+    config, and each group is submitted via provider.submit_batch(). Items
+    whose refinement is missing from the batch output fall back to the
+    programmatic result, exactly as CulturalAdapter.adapt() does when an
+    online call fails.
+
+    Args:
+        adapters_and_templates: (adapter, template, formality) triples to adapt
+        provider: LLM provider used for the batch refinement
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        One PromptVariant per input triple, in input order
+
+    Raises:
+        Exception: If a batch job cannot be submitted or fails as a whole
+    """
+    prepared = []
+    # Requests grouped by (system prompt, temperature, max_tokens) -> {custom_id: prompt}
+    groups: Dict[Tuple[str, float, int], Dict[str, str]] = {}
+    group_configs = {}
+
+    for index, (adapter, template, formality) in enumerate(adapters_and_templates):
+        programmatic_output, llm_prompt = adapter.prepare_refinement(template, formality)
+        custom_id = _build_custom_id(index, adapter, template, formality)
+        prepared.append((adapter, template, formality, programmatic_output, llm_prompt, custom_id))
+
+        if llm_prompt is None:
+            continue
+
+        config = adapter.get_llm_generation_config()
+        group_key = (adapter.LLM_SYSTEM_PROMPT, config.temperature, config.max_tokens)
+        groups.setdefault(group_key, {})[custom_id] = llm_prompt
+        group_configs[group_key] = config
+
+    outputs: Dict[str, Dict] = {}
+    for group_key, prompts in groups.items():
+        logger.info(f"Submitting batch of {len(prompts)} refinements to {provider.provider_name}")
+        outputs.update(provider.submit_batch(
+            prompts, group_configs[group_key], poll_interval, system_prompt=group_key[0]
+        ))
+
+    variants = []
+    for adapter, template, formality, programmatic_output, llm_prompt, custom_id in prepared:
+        result: Optional[Dict] = outputs.get(custom_id)
+        if llm_prompt is not None and result is None:
+            logger.warning(
+                f"Batch refinement missing for {custom_id}. Falling back to programmatic only."
+            )
+        variants.append(adapter.finalize_refinement(
+            template,
+            formality,
+            programmatic_output,
+            llm_prompt,
+            result["content"] if result else None
+        ))
+
+    return variants
+
+
+def _build_custom_id(
+    index: int,
+    adapter: CulturalAdapter,
+    template: PromptTemplate,
+    formality: FormalityLevel
+) -> str:
+    """Build a unique, provider-safe custom_id for one batch request."""
+    raw_id = f"{index}_{adapter.language_code}_{formality.value}_{template.id}"
+    return _INVALID_CUSTOM_ID_CHARS.sub("-", raw_id)[:64]
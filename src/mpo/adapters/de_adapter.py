@@ -6,11 +6,33 @@ Implements German-specific cultural norms and communication patterns.
 Supports hybrid adaptation: programmatic structure + LLM cultural refinement.
 """
 
-from typing import Optional
+from typing import Dict, Tuple
 
 from ..core.adapter import CulturalAdapter
-from ..core.prompt import PromptTemplate, FormalityLevel
-from ..providers.base import AbstractLLMProvider
+from ..core.prompt import PromptTemplate, PromptDomain, FormalityLevel
+
+
+# Static Phase 2 instructions (built once at import, shared by every call)
+_SYSTEM_PROMPT_DE = """You are a German cultural communication expert. Transform the provided text to match German cultural norms while preserving the existing structure.
+
+KEY GERMAN CULTURAL PRINCIPLES:
+- Directness (Sachlichkeit): Germans value clarity and precision. Be explicit and unambiguous.
+- Low-context communication: Provide necessary context but focus on facts over relationship-building.
+- Structured format: Clear opening → body → closing.
+- Formality: Use the pronoun form given in the context consistently throughout.
+- Efficiency: No unnecessary politeness padding or small talk.
+- Deductive reasoning: State the point first, then provide supporting details.
+
+TASK:
+1. Preserve the greeting and closing lines EXACTLY as written (already culturally adapted)
+2. Translate all English content to German
+3. Apply German directness and precision (Sachlichkeit) to the tone
+4. Maintain deductive argumentation pattern (point first, then evidence)
+5. Keep all {placeholder} variables unchanged in {curly braces}
+6. Use the pronoun form given in the context consistently
+7. Avoid excessive politeness - Germans prefer clarity over courtesy
+
+The context (domain, formality, pronoun) is given with each request."""
 
 
 class GermanAdapter(CulturalAdapter):
@@ -26,9 +48,14 @@ class GermanAdapter(CulturalAdapter):
     Supports hybrid mode: programmatic scaffolding + LLM refinement.
     """
 
-    def __init__(self, config: dict, provider: Optional[AbstractLLMProvider] = None):
-        """Initialize German adapter with optional LLM provider."""
-        super().__init__(config, provider)
+    LLM_SYSTEM_PROMPT = _SYSTEM_PROMPT_DE
+
+    # Context-setting line per formality level
+    _PREAMBLES: Dict[FormalityLevel, str] = {
+        FormalityLevel.FORMAL: "\nIch möchte Sie um Folgendes bitten:",
+        FormalityLevel.NEUTRAL: "\nIch bitte um Folgendes:",
+        FormalityLevel.CASUAL: "\nKurze Frage:"
+    }
 
     def _apply_programmatic_adaptations(self, template: PromptTemplate, formality: FormalityLevel) -> str:
         """
@@ -42,82 +69,57 @@ class GermanAdapter(CulturalAdapter):
         Returns:
             Partially adapted prompt with German structure
         """
-        content = template.content
+        prefix, suffix = self._scaffolds[formality]
+        return prefix + template.content + suffix
 
+    def _build_scaffold(self, formality: FormalityLevel) -> Tuple[str, str]:
+        """Build the German greeting/preamble prefix and closing suffix."""
         # Get German-specific formality markers
         greeting = self._get_greeting(formality)
         closing = self._get_closing(formality)
 
-        # German transformation strategy
-        adapted_parts = []
+        prefix_parts = []
 
         # 1. Add appropriate greeting
         if greeting:
-            adapted_parts.append(greeting)
+            prefix_parts.append(greeting)
 
         # 2. Add context-setting (Germans value clear structure)
-        if formality == FormalityLevel.FORMAL:
-            adapted_parts.append("\nIch möchte Sie um Folgendes bitten:")
-        elif formality == FormalityLevel.NEUTRAL:
-            adapted_parts.append("\nIch bitte um Folgendes:")
-        else:  # casual
-            adapted_parts.append("\nKurze Frage:")
+        prefix_parts.append(self._PREAMBLES[formality])
 
-        # 3. Add the main content (will be refined by LLM if enabled)
-        adapted_parts.append(f"\n{content}")
+        # 3. The main content goes here (will be refined by LLM if enabled)
+        prefix_parts.append("\n")
 
         # 4. Add appropriate closing
-        if closing:
-            adapted_parts.append(f"\n\n{closing}")
+        suffix = f"\n\n{closing}" if closing else ""
 
-        return "".join(adapted_parts)
+        return "".join(prefix_parts), suffix
 
-    def _build_llm_adaptation_prompt(
-        self,
-        programmatic_output: str,
-        template: PromptTemplate,
-        formality: FormalityLevel
-    ) -> str:
+    def _build_prompt_skeleton(
+        self, formality: FormalityLevel, domain: PromptDomain
+    ) -> Tuple[str, str]:
         """
-        Build German-specific LLM adaptation prompt (Phase 2).
+        Build German-specific LLM adaptation prompt skeleton (Phase 2).
 
         Instructs the LLM to refine the programmatic output with German
         cultural nuances while preserving the structure.
 
         Returns:
-            System + user prompt for LLM cultural refinement
+            Tuple of (head, tail) placed around the Phase 1 output
         """
         pronoun = self._get_pronoun(formality)
 
-        system_prompt = f"""You are a German cultural communication expert. Transform the provided text to match German cultural norms while preserving the existing structure.
-
-KEY GERMAN CULTURAL PRINCIPLES:
-- Directness (Sachlichkeit): Germans value clarity and precision. Be explicit and unambiguous.
-- Low-context communication: Provide necessary context but focus on facts over relationship-building.
-- Structured format: Clear opening → body → closing.
-- Formality: Use {pronoun} form consistently throughout.
-- Efficiency: No unnecessary politeness padding or small talk.
-- Deductive reasoning: State the point first, then provide supporting details.
-
-TASK:
-1. Preserve the greeting and closing lines EXACTLY as written (already culturally adapted)
-2. Translate all English content to German
-3. Apply German directness and precision (Sachlichkeit) to the tone
-4. Maintain deductive argumentation pattern (point first, then evidence)
-5. Keep all {{placeholder}} variables unchanged in {{curly braces}}
-6. Use {pronoun} form consistently
-7. Avoid excessive politeness - Germans prefer clarity over courtesy
-
-Context:
-- Domain: {template.domain.value}
+        head = f"""Context:
+- Domain: {domain.value}
 - Formality: {formality.value}
-- Pronoun: {pronoun}"""
+- Pronoun: {pronoun}
 
-        user_prompt = f"""Transform this partially adapted prompt to fully German-appropriate communication:
+Transform this partially adapted prompt to fully German-appropriate communication:
 
 INPUT (with German scaffolding):
-{programmatic_output}
+"""
+        tail = """
 
 OUTPUT (fully culturally adapted German with Sachlichkeit):"""
 
-        return system_prompt + "\n\n" + user_prompt
+        return head, tail
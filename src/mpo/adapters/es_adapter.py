@@ -4,11 +4,34 @@ Spanish cultural adapter.
 Implements Spanish (Latin American) cultural norms and communication patterns.
 """
 
-from typing import Optional
+from typing import Dict, Tuple
 
 from ..core.adapter import CulturalAdapter
-from ..core.prompt import PromptTemplate, FormalityLevel
-from ..providers.base import AbstractLLMProvider
+from ..core.prompt import PromptTemplate, PromptDomain, FormalityLevel
+
+
+# Static Phase 2 instructions (built once at import, shared by every call)
+_SYSTEM_PROMPT_ES = """You are a Latin American Spanish cultural communication expert. Transform the provided text to match Spanish-speaking cultural norms while preserving the existing structure.
+
+KEY LATIN AMERICAN SPANISH CULTURAL PRINCIPLES:
+- Relationship-first (confianza): Build personal connection before business transactions.
+- High-context communication: Provide relational preambles and context before requests.
+- Warmth (calidez): Even formal communication includes personal elements and well-being inquiries.
+- Indirect requests: Soften requests to show respect - avoid abruptness.
+- Gratitude (gratitud): Express thanks proactively and generously.
+- Collectivism: Emphasize team, community, and relational benefits.
+
+TASK:
+1. Preserve the greeting, relational preambles, and closing lines EXACTLY as written (already culturally adapted)
+2. Translate all English content to Spanish
+3. Apply Latin American warmth and relationship-building tone
+4. Maintain inductive argumentation pattern (context first, then point)
+5. Keep all {placeholder} variables unchanged in {curly braces}
+6. Use the pronoun form given in the context consistently
+7. Add softening phrases for requests (e.g., "si fuera posible", "agradecería mucho")
+8. Ensure language feels natural for Latin American audience (not Castilian Spanish)
+
+The context (domain, formality, pronoun, region) is given with each request."""
 
 
 class SpanishAdapter(CulturalAdapter):
@@ -22,95 +45,71 @@ class SpanishAdapter(CulturalAdapter):
     - Relational preambles in professional settings
     """
 
-    def __init__(self, config: dict, provider: Optional[AbstractLLMProvider] = None):
-        """Initialize Spanish adapter with optional LLM provider."""
-        super().__init__(config, provider)
+    LLM_SYSTEM_PROMPT = _SYSTEM_PROMPT_ES
+
+    # Relational preamble (Spanish values personal connection) and gracious
+    # closing line per formality level
+    _FORMALITY_BLOCKS: Dict[FormalityLevel, Tuple[str, str]] = {
+        FormalityLevel.FORMAL: (
+            "\n\nEspero que se encuentre bien.\nMe dirijo a usted para solicitar lo siguiente:",
+            "\n\nAgradezco de antemano su atención y tiempo."
+        ),
+        FormalityLevel.NEUTRAL: (
+            "\n\nEspero que esté bien.\nLe escribo para pedirle lo siguiente:",
+            "\n\nAgradezco de antemano su atención y tiempo."
+        ),
+        FormalityLevel.CASUAL: (
+            "\n\n¿Qué tal? Te escribo porque:",
+            ""
+        )
+    }
 
     def _apply_programmatic_adaptations(self, template: PromptTemplate, formality: FormalityLevel) -> str:
         """Apply Spanish (Latin American) programmatic adaptations (Phase 1)."""
-        content = template.content
+        prefix, suffix = self._scaffolds[formality]
+        return prefix + template.content + suffix
 
+    def _build_scaffold(self, formality: FormalityLevel) -> Tuple[str, str]:
+        """Build the Spanish greeting/preamble prefix and closing suffix."""
         # Get Spanish-specific formality markers
         greeting = self._get_greeting(formality)
         closing = self._get_closing(formality)
 
-        # Spanish transformation strategy
-        adapted_parts = []
-
-        # 1. Add warm greeting
-        if greeting:
-            adapted_parts.append(greeting)
-
-        # 2. Add relational preamble (Spanish values personal connection)
-        if formality == FormalityLevel.FORMAL:
-            adapted_parts.append("\n\nEspero que se encuentre bien.")
-            adapted_parts.append("\nMe dirijo a usted para solicitar lo siguiente:")
-        elif formality == FormalityLevel.NEUTRAL:
-            adapted_parts.append("\n\nEspero que esté bien.")
-            adapted_parts.append("\nLe escribo para pedirle lo siguiente:")
-        else:  # casual
-            adapted_parts.append("\n\n¿Qué tal? Te escribo porque:")
-
-        # 3. Add the main content (will be refined by LLM if enabled)
-        adapted_parts.append(f"\n{content}")
-
-        # 4. Add gracious closing with relational element
-        if formality in [FormalityLevel.FORMAL, FormalityLevel.NEUTRAL]:
-            adapted_parts.append("\n\nAgradezco de antemano su atención y tiempo.")
-
-        if closing:
-            adapted_parts.append(f"\n{closing}")
-
-        return "".join(adapted_parts)
-
-    def _build_llm_adaptation_prompt(
-        self,
-        programmatic_output: str,
-        template: PromptTemplate,
-        formality: FormalityLevel
-    ) -> str:
+        # Relational preamble and gratitude line for this formality level
+        preamble, gratitude = self._FORMALITY_BLOCKS[formality]
+
+        # Greeting + preamble, then the main content (refined by LLM if enabled)
+        prefix = greeting + preamble + "\n"
+        suffix = gratitude + ("\n" + closing if closing else "")
+
+        return prefix, suffix
+
+    def _build_prompt_skeleton(
+        self, formality: FormalityLevel, domain: PromptDomain
+    ) -> Tuple[str, str]:
         """
-        Build Spanish-specific LLM adaptation prompt (Phase 2).
+        Build Spanish-specific LLM adaptation prompt skeleton (Phase 2).
 
         Instructs the LLM to refine the programmatic output with Latin American
         Spanish cultural nuances while preserving the structure.
 
         Returns:
-            System + user prompt for LLM cultural refinement
+            Tuple of (head, tail) placed around the Phase 1 output
         """
         pronoun = self._get_pronoun(formality)
 
-        system_prompt = f"""You are a Latin American Spanish cultural communication expert. Transform the provided text to match Spanish-speaking cultural norms while preserving the existing structure.
-
-KEY LATIN AMERICAN SPANISH CULTURAL PRINCIPLES:
-- Relationship-first (confianza): Build personal connection before business transactions.
-- High-context communication: Provide relational preambles and context before requests.
-- Warmth (calidez): Even formal communication includes personal elements and well-being inquiries.
-- Indirect requests: Soften requests to show respect - avoid abruptness.
-- Gratitude (gratitud): Express thanks proactively and generously.
-- Collectivism: Emphasize team, community, and relational benefits.
-
-TASK:
-1. Preserve the greeting, relational preambles, and closing lines EXACTLY as written (already culturally adapted)
-2. Translate all English content to Spanish
-3. Apply Latin American warmth and relationship-building tone
-4. Maintain inductive argumentation pattern (context first, then point)
-5. Keep all {{placeholder}} variables unchanged in {{curly braces}}
-6. Use {pronoun} form consistently
-7. Add softening phrases for requests (e.g., "si fuera posible", "agradecería mucho")
-8. Ensure language feels natural for Latin American audience (not Castilian Spanish)
-
-Context:
-- Domain: {template.domain.value}
+        head = f"""Context:
+- Domain: {domain.value}
 - Formality: {formality.value}
 - Pronoun: {pronoun}
-- Region: Latin America (prioritize warmth over Iberian directness)"""
+- Region: Latin America (prioritize warmth over Iberian directness)
 
-        user_prompt = f"""Transform this partially adapted prompt to fully Latin American Spanish-appropriate communication:
+Transform this partially adapted prompt to fully Latin American Spanish-appropriate communication:
 
 INPUT (with Spanish scaffolding):
-{programmatic_output}
+"""
+        tail = """
 
 OUTPUT (fully culturally adapted Spanish with warmth and relationship focus):"""
 
-        return system_prompt + "\n\n" + user_prompt
+        return head, tail
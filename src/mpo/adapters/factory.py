@@ -4,26 +4,57 @@ Factory function for creating cultural adapters.
 Supports hybrid adaptation with optional LLM provider.
 """
 
-from typing import Dict, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING
+
+from ..constants import DEFAULT_MAX_CONCURRENCY
 from ..core.adapter import CulturalAdapter
+from ..core.prompt import PromptTemplate, PromptVariant, FormalityLevel
 from ..providers.base import AbstractLLMProvider
+from ..providers.rate_limit import AsyncRateLimiter
 from .en_adapter import EnglishAdapter
 from .de_adapter import GermanAdapter
 from .es_adapter import SpanishAdapter
 
+if TYPE_CHECKING:
+    from ..storage.cache_manager import CacheManager
+
+# Language code -> adapter class dispatch table
+_ADAPTERS: Dict[str, Type[CulturalAdapter]] = {
+    "en": EnglishAdapter,
+    "de": GermanAdapter,
+    "es": SpanishAdapter
+}
+
+# Adapters built by get_adapter(), keyed by language code and the identities
+# of config, provider and cache. Each adapter keeps references to those three
+# objects, so their ids cannot be recycled while the entry exists.
+_ADAPTER_CACHE_SIZE = 128
+_adapter_cache: "OrderedDict[Tuple[str, int, int, int], CulturalAdapter]" = OrderedDict()
+_adapter_cache_lock = threading.Lock()
+
 
 def get_adapter(
     language_code: str,
     config: Dict,
-    provider: Optional[AbstractLLMProvider] = None
+    provider: Optional[AbstractLLMProvider] = None,
+    cache: Optional["CacheManager"] = None
 ) -> CulturalAdapter:
     """
     Factory function to instantiate the appropriate cultural adapter.
 
+    Adapters are memoized per (language_code, config, provider, cache)
+    object identity, so evaluators sharing a language config share one
+    adapter instead of re-parsing it. A config dict edited in place is not
+    noticed; call clear_adapter_cache() after such changes.
+
     Args:
         language_code: ISO language code ('en', 'de', 'es')
         config: Language configuration dictionary
         provider: Optional LLM provider for hybrid adaptation
+        cache: Optional cache for deterministic (temperature 0) LLM refinements
 
     Returns:
         Appropriate CulturalAdapter subclass instance
@@ -31,14 +62,82 @@ def get_adapter(
     Raises:
         ValueError: If language code is not supported
     """
-    adapters = {
-        "en": EnglishAdapter,
-        "de": GermanAdapter,
-        "es": SpanishAdapter
-    }
+    key = (language_code, id(config), id(provider), id(cache))
+    with _adapter_cache_lock:
+        adapter = _adapter_cache.get(key)
+        if adapter is not None:
+            _adapter_cache.move_to_end(key)
+            return adapter
 
-    adapter_class = adapters.get(language_code)
+    adapter_class = _ADAPTERS.get(language_code)
     if not adapter_class:
         raise ValueError(f"Unsupported language code: {language_code}")
 
-    return adapter_class(config, provider)
+    adapter = adapter_class(config, provider, cache)
+    with _adapter_cache_lock:
+        adapter = _adapter_cache.setdefault(key, adapter)
+        if len(_adapter_cache) > _ADAPTER_CACHE_SIZE:
+            _adapter_cache.popitem(last=False)
+    return adapter
+
+
+def clear_adapter_cache() -> None:
+    """Drop all memoized adapters, e.g. after editing a language config in place."""
+    with _adapter_cache_lock:
+        _adapter_cache.clear()
+
+
+async def batch_adapt(
+    language_code: str,
+    templates: List[PromptTemplate],
+    formality: FormalityLevel,
+    config: Dict,
+    provider: Optional[AbstractLLMProvider] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache: Optional["CacheManager"] = None,
+    rpm: Optional[float] = None
+) -> List[Union[PromptVariant, BaseException]]:
+    """
+    Adapt many templates concurrently for one language and formality level.
+
+    A single adapter is shared by all templates; Phase 2 LLM calls are fanned
+    out with asyncio.gather and bounded by a semaphore so that at most
+    max_concurrency requests are in flight at once. With rpm set, adaptations
+    are also started no faster than rpm per minute, to stay under the
+    provider's rate limit instead of running into 429 errors.
+
+    Args:
+        language_code: ISO language code ('en', 'de', 'es')
+        templates: Prompt templates to adapt
+        formality: Desired formality level
+        config: Language configuration dictionary
+        provider: Optional LLM provider for hybrid adaptation
+        max_concurrency: Maximum number of concurrent adaptations
+        cache: Optional cache for deterministic (temperature 0) LLM refinements
+        rpm: Optional maximum number of adaptations started per minute
+
+    Returns:
+        One entry per template, in input order: the PromptVariant, or the
+        exception raised while adapting that template
+
+    Raises:
+        ValueError: If language code is not supported, max_concurrency < 1
+            or rpm is not positive
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    adapter = get_adapter(language_code, config, provider, cache)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = AsyncRateLimiter(rpm, 60.0) if rpm is not None else None
+
+    async def _adapt_one(template: PromptTemplate) -> PromptVariant:
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            return await adapter.adapt_async(template, formality)
+
+    return await asyncio.gather(
+        *(_adapt_one(template) for template in templates),
+        return_exceptions=True
+    )
@@ -5,23 +5,13 @@ Provides commands for prompt adaptation, evaluation, and reporting.
 """
 
 import click
-import yaml
 import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import Optional
-
-from ..core.prompt import PromptTemplate, PromptDomain, FormalityLevel
-from ..adapters import get_adapter
-from ..core.evaluator import PromptEvaluator
-from ..providers.anthropic_provider import AnthropicProvider, MockAnthropicProvider
-from ..providers.openai_provider import OpenAIProvider, MockOpenAIProvider
-from ..providers.local_provider import LocalLLMProvider
-from ..providers.base import GenerationConfig
-from ..storage.cache_manager import CacheManager
-from ..storage.experiment_tracker import ExperimentTracker, ExperimentConfig
-from ..metrics import quantitative, qualitative
+from typing import TYPE_CHECKING, Dict, Optional
+
 from ..constants import (
+    DEFAULT_MAX_CONCURRENCY,
     FORMALITY_LEVELS,
     SUPPORTED_LANGUAGES,
     CONFIG_DIR,
@@ -31,8 +21,53 @@ from ..constants import (
     EXPERIMENTS_DIR
 )
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from ..providers.base import GenerationConfig
+    from ..storage.cache_manager import CacheManager
+    from ..storage.experiment_tracker import ExperimentTracker
+
+# Heavy dependencies (provider SDKs, metrics, YAML) are imported inside the
+# commands that use them, so `mpo --help` and shell completion stay fast.
+
+
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load environment variables from .env (once per process)."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def _cache_manager() -> "CacheManager":
+    """Return the process-wide CacheManager."""
+    from ..storage.cache_manager import CacheManager
+    return CacheManager(str(CACHE_DIR))
+
+
+@lru_cache(maxsize=None)
+def _tracker() -> "ExperimentTracker":
+    """Return the process-wide ExperimentTracker."""
+    from ..storage.experiment_tracker import ExperimentTracker
+    return ExperimentTracker(str(EXPERIMENTS_DIR))
+
+
+def _generation_config(models_config: Dict, domain: str) -> "GenerationConfig":
+    """Build the GenerationConfig for a prompt domain from models.yaml."""
+    from ..providers.base import GenerationConfig
+
+    domain_config = models_config.get('generation_configs', {}).get(
+        domain,
+        models_config['generation_defaults']
+    )
+    # Filter out 'note' fields that aren't part of GenerationConfig
+    config_params = {k: v for k, v in domain_config.items() if k != 'note'}
+    return GenerationConfig(**config_params)
+
+
+@lru_cache(maxsize=64)
+def _read_template(path_str: str) -> str:
+    """Read a prompt template file (cached per path for the process)."""
+    return Path(path_str).read_text(encoding="utf-8")
 
 
 @click.group()
@@ -78,7 +113,7 @@ def init():
         click.echo("You can copy from .env.example if available")
 
     # Create cache manager to initialize cache structure
-    cache = CacheManager(str(CACHE_DIR))
+    cache = _cache_manager()
 
     click.echo(click.style("\n✅ Initialization complete!", fg="green"))
     click.echo("\nNext steps:")
@@ -106,16 +141,21 @@ def init():
 @click.option('--output', '-o', help='Output file path (optional)')
 def test(prompt_id: str, language: str, formality: str, provider: str, live: bool, output: Optional[str]):
     """Test a prompt with cultural adaptation."""
+    from ..config_loader import load_yaml
+    from ..core.prompt import PromptTemplate, PromptDomain, FormalityLevel
+    from ..adapters import get_adapter
+    from ..core.evaluator import PromptEvaluator
+    from ..providers.anthropic_provider import AnthropicProvider, MockAnthropicProvider
+    from ..providers.openai_provider import OpenAIProvider
+    from ..providers.local_provider import LocalLLMProvider
+    from ..metrics import quantitative, qualitative
 
-    # Load configurations
-    with open(CONFIG_DIR / "languages.yaml") as f:
-        lang_config = yaml.safe_load(f)
+    _load_env()
 
-    with open(CONFIG_DIR / "prompts.yaml") as f:
-        prompts_config = yaml.safe_load(f)
-
-    with open(CONFIG_DIR / "models.yaml") as f:
-        models_config = yaml.safe_load(f)
+    # Load configurations
+    lang_config = load_yaml(CONFIG_DIR / "languages.yaml")
+    prompts_config = load_yaml(CONFIG_DIR / "prompts.yaml")
+    models_config = load_yaml(CONFIG_DIR / "models.yaml")
 
     # Validate prompt ID
     if prompt_id not in prompts_config['prompts']:
@@ -131,8 +171,7 @@ def test(prompt_id: str, language: str, formality: str, provider: str, live: boo
         click.echo(click.style(f"❌ Template file not found: {template_file}", fg="red"))
         return
 
-    with open(template_file) as f:
-        prompt_content = f.read()
+    prompt_content = _read_template(str(template_file))
 
     template = PromptTemplate(
         id=prompt_id,
@@ -162,7 +201,7 @@ def test(prompt_id: str, language: str, formality: str, provider: str, live: boo
     click.echo(click.style(f"📋 Adaptation notes: {variant.adaptation_notes}", fg="blue"))
 
     # Get or generate response
-    cache = CacheManager(str(CACHE_DIR))
+    cache = _cache_manager()
 
     if not live:
         # Use cached response
@@ -211,14 +250,7 @@ def test(prompt_id: str, language: str, formality: str, provider: str, live: boo
             llm_provider = MockAnthropicProvider()
             click.echo(click.style("🎭 Using mock provider (test mode)", fg="yellow"))
 
-        domain_config = models_config.get('generation_configs', {}).get(
-            prompt_meta['domain'],
-            models_config['generation_defaults']
-        )
-
-        # Filter out 'note' fields that aren't part of GenerationConfig
-        config_params = {k: v for k, v in domain_config.items() if k != 'note'}
-        config = GenerationConfig(**config_params)
+        config = _generation_config(models_config, prompt_meta['domain'])
         evaluator = PromptEvaluator(llm_provider, lang_config['languages'])
 
         click.echo(click.style("\n🚀 Generating response...", fg="cyan"))
@@ -263,9 +295,8 @@ def test(prompt_id: str, language: str, formality: str, provider: str, live: boo
             }
         }
 
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        from ..storage.serialization import write_json
+        write_json(output_path, output_data, indent=True)
 
         click.echo(click.style(f"\n💾 Saved to: {output_path}", fg="green"))
 
@@ -274,13 +305,38 @@ def test(prompt_id: str, language: str, formality: str, provider: str, live: boo
 #   mpo benchmark                     # Run benchmark in demo mode (default, free)
 #   mpo benchmark --live              # Run benchmark with live API (costs ~$3-4)
 #   mpo benchmark --provider openai --live  # Use OpenAI instead of default
+#   mpo benchmark --live -c 16 --rpm 50     # 16 concurrent requests, at most 50/minute
+#   mpo benchmark --provider anthropic --live --batch  # Batch API (50% cheaper, slower)
+#   mpo benchmark --force             # Regenerate responses that are already cached
 @cli.command()
 @click.option('--provider', '-p', default='local',
               type=click.Choice(['anthropic', 'openai', 'local', 'mock']),
               help='LLM provider (anthropic=Claude, openai=GPT, local=LMStudio, mock=testing)')
 @click.option('--live', is_flag=True, help='Use live API (costs money!)')
-def benchmark(provider: str, live: bool):
+@click.option('--concurrency', '-c', default=DEFAULT_MAX_CONCURRENCY, show_default=True,
+              type=click.IntRange(min=1),
+              help='Maximum number of evaluations in flight at once')
+@click.option('--rpm', type=click.FloatRange(min=0, min_open=True),
+              help='Maximum number of evaluations started per minute (provider rate limit)')
+@click.option('--batch', is_flag=True,
+              help='Submit live anthropic/openai requests as Batch API jobs (cheaper, results may take hours)')
+@click.option('--force', is_flag=True,
+              help='Regenerate responses even if this provider already has them cached')
+def benchmark(provider: str, live: bool, concurrency: int, rpm: Optional[float], batch: bool,
+              force: bool):
     """Run full benchmark across all prompts, languages, and formality levels."""
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from ..config_loader import load_yaml
+    from ..core.prompt import PromptTemplate, PromptDomain, FormalityLevel
+    from ..core.evaluator import PromptEvaluator
+    from ..providers.anthropic_provider import AnthropicProvider, MockAnthropicProvider
+    from ..providers.openai_provider import OpenAIProvider
+    from ..providers.local_provider import LocalLLMProvider
+    from ..providers.rate_limit import AsyncRateLimiter
+    from ..storage.experiment_tracker import ExperimentConfig
+
+    _load_env()
 
     if live:
         click.echo(click.style("⚠️  WARNING: Live mode will make ~90 API calls", fg="yellow"))
@@ -289,14 +345,9 @@ def benchmark(provider: str, live: bool):
             return
 
     # Load configs
-    with open(CONFIG_DIR / "languages.yaml") as f:
-        lang_config = yaml.safe_load(f)
-
-    with open(CONFIG_DIR / "prompts.yaml") as f:
-        prompts_config = yaml.safe_load(f)
-
-    with open(CONFIG_DIR / "models.yaml") as f:
-        models_config = yaml.safe_load(f)
+    lang_config = load_yaml(CONFIG_DIR / "languages.yaml")
+    prompts_config = load_yaml(CONFIG_DIR / "prompts.yaml")
+    models_config = load_yaml(CONFIG_DIR / "models.yaml")
 
     # Initialize provider
     llm_provider = None
@@ -332,8 +383,8 @@ def benchmark(provider: str, live: bool):
         click.echo(click.style("🎭 Using mock provider (test mode)", fg="yellow"))
 
     evaluator = PromptEvaluator(llm_provider, lang_config['languages'])
-    cache = CacheManager(str(CACHE_DIR))
-    tracker = ExperimentTracker(str(EXPERIMENTS_DIR))
+    cache = _cache_manager()
+    tracker = _tracker()
 
     # Create experiment
     exp_config = ExperimentConfig(
@@ -344,6 +395,9 @@ def benchmark(provider: str, live: bool):
         demo_mode=not live
     )
 
+    # Build one adapter per language before the run instead of on first use
+    evaluator.warm_up(exp_config.languages)
+
     experiment = tracker.create_experiment(
         name=f"Benchmark {'(live)' if live else '(demo)'}",
         config=exp_config
@@ -355,58 +409,152 @@ def benchmark(provider: str, live: bool):
     click.echo(f"   Formality levels: {len(exp_config.formality_levels)}")
     click.echo(f"   Total evaluations: {len(exp_config.prompt_ids) * len(exp_config.languages) * len(exp_config.formality_levels)}\n")
 
-    # Run benchmark
-    results_count = 0
-
-    with click.progressbar(
-        prompts_config['prompts'].items(),
-        label='Processing prompts'
-    ) as prompts:
-        for prompt_id, prompt_meta in prompts:
-            # Load template
-            template_file = Path("prompts") / prompt_meta['file']
-            with open(template_file) as f:
-                prompt_content = f.read()
-
-            template = PromptTemplate(
-                id=prompt_id,
-                content=prompt_content,
-                domain=PromptDomain(prompt_meta['domain']),
-                placeholders=prompt_meta.get('placeholders', {})
-            )
+    # Resolve enum values once instead of once per evaluation
+    formality_enums = {f: FormalityLevel(f) for f in exp_config.formality_levels}
+    domain_enums = {
+        pid: PromptDomain(meta['domain']) for pid, meta in prompts_config['prompts'].items()
+    }
+    # Generation settings depend only on the domain, so build them once per domain
+    domain_configs = {
+        meta['domain']: _generation_config(models_config, meta['domain'])
+        for meta in prompts_config['prompts'].values()
+    }
+
+    # Build the evaluation jobs (independent of each other)
+    jobs = []
+    for prompt_id, prompt_meta in prompts_config['prompts'].items():
+        # Load template
+        template_file = Path("prompts") / prompt_meta['file']
+        prompt_content = _read_template(str(template_file))
+
+        template = PromptTemplate(
+            id=prompt_id,
+            content=prompt_content,
+            domain=domain_enums[prompt_id],
+            placeholders=prompt_meta.get('placeholders', {})
+        )
+        config = domain_configs[prompt_meta['domain']]
 
-            # Test each language and formality
-            for language in exp_config.languages:
-                for formality_str in exp_config.formality_levels:
-                    formality = FormalityLevel(formality_str)
+        # Test each language and formality
+        for language in exp_config.languages:
+            for formality_str in exp_config.formality_levels:
+                jobs.append((template, language, formality_str, config))
 
-                    # Adapt and evaluate
-                    variant = evaluator.adapt_prompt(template, language, formality)
+    results_count = 0
+    cache_read_tokens = 0
 
-                    domain_config = models_config.get('generation_configs', {}).get(
-                        prompt_meta['domain'],
-                        models_config['generation_defaults']
-                    )
-                    # Filter out 'note' fields that aren't part of GenerationConfig
-                    config_params = {k: v for k, v in domain_config.items() if k != 'note'}
-                    config = GenerationConfig(**config_params)
+    def _record(prompt_id, language, formality_str, variant, response, from_cache=False):
+        nonlocal results_count, cache_read_tokens
 
-                    response = evaluator.evaluate_variant(variant, config)
+        # Cache results
+        if not from_cache:
+            cache.cache_variant(variant)
+            cache.cache_response(response, prompt_id, language, formality_str)
 
-                    # Cache results
-                    cache.cache_variant(variant)
-                    cache.cache_response(response, prompt_id, language, formality_str)
+        # Track result
+        tracker.store_result(experiment.id, {
+            "prompt_id": prompt_id,
+            "language": language,
+            "formality": formality_str,
+            "variant": variant.to_dict(),
+            "response": response.to_dict()
+        })
+
+        results_count += 1
+        if not from_cache:
+            cache_read_tokens += response.metadata.get("cache_read_input_tokens", 0)
+
+    # Reuse responses this provider and model generated for the same adapted
+    # prompt in an earlier run (e.g. resuming after a crash or after adding a
+    # prompt); --force regenerates everything
+    reused_count = 0
+    if not force:
+        model_name = llm_provider.model_name or llm_provider.default_model
+        pending_jobs = []
+        for job in jobs:
+            template, language, formality_str, _ = job
+            existing = cache.get_cached_response(template.id, language, formality_str)
+            if (
+                existing is None
+                or existing.metadata.get("provider") != llm_provider.provider_name
+                or existing.model != model_name
+            ):
+                pending_jobs.append(job)
+                continue
+
+            # A changed template or adapter config gives a different prompt
+            variant = evaluator.adapt_prompt(template, language, formality_enums[formality_str])
+            cached_variant = cache.get_cached_variant(template.id, language, formality_str)
+            if cached_variant is None or cached_variant.adapted_content != variant.adapted_content:
+                pending_jobs.append(job)
+                continue
+
+            _record(template.id, language, formality_str, variant, existing, from_cache=True)
+            reused_count += 1
+        jobs = pending_jobs
+
+    async def _run_one(job, semaphore, limiter):
+        template, language, formality_str, config = job
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+
+            # Adapt and evaluate
+            variant = await evaluator.adapt_prompt_async(
+                template, language, formality_enums[formality_str]
+            )
+            response = await evaluator.evaluate_variant_async(variant, config)
+        return template.id, language, formality_str, variant, response
+
+    async def _run_all():
+        # Providers are sync and run in worker threads via asyncio.to_thread;
+        # size the pool to match so --concurrency isn't capped by the default
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mpo-eval")
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = AsyncRateLimiter(rpm, 60.0) if rpm is not None else None
+        tasks = [_run_one(job, semaphore, limiter) for job in jobs]
+
+        with click.progressbar(length=len(tasks), label='Running evaluations') as bar:
+            for next_result in asyncio.as_completed(tasks):
+                _record(*await next_result)
+                bar.update(1)
+
+    if jobs:
+        if batch and live and provider in ('anthropic', 'openai'):
+            # Offline batch jobs: adaptation refinements first, then evaluations
+            click.echo(click.style("📦 Submitting batch jobs (results may take up to 24h)...", fg="cyan"))
+            variants = evaluator.adapt_prompts_batch(
+                [(template, language, formality_enums[formality_str])
+                 for template, language, formality_str, _ in jobs]
+            )
+            responses = evaluator.evaluate_variants_batch(
+                [(variant, job[3]) for variant, job in zip(variants, jobs)]
+            )
 
-                    # Track result
-                    tracker.store_result(experiment.id, {
-                        "prompt_id": prompt_id,
-                        "language": language,
-                        "formality": formality_str,
-                        "variant": variant.to_dict(),
-                        "response": response.to_dict()
-                    })
+            failed = 0
+            with cache.bulk():
+                for job, variant, response in zip(jobs, variants, responses):
+                    if response is None:
+                        failed += 1
+                        continue
+                    template, language, formality_str, _ = job
+                    _record(template.id, language, formality_str, variant, response)
+
+            if failed:
+                click.echo(click.style(f"⚠️  {failed} batch requests failed and were skipped", fg="yellow"))
+        else:
+            if batch:
+                click.echo(click.style(
+                    "⚠️  --batch needs --live with anthropic or openai; running requests concurrently",
+                    fg="yellow"
+                ))
 
-                    results_count += 1
+            # Evaluations are I/O bound, so run them concurrently; cache metadata
+            # is journaled once at the end
+            with cache.bulk():
+                asyncio.run(_run_all())
 
     # Update experiment
     tracker.update_experiment(
@@ -414,14 +562,19 @@ def benchmark(provider: str, live: bool):
         status="completed",
         results_summary={
             "total_evaluations": results_count,
+            "cache_read_input_tokens": cache_read_tokens,
             "prompts": len(exp_config.prompt_ids),
             "languages": exp_config.languages,
             "formality_levels": exp_config.formality_levels
-        }
+        },
+        durable=True
     )
 
     click.echo(click.style(f"\n✅ Benchmark complete!", fg="green", bold=True))
     click.echo(f"   Results cached for demo mode")
+    click.echo(f"   ♻️  Cache hits: {reused_count} | 🔄 Generated: {results_count - reused_count}")
+    if live:
+        click.echo(f"   Prompt cache: {cache_read_tokens} input tokens read from cache")
     click.echo(f"   Experiment ID: {experiment.id}")
     click.echo(f"\nNext: mpo report {list(prompts_config['prompts'].keys())[0]}")
 
@@ -433,48 +586,49 @@ def benchmark(provider: str, live: bool):
 @click.argument('prompt_id')
 def report(prompt_id: str):
     """Generate comparison report for a prompt across languages."""
+    from ..config_loader import load_yaml
+    from ..metrics import get_response_metrics
 
     click.echo(f"📊 Generating report for: {click.style(prompt_id, fg='cyan', bold=True)}\n")
 
     # Load configs
-    with open(CONFIG_DIR / "prompts.yaml") as f:
-        prompts_config = yaml.safe_load(f)
+    prompts_config = load_yaml(CONFIG_DIR / "prompts.yaml")
 
     if prompt_id not in prompts_config['prompts']:
         click.echo(click.style(f"❌ Unknown prompt: {prompt_id}", fg="red"))
         return
 
-    cache = CacheManager(str(CACHE_DIR))
+    cache = _cache_manager()
     prompt_meta = prompts_config['prompts'][prompt_id]
 
     # Collect all cached responses
     languages = SUPPORTED_LANGUAGES[:3]  # Use first 3 languages (en, de, es)
 
-    click.echo("Language | Formality | Cached | Words | Cultural Score")
-    click.echo("-" * 60)
+    # Collect the table and write it in one go instead of one echo per row
+    rows = ["Language | Formality | Cached | Words | Cultural Score", "-" * 60]
 
     for lang in languages:
         for formal in FORMALITY_LEVELS:
             response = cache.get_cached_response(prompt_id, lang, formal)
 
             if response:
-                quant = quantitative.calculate_all_quantitative_metrics(
-                    response.content, response.tokens_output, lang
-                )
-                qual = qualitative.calculate_all_qualitative_metrics(
-                    response.content, lang, formal, prompt_meta['domain']
+                metrics = get_response_metrics(
+                    cache, response, prompt_id, lang, formal, prompt_meta['domain']
                 )
+                quant = metrics['quantitative']
+                qual = metrics['qualitative']
 
                 word_count = quant['length_metrics']['word_count']
                 cultural_score = qual['cultural_appropriateness']['overall_score']
 
-                click.echo(
+                rows.append(
                     f"{lang:8} | {formal:9} | ✅     | "
                     f"{word_count:5} | {cultural_score:.1f}/5.0"
                 )
             else:
-                click.echo(f"{lang:8} | {formal:9} | ❌     | -     | -")
+                rows.append(f"{lang:8} | {formal:9} | ❌     | -     | -")
 
+    click.echo("\n".join(rows))
     click.echo(f"\n💡 Tip: Run 'mpo benchmark' to generate all cached responses")
 
 
@@ -486,19 +640,19 @@ def report(prompt_id: str):
 @click.option('--output', '-o', help='Output file path (default: reports/{prompt_id}_report.html)')
 def html_report(prompt_id: str, output: Optional[str]):
     """Generate interactive HTML report with Plotly visualizations."""
+    from ..config_loader import load_yaml
     from ..reports import HTMLReportGenerator
 
     click.echo(f"📊 Generating HTML report for: {click.style(prompt_id, fg='cyan', bold=True)}\n")
 
     # Load configs
-    with open(CONFIG_DIR / "prompts.yaml") as f:
-        prompts_config = yaml.safe_load(f)
+    prompts_config = load_yaml(CONFIG_DIR / "prompts.yaml")
 
     if prompt_id not in prompts_config['prompts']:
         click.echo(click.style(f"❌ Unknown prompt: {prompt_id}", fg="red"))
         return
 
-    cache = CacheManager(str(CACHE_DIR))
+    cache = _cache_manager()
     generator = HTMLReportGenerator(cache)
 
     try:
@@ -521,9 +675,9 @@ def html_report(prompt_id: str, output: Optional[str]):
 @cli.command()
 def list_prompts():
     """List all available prompt templates."""
+    from ..config_loader import load_yaml
 
-    with open(CONFIG_DIR / "prompts.yaml") as f:
-        prompts_config = yaml.safe_load(f)
+    prompts_config = load_yaml(CONFIG_DIR / "prompts.yaml")
 
     click.echo(click.style("\n📝 Available Prompts:\n", fg="cyan", bold=True))
 
@@ -539,8 +693,7 @@ def list_prompts():
 @cli.command()
 def cache_status():
     """Show cache statistics."""
-
-    cache = CacheManager(str(CACHE_DIR))
+    cache = _cache_manager()
     stats = cache.list_cached_items()
     validation = cache.validate_cache()
 
@@ -0,0 +1,46 @@
+"""
+YAML configuration loading.
+
+Parses config files with libyaml's C loader when PyYAML was built with it
+(falling back to the pure-Python SafeLoader otherwise) and keeps each parsed
+file in memory, so repeated loads within one process are free.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def load_yaml(path: Union[str, Path]) -> Dict:
+    """
+    Load and parse a YAML config file, caching the result per path.
+
+    The returned dictionary is shared between callers and must be treated
+    as read-only; copy it before making changes.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    return _load_yaml_cached(Path(path))
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_cached(path: Path) -> Dict:
+    """Parse a YAML file (cached per path)."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs, e.g. after editing a config file."""
+    _load_yaml_cached.cache_clear()
@@ -7,7 +7,7 @@ including language codes, formality levels, system-wide defaults, and directory
 
 import os
 from pathlib import Path
-from typing import Dict, List, Final
+from typing import Dict, FrozenSet, List, Final
 
 # ==============================================================================
 # LANGUAGE CONSTANTS
@@ -16,6 +16,9 @@ from typing import Dict, List, Final
 # Supported language codes
 SUPPORTED_LANGUAGES: Final[List[str]] = ['en', 'de', 'es', 'fr']
 
+# Set view of SUPPORTED_LANGUAGES for membership checks
+SUPPORTED_LANGUAGES_SET: Final[FrozenSet[str]] = frozenset(SUPPORTED_LANGUAGES)
+
 # Language code to full name mapping
 LANGUAGE_NAMES: Final[Dict[str, str]] = {
     'en': 'English',
@@ -39,6 +42,9 @@ LANGUAGE_NATIVE_NAMES: Final[Dict[str, str]] = {
 # Supported formality levels (in order from casual to formal)
 FORMALITY_LEVELS: Final[List[str]] = ['casual', 'neutral', 'formal']
 
+# Set view of FORMALITY_LEVELS for membership checks
+FORMALITY_LEVELS_SET: Final[FrozenSet[str]] = frozenset(FORMALITY_LEVELS)
+
 # Formality level guidance for LLM generation
 FORMALITY_GUIDANCE: Final[Dict[str, str]] = {
     'formal': 'Use professional, business-appropriate language. Avoid excessive politeness.',
@@ -64,6 +70,26 @@ CHARS_PER_TOKEN_ESTIMATE: Final[int] = 4
 DEFAULT_MAX_TOKENS: Final[int] = 1000
 DEFAULT_TEMPERATURE: Final[float] = 0.7
 
+# Maximum number of in-flight LLM requests for concurrent batch workloads
+DEFAULT_MAX_CONCURRENCY: Final[int] = 8
+
+# Maximum number of Phase 2 refinements packed into one multi-item LLM call
+LLM_ADAPTATION_BATCH_SIZE: Final[int] = 5
+
+# Shared HTTP connection pool used by the provider SDK clients
+HTTP_MAX_CONNECTIONS: Final[int] = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 50
+HTTP_CONNECT_RETRIES: Final[int] = 2
+HTTP_TIMEOUT_SECONDS: Final[float] = 600.0
+HTTP_CONNECT_TIMEOUT_SECONDS: Final[float] = 5.0
+
+# SDK retries (exponential backoff with jitter) for rate limits, timeouts,
+# connection errors and 5xx responses of the hosted APIs
+API_MAX_RETRIES: Final[int] = 5
+
+# How long a local server's model listing is reused before probing again
+LOCAL_MODELS_PROBE_TTL_SECONDS: Final[float] = 5.0
+
 # ==============================================================================
 # DIRECTORY PATHS
 # ==============================================================================
@@ -84,8 +110,16 @@ EXPERIMENTS_DIR: Final[Path] = DATA_DIR / "experiments"
 # Cache directory name (deprecated - use CACHE_DIR instead)
 CACHE_DIR_NAME: Final[str] = 'cache'
 
-# Cache metadata filename
+# Cache metadata snapshot filename and its append-only journal (JSON Lines)
 CACHE_METADATA_FILE: Final[str] = 'cache_metadata.json'
+CACHE_METADATA_JOURNAL_FILE: Final[str] = 'cache_metadata.jsonl'
+
+# Maximum number of variants/responses kept in CacheManager's in-memory layer
+MEMORY_CACHE_MAX_ENTRIES: Final[int] = 1024
+
+# Journal lines after which appends fold the metadata journal into the
+# snapshot file (bulk() blocks compact on exit regardless)
+CACHE_JOURNAL_COMPACT_LINES: Final[int] = 1000
 
 # ==============================================================================
 # EXPERIMENT TRACKING
@@ -94,26 +128,34 @@ CACHE_METADATA_FILE: Final[str] = 'cache_metadata.json'
 # Experiments directory name
 EXPERIMENTS_DIR_NAME: Final[str] = 'experiments'
 
-# Experiment results filename pattern
-EXPERIMENT_RESULTS_FILE: Final[str] = 'results.json'
+# Per-experiment results log filename (JSON Lines, one result per line)
+EXPERIMENT_RESULTS_FILE: Final[str] = 'results.jsonl'
 
 # Experiment config filename
 EXPERIMENT_CONFIG_FILE: Final[str] = 'config.json'
 
+# Minimum time between two appends to the experiments index journal; index
+# events in between are queued in memory and appended together by the next flush
+EXPERIMENT_INDEX_FLUSH_INTERVAL_SECONDS: Final[float] = 1.0
+
+# Journal lines after which a flush folds the experiments index journal into
+# the index snapshot file
+EXPERIMENT_INDEX_COMPACT_LINES: Final[int] = 1000
+
 # ==============================================================================
 # EVALUATION METRICS
 # ==============================================================================
 
-# Sentiment keywords for basic sentiment analysis
-POSITIVE_SENTIMENT_KEYWORDS: Final[List[str]] = [
+# Sentiment keywords for basic sentiment analysis (sets for O(1) word lookup)
+POSITIVE_SENTIMENT_KEYWORDS: Final[FrozenSet[str]] = frozenset({
     'great', 'excellent', 'wonderful', 'fantastic', 'good',
     'happy', 'pleased', 'satisfied', 'delighted', 'glad'
-]
+})
 
-NEGATIVE_SENTIMENT_KEYWORDS: Final[List[str]] = [
+NEGATIVE_SENTIMENT_KEYWORDS: Final[FrozenSet[str]] = frozenset({
     'bad', 'poor', 'terrible', 'awful', 'horrible',
     'unhappy', 'disappointed', 'frustrated', 'angry', 'upset'
-]
+})
 
 # ==============================================================================
 # UTILITY FUNCTIONS
@@ -132,12 +174,13 @@ def get_language_name(language_code: str) -> str:
     Raises:
         ValueError: If language code is not supported
     """
-    if language_code not in LANGUAGE_NAMES:
+    try:
+        return LANGUAGE_NAMES[language_code]
+    except KeyError:
         raise ValueError(
             f"Unsupported language code: {language_code}. "
             f"Supported languages: {', '.join(SUPPORTED_LANGUAGES)}"
-        )
-    return LANGUAGE_NAMES[language_code]
+        ) from None
 
 
 def get_formality_guidance(formality_level: str) -> str:
@@ -153,12 +196,13 @@ def get_formality_guidance(formality_level: str) -> str:
     Raises:
         ValueError: If formality level is not supported
     """
-    if formality_level not in FORMALITY_GUIDANCE:
+    try:
+        return FORMALITY_GUIDANCE[formality_level]
+    except KeyError:
         raise ValueError(
             f"Unsupported formality level: {formality_level}. "
             f"Supported levels: {', '.join(FORMALITY_LEVELS)}"
-        )
-    return FORMALITY_GUIDANCE[formality_level]
+        ) from None
 
 
 def validate_language_code(language_code: str) -> bool:
@@ -171,7 +215,7 @@ def validate_language_code(language_code: str) -> bool:
     Returns:
         True if supported, False otherwise
     """
-    return language_code in SUPPORTED_LANGUAGES
+    return language_code in SUPPORTED_LANGUAGES_SET
 
 
 def validate_formality_level(formality_level: str) -> bool:
@@ -184,4 +228,4 @@ def validate_formality_level(formality_level: str) -> bool:
     Returns:
         True if supported, False otherwise
     """
-    return formality_level in FORMALITY_LEVELS
+    return formality_level in FORMALITY_LEVELS_SET
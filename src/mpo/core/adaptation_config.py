@@ -7,7 +7,7 @@ cultural adaptations.
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 
 class AdaptationStrategy(Enum):
@@ -18,7 +18,11 @@ class AdaptationStrategy(Enum):
     LLM_ONLY = "llm_only"                     # Full LLM transformation (experimental)
 
 
-@dataclass
+# Value -> member lookup table (a plain dict hit is much cheaper than Enum(value))
+_STRATEGY_BY_VALUE: Dict[str, AdaptationStrategy] = {m.value: m for m in AdaptationStrategy}
+
+
+@dataclass(slots=True)
 class LLMAdaptationConfig:
     """Configuration for LLM-based cultural adaptation."""
 
@@ -28,17 +32,25 @@ class LLMAdaptationConfig:
     llm_system_prompt: str
     temperature: float = 0.3  # Low for consistency
     max_tokens: int = 2048
+    semantic_cache: bool = False  # Reuse outputs of near-duplicate prompts
+    similarity_threshold: float = 0.92
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'LLMAdaptationConfig':
+    def from_dict(cls, data: Dict[str, Any]) -> Optional['LLMAdaptationConfig']:
         """
         Parse LLM adaptation configuration from YAML dictionary.
 
+        A disabled section is not parsed at all (its instructions and system
+        prompt can be large), so enabled configs are the only ones returned.
+
         Args:
             data: Dictionary from languages.yaml llm_adaptation section
 
         Returns:
-            LLMAdaptationConfig instance
+            LLMAdaptationConfig instance, or None if LLM adaptation is disabled
+
+        Raises:
+            ValueError: If the strategy is unknown
 
         Example:
             >>> config_dict = {
@@ -50,11 +62,21 @@ class LLMAdaptationConfig:
             ... }
             >>> config = LLMAdaptationConfig.from_dict(config_dict)
         """
+        if not data.get('enabled', False):
+            return None
+
+        strategy_value = data.get('strategy', 'hybrid_sequential')
+        strategy = _STRATEGY_BY_VALUE.get(strategy_value)
+        if strategy is None:
+            raise ValueError(f"Unknown adaptation strategy: {strategy_value}")
+
         return cls(
-            enabled=data.get('enabled', False),
-            strategy=AdaptationStrategy(data.get('strategy', 'hybrid_sequential')),
+            enabled=True,
+            strategy=strategy,
             transformation_instructions=data.get('transformation_instructions', {}),
             llm_system_prompt=data.get('llm_system_prompt', ''),
             temperature=data.get('temperature', 0.3),
-            max_tokens=data.get('max_tokens', 2048)
+            max_tokens=data.get('max_tokens', 2048),
+            semantic_cache=data.get('semantic_cache', False),
+            similarity_threshold=data.get('similarity_threshold', 0.92)
         )
@@ -8,16 +8,86 @@ Supports hybrid adaptation: programmatic (rule-based) + LLM-based refinement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+import json
 import logging
 
 from .prompt import PromptTemplate, PromptVariant, FormalityLevel, PromptDomain
 from .adaptation_config import AdaptationStrategy, LLMAdaptationConfig
+from .clock import utc_now_iso
+from ..constants import LLM_ADAPTATION_BATCH_SIZE
 from ..providers.base import AbstractLLMProvider, GenerationConfig
 
+if TYPE_CHECKING:
+    from ..storage.cache_manager import CacheManager
+
 logger = logging.getLogger(__name__)
 
+# Instructions prepended to a multi-item Phase 2 request (see adapt_batch)
+_PACKED_REQUEST_HEADER = """Handle each item below as a separate, independent request. Each item's "request" field is a complete task on its own.
+
+Return ONLY a JSON array with one object per item, in the same order, for example:
+[{"id": 0, "output": "<the output for item 0>"}]
+Do not add any commentary or code fences.
+
+Items:
+"""
+
+# Adaptation notes per mode, formatted with (language code, domain, formality)
+_PROGRAMMATIC_NOTE_TEMPLATE = (
+    "Programmatic-only adaptation (%s): "
+    "Rule-based cultural transformations. "
+    "Domain: %s, Formality: %s"
+)
+_ADAPTATION_NOTE_TEMPLATES: Dict[str, str] = {
+    "hybrid": (
+        "Hybrid adaptation (%s): "
+        "Programmatic structure + LLM cultural refinement. "
+        "Domain: %s, Formality: %s"
+    ),
+    "programmatic_fallback": (
+        "Programmatic-only adaptation (%s): "
+        "LLM refinement failed, using rule-based only. "
+        "Domain: %s, Formality: %s"
+    ),
+    "programmatic": _PROGRAMMATIC_NOTE_TEMPLATE,
+}
+
+
+def _parse_packed_reply(content: str) -> Dict[int, str]:
+    """
+    Extract {id: output} pairs from a packed Phase 2 reply.
+
+    Tolerates text around the JSON array (e.g. code fences); malformed
+    replies or entries are skipped rather than raised.
+    """
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        entries = json.loads(content[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(entries, list):
+        return {}
+
+    outputs = {}
+    for entry in entries:
+        if (
+            isinstance(entry, dict) and
+            isinstance(entry.get("id"), int) and
+            isinstance(entry.get("output"), str)
+        ):
+            outputs[entry["id"]] = entry["output"]
+    return outputs
+
+
+class FormalityMarkers(NamedTuple):
+    """Culturally-appropriate markers for one formality level."""
+    greeting: str
+    closing: str
+    pronoun: str
+
 
 class CulturalAdapter(ABC):
     """
@@ -29,27 +99,84 @@ class CulturalAdapter(ABC):
     - Structural conventions (greetings, closings, transitions)
     """
 
-    def __init__(self, config: Dict, provider: Optional[AbstractLLMProvider] = None):
+    # Static Phase 2 instructions, identical for every call so that providers
+    # can serve them from their prompt cache (set by subclasses)
+    LLM_SYSTEM_PROMPT: str = ""
+
+    def __init__(
+        self,
+        config: Dict,
+        provider: Optional[AbstractLLMProvider] = None,
+        cache: Optional["CacheManager"] = None
+    ):
         """
         Initialize adapter with language-specific configuration.
 
         Args:
             config: Cultural parameters from languages.yaml
             provider: Optional LLM provider for hybrid adaptation
+            cache: Optional cache for deterministic (temperature 0) LLM refinements
         """
         self.config = config
         self.language_code = config.get("code", "unknown")
         self.language_name = config.get("name", "Unknown")
         self._provider = provider
+        self._cache = cache
 
         # Parse LLM adaptation configuration
-        llm_config_data = config.get('llm_adaptation', {})
-        self.llm_adaptation_config = (
-            LLMAdaptationConfig.from_dict(llm_config_data)
-            if llm_config_data.get('enabled', False)
-            else None
+        self.llm_adaptation_config = LLMAdaptationConfig.from_dict(config.get('llm_adaptation', {}))
+
+        # Both are fixed for the adapter's lifetime; resolve them once rather
+        # than on every adapt() call
+        self._use_llm = bool(
+            self.llm_adaptation_config is not None and
+            self.llm_adaptation_config.enabled and
+            provider is not None
+        )
+        self._strategy_name = (
+            self.llm_adaptation_config.strategy.value
+            if self.llm_adaptation_config is not None
+            else AdaptationStrategy.PROGRAMMATIC_ONLY.value
         )
 
+        # Formality markers are fixed per (language, formality): resolve them once
+        formality_params = config.get("cultural_params", {}).get("formality_levels", {})
+        self._formality_markers: Dict[FormalityLevel, FormalityMarkers] = {}
+        for formality in FormalityLevel:
+            params = formality_params.get(formality.value, {})
+            self._formality_markers[formality] = FormalityMarkers(
+                greeting=params.get("greeting", ""),
+                closing=params.get("closing", ""),
+                pronoun=params.get("pronoun", "")
+            )
+
+        # Phase 1 scaffolding depends only on formality, so build it once
+        self._scaffolds: Dict[FormalityLevel, Tuple[str, str]] = {
+            formality: self._build_scaffold(formality) for formality in FormalityLevel
+        }
+
+        # Phase 2 user prompt text around the Phase 1 output depends only on
+        # (formality, domain), so build those skeletons once as well
+        self._prompt_skeletons: Dict[Tuple[FormalityLevel, PromptDomain], Tuple[str, str]] = {
+            (formality, domain): self._build_prompt_skeleton(formality, domain)
+            for formality in FormalityLevel
+            for domain in PromptDomain
+        }
+
+        # Optional similarity cache for near-duplicate Phase 2 prompts
+        self._semantic_cache = None
+        if (
+            cache is not None and
+            provider is not None and
+            self.llm_adaptation_config is not None and
+            self.llm_adaptation_config.semantic_cache
+        ):
+            self._semantic_cache = cache.get_semantic_cache(
+                f"{self.language_code}_{provider.provider_name}",
+                provider.get_embeddings,
+                self.llm_adaptation_config.similarity_threshold
+            )
+
     def adapt(self, template: PromptTemplate, formality: FormalityLevel) -> PromptVariant:
         """
         Apply cultural transformations to a prompt template.
@@ -69,78 +196,384 @@ class CulturalAdapter(ABC):
         programmatic_output = self._apply_programmatic_adaptations(template, formality)
 
         # Phase 2: Apply LLM refinement if configured and available
-        if self._should_use_llm_adaptation():
+        if self._use_llm:
             try:
                 final_output = self._apply_llm_adaptation(
                     programmatic_output, template, formality
                 )
-                adaptation_notes = self._build_adaptation_notes(
-                    "hybrid", template, formality
-                )
+                mode = "hybrid"
                 logger.info(f"Successfully applied hybrid adaptation for {self.language_code}")
             except Exception as e:
                 # Fallback to programmatic if LLM fails
-                logger.warning(
-                    f"LLM adaptation failed for {self.language_code}: {e}. "
-                    f"Falling back to programmatic only."
-                )
+                self._log_llm_fallback(e)
                 final_output = programmatic_output
-                adaptation_notes = self._build_adaptation_notes(
-                    "programmatic_fallback", template, formality
+                mode = "programmatic_fallback"
+        else:
+            final_output = programmatic_output
+            mode = "programmatic"
+
+        return self._build_variant(template, formality, final_output, mode)
+
+    def adapt_many(
+        self, templates: List[PromptTemplate], formality: FormalityLevel
+    ) -> List[PromptVariant]:
+        """
+        Adapt several templates to the same formality level.
+
+        When no LLM refinement is involved, everything except the template
+        content itself (scaffold, strategy name, timestamp) is resolved once
+        for the whole batch. Hybrid adapters fall back to adapt() per template;
+        use the factory's batch_adapt() to run those refinements concurrently.
+
+        Args:
+            templates: Base prompt templates to adapt
+            formality: Desired formality level
+
+        Returns:
+            One PromptVariant per template, in input order
+        """
+        if self._use_llm:
+            return [self.adapt(template, formality) for template in templates]
+
+        strategy = self._strategy_name
+        timestamp = utc_now_iso()
+        apply_programmatic = self._apply_programmatic_adaptations
+        build_notes = self._build_adaptation_notes
+
+        return [
+            PromptVariant(
+                template_id=template.id,
+                language=self.language_code,
+                formality=formality,
+                adapted_content=apply_programmatic(template, formality),
+                adaptation_notes=build_notes("programmatic", template, formality),
+                timestamp=timestamp,
+                metadata={"strategy": strategy}
+            )
+            for template in templates
+        ]
+
+    def adapt_batch(
+        self,
+        items: List[Tuple[PromptTemplate, FormalityLevel]],
+        batch_size: int = LLM_ADAPTATION_BATCH_SIZE
+    ) -> List[PromptVariant]:
+        """
+        Adapt several (template, formality) items, packing Phase 2 calls together.
+
+        Up to batch_size uncached refinements are sent as one multi-item
+        prompt (a JSON list in, a JSON list out), which amortizes the system
+        prompt and per-request overhead. Items whose output is missing or
+        unparseable in the batched reply are refined individually, as in
+        adapt(). Without LLM refinement this is equivalent to calling adapt()
+        per item.
+
+        Args:
+            items: (template, formality) pairs to adapt
+            batch_size: Maximum number of refinements per LLM call
+
+        Returns:
+            One PromptVariant per item, in input order
+        """
+        if not self._use_llm:
+            return [self.adapt(template, formality) for template, formality in items]
+
+        config = self._get_llm_generation_config()
+        programmatic_outputs = []
+        llm_prompts = []
+        outputs: Dict[int, str] = {}
+        for index, (template, formality) in enumerate(items):
+            programmatic_output = self._apply_programmatic_adaptations(template, formality)
+            llm_prompt = self._build_llm_adaptation_prompt(programmatic_output, template, formality)
+            programmatic_outputs.append(programmatic_output)
+            llm_prompts.append(llm_prompt)
+
+            cached = self._lookup_cached_refinement(llm_prompt, config)
+            if cached is not None:
+                outputs[index] = cached
+
+        pending = [index for index in range(len(items)) if index not in outputs]
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            if len(chunk) > 1:
+                try:
+                    outputs.update(self._refine_packed(chunk, llm_prompts, config))
+                except Exception as e:
+                    logger.warning(
+                        f"Packed LLM adaptation failed for {self.language_code}, "
+                        f"refining items individually: {e}"
+                    )
+
+        variants = []
+        for index, (template, formality) in enumerate(items):
+            if index in outputs:
+                variants.append(self._build_variant(template, formality, outputs[index], "hybrid"))
+                continue
+
+            # Not covered by a packed reply: refine on its own, like adapt()
+            try:
+                final_output = self._apply_llm_adaptation(
+                    programmatic_outputs[index], template, formality
+                )
+                mode = "hybrid"
+            except Exception as e:
+                self._log_llm_fallback(e)
+                final_output = programmatic_outputs[index]
+                mode = "programmatic_fallback"
+            variants.append(self._build_variant(template, formality, final_output, mode))
+
+        return variants
+
+    def _refine_packed(
+        self,
+        indices: List[int],
+        llm_prompts: List[str],
+        config: GenerationConfig
+    ) -> Dict[int, str]:
+        """
+        Run several Phase 2 prompts in one LLM call.
+
+        Returns:
+            Mapping of item index to refined output for every item the reply
+            covered (items missing from the reply are omitted)
+
+        Raises:
+            Exception: If the LLM call fails
+        """
+        payload = json.dumps(
+            [{"id": index, "request": llm_prompts[index]} for index in indices],
+            ensure_ascii=False,
+            indent=1
+        )
+        packed_config = GenerationConfig(
+            temperature=config.temperature,
+            max_tokens=config.max_tokens * len(indices)
+        )
+
+        logger.debug(f"Calling LLM for {len(indices)} packed {self.language_code} adaptations")
+        result = self._provider.generate(
+            _PACKED_REQUEST_HEADER + payload, packed_config, self.LLM_SYSTEM_PROMPT
+        )
+
+        outputs = {}
+        for index, content in _parse_packed_reply(result["content"]).items():
+            if index in indices:
+                content = content.strip()
+                outputs[index] = content
+                self._store_refinement(llm_prompts[index], config, content)
+        return outputs
+
+    async def adapt_async(
+        self, template: PromptTemplate, formality: FormalityLevel
+    ) -> PromptVariant:
+        """
+        Asynchronous counterpart of adapt().
+
+        Phase 1 runs inline (it is pure CPU work); Phase 2 awaits the
+        provider's agenerate(), so many adaptations can share one event loop
+        instead of serializing their LLM round-trips.
+
+        Args:
+            template: Base prompt template to adapt
+            formality: Desired formality level
+
+        Returns:
+            PromptVariant with culturally-appropriate modifications
+        """
+        programmatic_output = self._apply_programmatic_adaptations(template, formality)
+
+        if self._use_llm:
+            try:
+                final_output = await self._apply_llm_adaptation_async(
+                    programmatic_output, template, formality
                 )
+                mode = "hybrid"
+                logger.info(f"Successfully applied hybrid adaptation for {self.language_code}")
+            except Exception as e:
+                self._log_llm_fallback(e)
+                final_output = programmatic_output
+                mode = "programmatic_fallback"
         else:
             final_output = programmatic_output
-            adaptation_notes = self._build_adaptation_notes(
-                "programmatic", template, formality
+            mode = "programmatic"
+
+        return self._build_variant(template, formality, final_output, mode)
+
+    async def adapt_stream(
+        self, template: PromptTemplate, formality: FormalityLevel
+    ) -> AsyncIterator[str]:
+        """
+        Adapt a template and yield the final content as it is generated.
+
+        Opt-in alternative to adapt_async() for interactive callers: the
+        Phase 2 refinement is streamed from the provider, so output appears
+        at time-to-first-token. Without LLM refinement (or on a cache hit)
+        the whole content is yielded as one chunk. If the provider fails
+        before producing any text, the programmatic output is yielded instead.
+
+        Args:
+            template: Base prompt template to adapt
+            formality: Desired formality level
+
+        Yields:
+            Pieces of the adapted content, in order
+        """
+        programmatic_output = self._apply_programmatic_adaptations(template, formality)
+
+        if not self._use_llm:
+            yield programmatic_output
+            return
+
+        llm_prompt = self._build_llm_adaptation_prompt(
+            programmatic_output, template, formality
+        )
+        config = self._get_llm_generation_config()
+
+        cached = self._lookup_cached_refinement(llm_prompt, config)
+        if cached is not None:
+            yield cached
+            return
+
+        parts = []
+        try:
+            async for chunk in self._provider.astream(llm_prompt, config, self.LLM_SYSTEM_PROMPT):
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            if parts:
+                # Part of the refinement was already emitted; cannot fall back
+                raise
+            self._log_llm_fallback(e)
+            yield programmatic_output
+            return
+
+        self._store_refinement(llm_prompt, config, "".join(parts).strip())
+
+    def prepare_refinement(
+        self, template: PromptTemplate, formality: FormalityLevel
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Run Phase 1 and build the Phase 2 prompt without calling the provider.
+
+        Used for out-of-band refinement (e.g. provider Batch APIs), where the
+        LLM call happens long after the prompt is built.
+
+        Args:
+            template: Base prompt template to adapt
+            formality: Desired formality level
+
+        Returns:
+            Tuple of (programmatic_output, llm_prompt). llm_prompt is None
+            when LLM refinement is not enabled for this language; it is sent
+            together with LLM_SYSTEM_PROMPT as the system prompt.
+        """
+        programmatic_output = self._apply_programmatic_adaptations(template, formality)
+        if self.llm_adaptation_config is None or not self.llm_adaptation_config.enabled:
+            return programmatic_output, None
+
+        llm_prompt = self._build_llm_adaptation_prompt(programmatic_output, template, formality)
+        return programmatic_output, llm_prompt
+
+    def finalize_refinement(
+        self,
+        template: PromptTemplate,
+        formality: FormalityLevel,
+        programmatic_output: str,
+        llm_prompt: Optional[str],
+        llm_output: Optional[str]
+    ) -> PromptVariant:
+        """
+        Build the PromptVariant for a refinement prepared with prepare_refinement().
+
+        Args:
+            template: Base prompt template that was adapted
+            formality: Desired formality level
+            programmatic_output: Phase 1 output from prepare_refinement()
+            llm_prompt: Phase 2 prompt from prepare_refinement() (None if disabled)
+            llm_output: Raw LLM output, or None if the refinement failed
+
+        Returns:
+            PromptVariant using the refined output, or the programmatic output
+            when refinement was disabled or failed
+        """
+        if llm_prompt is None:
+            return self._build_variant(template, formality, programmatic_output, "programmatic")
+        if llm_output is None:
+            return self._build_variant(
+                template, formality, programmatic_output, "programmatic_fallback"
             )
+        return self._build_variant(template, formality, llm_output.strip(), "hybrid")
+
+    def get_llm_generation_config(self) -> Optional[GenerationConfig]:
+        """
+        Get the generation config used for Phase 2 refinement.
+
+        Returns:
+            GenerationConfig, or None when LLM refinement is not configured
+        """
+        if self.llm_adaptation_config is None:
+            return None
+        return self._get_llm_generation_config()
 
+    def _build_variant(
+        self,
+        template: PromptTemplate,
+        formality: FormalityLevel,
+        final_output: str,
+        mode: str
+    ) -> PromptVariant:
+        """Assemble the PromptVariant returned by adapt() and adapt_async()."""
         return PromptVariant(
             template_id=template.id,
             language=self.language_code,
             formality=formality,
             adapted_content=final_output,
-            adaptation_notes=adaptation_notes,
-            timestamp=datetime.now().isoformat(),
-            metadata={"strategy": self._get_strategy_name()}
+            adaptation_notes=self._build_adaptation_notes(mode, template, formality),
+            timestamp=utc_now_iso(),
+            metadata={"strategy": self._strategy_name}
+        )
+
+    def _log_llm_fallback(self, error: Exception) -> None:
+        """Log a failed LLM refinement before falling back to programmatic output."""
+        logger.warning(
+            f"LLM adaptation failed for {self.language_code}: {error}. "
+            f"Falling back to programmatic only."
         )
 
     def _build_adaptation_notes(
         self, mode: str, template: PromptTemplate, formality: FormalityLevel
     ) -> str:
         """Build adaptation notes describing what was done."""
-        if mode == "hybrid":
-            return (
-                f"Hybrid adaptation ({self.language_code}): "
-                f"Programmatic structure + LLM cultural refinement. "
-                f"Domain: {template.domain.value}, Formality: {formality.value}"
-            )
-        elif mode == "programmatic_fallback":
-            return (
-                f"Programmatic-only adaptation ({self.language_code}): "
-                f"LLM refinement failed, using rule-based only. "
-                f"Domain: {template.domain.value}, Formality: {formality.value}"
-            )
-        else:  # programmatic
-            return (
-                f"Programmatic-only adaptation ({self.language_code}): "
-                f"Rule-based cultural transformations. "
-                f"Domain: {template.domain.value}, Formality: {formality.value}"
-            )
+        note_template = _ADAPTATION_NOTE_TEMPLATES.get(mode, _PROGRAMMATIC_NOTE_TEMPLATE)
+        return note_template % (self.language_code, template.domain.value, formality.value)
 
     def _get_greeting(self, formality: FormalityLevel) -> str:
         """Get culturally-appropriate greeting for formality level."""
-        formality_params = self.config.get("cultural_params", {}).get("formality_levels", {})
-        return formality_params.get(formality.value, {}).get("greeting", "")
+        return self._formality_markers[formality].greeting
 
     def _get_closing(self, formality: FormalityLevel) -> str:
         """Get culturally-appropriate closing for formality level."""
-        formality_params = self.config.get("cultural_params", {}).get("formality_levels", {})
-        return formality_params.get(formality.value, {}).get("closing", "")
+        return self._formality_markers[formality].closing
 
     def _get_pronoun(self, formality: FormalityLevel) -> str:
         """Get appropriate pronoun (e.g., Sie/du in German) for formality level."""
-        formality_params = self.config.get("cultural_params", {}).get("formality_levels", {})
-        return formality_params.get(formality.value, {}).get("pronoun", "")
+        return self._formality_markers[formality].pronoun
+
+    def _build_scaffold(self, formality: FormalityLevel) -> Tuple[str, str]:
+        """
+        Build the fixed text placed around template content in Phase 1.
+
+        Called once per formality level at construction time. Adapters whose
+        Phase 1 output is "prefix + content + suffix" override this and look
+        the pair up in self._scaffolds instead of rebuilding it per call.
+
+        Args:
+            formality: Formality level to build the scaffold for
+
+        Returns:
+            Tuple of (prefix, suffix) strings
+        """
+        return "", ""
 
     def _should_use_llm_adaptation(self) -> bool:
         """
@@ -149,17 +582,11 @@ class CulturalAdapter(ABC):
         Returns:
             True if LLM adaptation is configured, enabled, and provider is available
         """
-        return (
-            self.llm_adaptation_config is not None and
-            self.llm_adaptation_config.enabled and
-            self._provider is not None
-        )
+        return self._use_llm
 
     def _get_strategy_name(self) -> str:
         """Get the current adaptation strategy name."""
-        if self.llm_adaptation_config:
-            return self.llm_adaptation_config.strategy.value
-        return AdaptationStrategy.PROGRAMMATIC_ONLY.value
+        return self._strategy_name
 
     @abstractmethod
     def _apply_programmatic_adaptations(
@@ -214,17 +641,113 @@ class CulturalAdapter(ABC):
         llm_prompt = self._build_llm_adaptation_prompt(
             programmatic_output, template, formality
         )
+        config = self._get_llm_generation_config()
+
+        cached = self._lookup_cached_refinement(llm_prompt, config)
+        if cached is not None:
+            return cached
+
+        logger.debug(f"Calling LLM for {self.language_code} adaptation with temperature={config.temperature}")
+        result = self._provider.generate(llm_prompt, config, self.LLM_SYSTEM_PROMPT)
+        content = result['content'].strip()
+
+        self._store_refinement(llm_prompt, config, content)
+        return content
+
+    async def _apply_llm_adaptation_async(
+        self,
+        programmatic_output: str,
+        template: PromptTemplate,
+        formality: FormalityLevel
+    ) -> str:
+        """
+        Asynchronous counterpart of _apply_llm_adaptation().
+
+        Raises:
+            Exception: If LLM call fails (caller should catch and fallback)
+        """
+        llm_prompt = self._build_llm_adaptation_prompt(
+            programmatic_output, template, formality
+        )
+        config = self._get_llm_generation_config()
+
+        cached = self._lookup_cached_refinement(llm_prompt, config)
+        if cached is not None:
+            return cached
+
+        logger.debug(f"Calling LLM (async) for {self.language_code} adaptation with temperature={config.temperature}")
+        result = await self._provider.agenerate(llm_prompt, config, self.LLM_SYSTEM_PROMPT)
+        content = result['content'].strip()
+
+        self._store_refinement(llm_prompt, config, content)
+        return content
+
+    def _lookup_cached_refinement(
+        self, llm_prompt: str, config: GenerationConfig
+    ) -> Optional[str]:
+        """Return a cached Phase 2 output (exact, then semantic match), or None."""
+        cache_key = self._get_llm_cache_key(llm_prompt, config)
+        if cache_key is not None:
+            cached = self._cache.get_llm_output(cache_key)
+            if cached is not None:
+                return cached
+
+        if self._semantic_cache is not None:
+            try:
+                return self._semantic_cache.lookup(llm_prompt, self._semantic_scope(config))
+            except Exception as e:
+                self._disable_semantic_cache(e)
+        return None
+
+    def _store_refinement(self, llm_prompt: str, config: GenerationConfig, content: str) -> None:
+        """Record a fresh Phase 2 output in the configured caches."""
+        cache_key = self._get_llm_cache_key(llm_prompt, config)
+        if cache_key is not None:
+            self._cache.cache_llm_output(cache_key, content)
 
-        config = GenerationConfig(
+        if self._semantic_cache is not None:
+            try:
+                self._semantic_cache.add(llm_prompt, content, self._semantic_scope(config))
+            except Exception as e:
+                self._disable_semantic_cache(e)
+
+    def _semantic_scope(self, config: GenerationConfig) -> str:
+        """Semantic cache scope: outputs are only reused for the same model and settings."""
+        model = self._provider.model_name or self._provider.default_model
+        return f"{model}|{config.temperature}|{config.max_tokens}"
+
+    def _disable_semantic_cache(self, error: Exception) -> None:
+        """Turn off semantic caching, e.g. when the provider has no embeddings API."""
+        logger.warning(
+            f"Semantic cache disabled for {self.language_code}: {error}"
+        )
+        self._semantic_cache = None
+
+    def _get_llm_cache_key(self, llm_prompt: str, config: GenerationConfig) -> Optional[str]:
+        """
+        Get the cache key for a Phase 2 call, or None if it must not be cached.
+
+        Only deterministic calls (temperature 0) are cached; sampled outputs
+        are expected to vary between calls.
+        """
+        if self._cache is None or config.temperature > 0:
+            return None
+        return self._cache.make_llm_cache_key(
+            self._provider.model_name or self._provider.default_model,
+            llm_prompt,
+            config.temperature,
+            system=self.LLM_SYSTEM_PROMPT,
+            max_tokens=config.max_tokens,
+            language=self.language_code
+        )
+
+    def _get_llm_generation_config(self) -> GenerationConfig:
+        """Build the generation config used for Phase 2 refinement."""
+        return GenerationConfig(
             temperature=self.llm_adaptation_config.temperature,
             max_tokens=self.llm_adaptation_config.max_tokens
         )
 
-        logger.debug(f"Calling LLM for {self.language_code} adaptation with temperature={config.temperature}")
-        result = self._provider.generate(llm_prompt, config)
-        return result['content'].strip()
-
-    @abstractmethod
     def _build_llm_adaptation_prompt(
         self,
         programmatic_output: str,
@@ -234,8 +757,8 @@ class CulturalAdapter(ABC):
         """
         Build prompt for LLM cultural refinement.
 
-        Constructs a meta-prompt that instructs the LLM how to refine the
-        programmatic adaptation with language-specific cultural nuances.
+        Wraps the Phase 1 output in the precomputed skeleton for the
+        template's (formality, domain) pair; see _build_prompt_skeleton().
 
         Args:
             programmatic_output: Output from Phase 1
@@ -243,7 +766,29 @@ class CulturalAdapter(ABC):
             formality: Desired formality level
 
         Returns:
-            LLM instruction prompt (system + user prompt)
+            User prompt carrying the per-call context (domain, formality,
+            pronoun) and the Phase 1 output. The static instructions live in
+            LLM_SYSTEM_PROMPT and are sent as the system prompt.
+        """
+        head, tail = self._prompt_skeletons[(formality, template.domain)]
+        return "".join((head, programmatic_output, tail))
+
+    @abstractmethod
+    def _build_prompt_skeleton(
+        self, formality: FormalityLevel, domain: PromptDomain
+    ) -> Tuple[str, str]:
+        """
+        Build the Phase 2 user prompt text placed around the Phase 1 output.
+
+        Called once per (formality, domain) pair at construction time.
+
+        Args:
+            formality: Formality level to build the skeleton for
+            domain: Prompt domain to build the skeleton for
+
+        Returns:
+            Tuple of (head, tail) strings with language-specific context
+            and instructions
 
         Note:
             To be implemented by subclasses with language-specific instructions.
@@ -0,0 +1,49 @@
+"""
+Cheap UTC timestamps for records created in bulk.
+
+Every PromptVariant and LLMResponse gets a creation timestamp, and formatting
+datetime.utcnow().isoformat() for each one is surprisingly expensive. Record
+timestamps only need second resolution, so the formatted string is cached and
+rebuilt once per second; timestamps that need microseconds (e.g. experiment
+start times) append them to the same cached string.
+"""
+
+import time
+from typing import Tuple
+
+# (epoch second, formatted timestamp) of the last call; replaced as a whole so
+# concurrent readers never see a mismatched pair
+_last: Tuple[int, str] = (-1, "")
+
+
+def _format_second(second: int) -> str:
+    """Return the ISO 8601 string of an epoch second, reusing the last one built."""
+    global _last
+
+    cached = _last
+    if cached[0] != second:
+        cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        _last = cached
+    return cached[1]
+
+
+def utc_now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with second resolution.
+
+    Returns:
+        Timestamp such as '2025-01-31T14:05:09'
+    """
+    return _format_second(int(time.time()))
+
+
+def utc_now_iso_us() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with microsecond resolution.
+
+    Returns:
+        Timestamp such as '2025-01-31T14:05:09.123456' (the format of
+        datetime.utcnow().isoformat(), except that zero microseconds are kept)
+    """
+    second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_format_second(second)}.{nanoseconds // 1000:06d}"
@@ -5,13 +5,50 @@ This module coordinates the evaluation process: adapting prompts, sending to LLM
 and collecting responses for analysis.
 """
 
-from typing import Dict, List, Optional
-from datetime import datetime
-
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .clock import utc_now_iso
 from .prompt import PromptTemplate, PromptVariant, LLMResponse, FormalityLevel
-from ..adapters import get_adapter
+from ..adapters import get_adapter, run_batch
 from ..providers.base import AbstractLLMProvider, GenerationConfig
-from ..constants import LANGUAGE_NAMES, get_formality_guidance
+from ..constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    LANGUAGE_NAMES,
+    MEMORY_CACHE_MAX_ENTRIES,
+    get_formality_guidance
+)
+
+# Used when no generation config is passed; configs are never modified after
+# creation, so one shared instance is safe
+_DEFAULT_GENERATION_CONFIG = GenerationConfig()
+
+# Few-shot example for the evaluation instruction (shared by every call)
+_EXAMPLE_INPUT = """Hola
+
+¿Qué tal? Te escribo porque:
+I need your help with something urgent.
+
+Gracias
+Saludos"""
+
+_EXAMPLE_OUTPUT = """Hola
+
+¿Qué tal? Te escribo porque:
+Necesito tu ayuda con algo urgente.
+
+Gracias
+Saludos"""
+
+# Closes the evaluation user prompt after the adapted content
+_USER_PROMPT_TAIL = """
+
+Output:"""
 
 
 class PromptEvaluator:
@@ -28,7 +65,9 @@ class PromptEvaluator:
     def __init__(
         self,
         provider: AbstractLLMProvider,
-        language_configs: Dict[str, Dict]
+        language_configs: Dict[str, Dict],
+        cache_responses: bool = True,
+        cache_stochastic: bool = False
     ):
         """
         Initialize evaluator.
@@ -36,37 +75,74 @@ class PromptEvaluator:
         Args:
             provider: LLM provider instance
             language_configs: Dictionary of language configurations from languages.yaml
+            cache_responses: Reuse the provider result when an identical
+                request (same prompts, model and generation config) is
+                evaluated again by this evaluator
+            cache_stochastic: Also reuse results of requests with
+                temperature > 0 (by default sampled requests always reach
+                the provider, so repeated runs draw fresh samples)
         """
         self.provider = provider
         self.language_configs = language_configs
-        self._adapters = {}
+        # One adapter per language, built on first use (one C-level lookup per call)
+        self._get_adapter = lru_cache(maxsize=None)(self._make_adapter)
+        self._instruction_parts: Dict[Tuple[str, FormalityLevel], Tuple[str, str]] = {}
+
+        # Adapted variants keyed by (template id, content, domain, language,
+        # formality), so re-adapting a template skips the adapter and its LLM call
+        self._variant_cache: "OrderedDict[Tuple, PromptVariant]" = OrderedDict()
+
+        # Provider results keyed by request fingerprint (see _response_cache_key),
+        # least recently used first
+        self._response_cache: "Optional[OrderedDict[str, Dict]]" = (
+            OrderedDict() if cache_responses else None
+        )
+        self._cache_stochastic = cache_stochastic
+        self._cache_lock = threading.Lock()  # Adaptations and evaluations run in worker threads
 
-    def _get_adapter(self, language_code: str):
+    def _make_adapter(self, language_code: str):
         """
-        Get or create cached adapter for language.
+        Create the adapter for a language (cached per instance as _get_adapter).
 
         Passes LLM provider to adapter if LLM adaptation is enabled.
+
+        Raises:
+            ValueError: If the language has no configuration
         """
-        if language_code not in self._adapters:
-            if language_code not in self.language_configs:
-                raise ValueError(f"No configuration found for language: {language_code}")
+        if language_code not in self.language_configs:
+            raise ValueError(f"No configuration found for language: {language_code}")
 
-            config = self.language_configs[language_code]
+        config = self.language_configs[language_code]
 
-            # Check if language uses LLM adaptation
-            llm_config = config.get('llm_adaptation', {})
-            needs_provider = llm_config.get('enabled', False)
+        # Check if language uses LLM adaptation
+        llm_config = config.get('llm_adaptation', {})
+        needs_provider = llm_config.get('enabled', False)
 
-            # Pass provider if LLM adaptation is enabled for this language
-            provider = self.provider if needs_provider else None
+        # Pass provider if LLM adaptation is enabled for this language
+        provider = self.provider if needs_provider else None
 
-            self._adapters[language_code] = get_adapter(
-                language_code,
-                config,
-                provider
-            )
+        return get_adapter(
+            language_code,
+            config,
+            provider
+        )
+
+    def warm_up(self, languages: List[str]) -> None:
+        """
+        Create the adapters for the given languages ahead of a run.
+
+        Adapters are cached per language either way; building them up front
+        moves their setup (scaffold and prompt tables) out of the evaluation
+        loop and surfaces missing language configs before any API call.
+
+        Args:
+            languages: Language codes that will be evaluated
 
-        return self._adapters[language_code]
+        Raises:
+            ValueError: If a language has no configuration
+        """
+        for language_code in languages:
+            self._get_adapter(language_code)
 
     def adapt_prompt(
         self,
@@ -85,8 +161,57 @@ class PromptEvaluator:
         Returns:
             PromptVariant with cultural adaptations
         """
-        adapter = self._get_adapter(language)
-        return adapter.adapt(template, formality)
+        key = (template.id, template.content, template.domain, language, formality)
+        variant = self._recall_variant(key)
+        if variant is None:
+            variant = self._get_adapter(language).adapt(template, formality)
+            self._remember_variant(key, variant)
+        return variant
+
+    async def adapt_prompt_async(
+        self,
+        template: PromptTemplate,
+        language: str,
+        formality: FormalityLevel
+    ) -> PromptVariant:
+        """
+        Asynchronous counterpart of adapt_prompt().
+
+        Args:
+            template: Base prompt template
+            language: Target language code
+            formality: Desired formality level
+
+        Returns:
+            PromptVariant with cultural adaptations
+        """
+        key = (template.id, template.content, template.domain, language, formality)
+        variant = self._recall_variant(key)
+        if variant is None:
+            variant = await self._get_adapter(language).adapt_async(template, formality)
+            self._remember_variant(key, variant)
+        return variant
+
+    def _recall_variant(self, key: Tuple) -> Optional[PromptVariant]:
+        """Return a fresh copy of a memoized adaptation, or None."""
+        with self._cache_lock:
+            variant = self._variant_cache.get(key)
+            if variant is None:
+                return None
+            self._variant_cache.move_to_end(key)
+        return replace(
+            variant,
+            timestamp=utc_now_iso(),
+            metadata=dict(variant.metadata)
+        )
+
+    def _remember_variant(self, key: Tuple, variant: PromptVariant) -> None:
+        """Memoize an adaptation, evicting the least recently used one if full."""
+        with self._cache_lock:
+            self._variant_cache[key] = variant
+            self._variant_cache.move_to_end(key)
+            if len(self._variant_cache) > MEMORY_CACHE_MAX_ENTRIES:
+                self._variant_cache.popitem(last=False)
 
     def evaluate_variant(
         self,
@@ -104,52 +229,219 @@ class PromptEvaluator:
             LLMResponse with model output and metadata
         """
         if config is None:
-            config = GenerationConfig()
+            config = _DEFAULT_GENERATION_CONFIG
 
-        # Wrap the adapted content with instruction to generate the content
-        # This prevents the LLM from responding as an assistant
-        # Map language codes to full names
-        target_language = LANGUAGE_NAMES.get(variant.language, variant.language)
+        return self._build_response(variant, self._generate_result(variant, config))
 
-        # Build formality instruction
-        formality_note = get_formality_guidance(variant.formality.value)
+    def _generate_result(self, variant: PromptVariant, config: GenerationConfig) -> Dict:
+        """Get the provider result for a variant (unless this exact request was already made)."""
+        system_prompt, user_prompt = self._build_instructed_prompt(variant)
+        cache_key = self._response_cache_key(system_prompt, user_prompt, config)
+        result = self._get_cached_result(cache_key)
+        if result is None:
+            result = self.provider.generate(user_prompt, config, system_prompt)
+            self._store_result(cache_key, result)
+        return result
 
-        # Build example for few-shot learning
-        example_input = """Hola
+    async def evaluate_variant_async(
+        self,
+        variant: PromptVariant,
+        config: Optional[GenerationConfig] = None
+    ) -> LLMResponse:
+        """
+        Asynchronous counterpart of evaluate_variant().
 
-¿Qué tal? Te escribo porque:
-I need your help with something urgent.
+        Awaits the provider's agenerate(), so many evaluations can be in
+        flight at once (see the benchmark command's --concurrency option).
 
-Gracias
-Saludos"""
+        Args:
+            variant: Culturally adapted prompt variant
+            config: Generation configuration
 
-        example_output = """Hola
+        Returns:
+            LLMResponse with model output and metadata
+        """
+        if config is None:
+            config = _DEFAULT_GENERATION_CONFIG
 
-¿Qué tal? Te escribo porque:
-Necesito tu ayuda con algo urgente.
+        system_prompt, user_prompt = self._build_instructed_prompt(variant)
+        cache_key = self._response_cache_key(system_prompt, user_prompt, config)
+        result = self._get_cached_result(cache_key)
+        if result is None:
+            result = await self.provider.agenerate(user_prompt, config, system_prompt)
+            self._store_result(cache_key, result)
+        return self._build_response(variant, result)
 
-Gracias
-Saludos"""
+    def _response_cache_key(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig
+    ) -> Optional[str]:
+        """Fingerprint an evaluation request, or None if it must not be cached."""
+        if self._response_cache is None or (config.temperature > 0 and not self._cache_stochastic):
+            return None
+        payload = "\x00".join((
+            self.provider.model_name or self.provider.default_model,
+            repr((config.temperature, config.max_tokens, config.top_p, config.stop_sequences)),
+            system_prompt,
+            user_prompt
+        ))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_result(self, cache_key: Optional[str]) -> Optional[Dict]:
+        """Return a copy of a cached provider result with a fresh timestamp, or None."""
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            result = self._response_cache.get(cache_key)
+            if result is None:
+                return None
+            self._response_cache.move_to_end(cache_key)
+        return {**result, "timestamp": utc_now_iso()}
+
+    def _store_result(self, cache_key: Optional[str], result: Dict) -> None:
+        """Remember a provider result, evicting the least recently used one if full."""
+        if cache_key is None:
+            return
+        with self._cache_lock:
+            self._response_cache[cache_key] = result
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > MEMORY_CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)
+
+    def adapt_prompts_batch(
+        self,
+        items: List[Tuple[PromptTemplate, str, FormalityLevel]],
+        poll_interval: float = 30.0
+    ) -> List[PromptVariant]:
+        """
+        Adapt many prompts, running all Phase 2 refinements as provider batch jobs.
 
-        instructed_prompt = f"""Task: Translate ONLY English sentences to {target_language}. Copy all {target_language} text exactly as-is, including line breaks.
+        Args:
+            items: (template, language, formality) triples to adapt
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            One PromptVariant per item, in input order
+        """
+        return run_batch(
+            [(self._get_adapter(language), template, formality) for template, language, formality in items],
+            self.provider,
+            poll_interval
+        )
+
+    def evaluate_variants_batch(
+        self,
+        items: List[Tuple[PromptVariant, GenerationConfig]],
+        poll_interval: float = 30.0
+    ) -> List[Optional[LLMResponse]]:
+        """
+        Evaluate many variants through the provider's Batch API.
+
+        Requests are grouped by system prompt (one per target language) and
+        generation config, and each group is submitted with
+        provider.submit_batch(). Batch jobs are billed at a discount but
+        complete asynchronously, possibly hours later.
+
+        Args:
+            items: (variant, generation config) pairs to evaluate
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            One entry per item, in input order: the LLMResponse, or None if
+            the request failed inside the batch
+
+        Raises:
+            Exception: If a batch job cannot be submitted or fails as a whole
+        """
+        # Requests grouped by (system prompt, config) -> {custom_id: user prompt}
+        groups: Dict[Tuple, Dict[str, str]] = {}
+        group_configs: Dict[Tuple, GenerationConfig] = {}
+        custom_ids = []
+
+        for index, (variant, config) in enumerate(items):
+            system_prompt, user_prompt = self._build_instructed_prompt(variant)
+            custom_id = f"{index}_{variant.language}_{variant.formality.value}"
+            custom_ids.append(custom_id)
+
+            group_key = (
+                system_prompt,
+                config.temperature,
+                config.max_tokens,
+                config.top_p,
+                config.stop_sequences
+            )
+            groups.setdefault(group_key, {})[custom_id] = user_prompt
+            group_configs[group_key] = config
+
+        results: Dict[str, Dict] = {}
+        for group_key, prompts in groups.items():
+            results.update(self.provider.submit_batch(
+                prompts, group_configs[group_key], poll_interval, system_prompt=group_key[0]
+            ))
+
+        return [
+            self._build_response(variant, results[custom_id]) if custom_id in results else None
+            for (variant, _), custom_id in zip(items, custom_ids)
+        ]
+
+    def _build_instructed_prompt(self, variant: PromptVariant) -> Tuple[str, str]:
+        """
+        Wrap the adapted content in the translation instruction sent to the LLM.
+
+        The instruction and few-shot example depend only on the target
+        language, so they form a system prompt that is byte-identical for
+        every variant in that language (and can be served from the
+        provider's prompt cache). The variant-specific part goes in the
+        user prompt.
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
+        # Only the adapted content varies per call; the system prompt and the
+        # user prompt head are built once per (language, formality)
+        parts = self._instruction_parts.get((variant.language, variant.formality))
+        if parts is None:
+            parts = self._build_instruction_parts(variant.language, variant.formality)
+            self._instruction_parts[(variant.language, variant.formality)] = parts
+
+        system_prompt, user_head = parts
+        return system_prompt, "".join((user_head, variant.adapted_content, _USER_PROMPT_TAIL))
+
+    @staticmethod
+    def _build_instruction_parts(language: str, formality: FormalityLevel) -> Tuple[str, str]:
+        """
+        Build the static instruction text for a (language, formality) pair.
+
+        Returns:
+            Tuple of (system_prompt, user prompt head before the content)
+        """
+        # Wrap the adapted content with instruction to generate the content
+        # This prevents the LLM from responding as an assistant
+        # Map language codes to full names
+        target_language = LANGUAGE_NAMES.get(language, language)
+
+        # Build formality instruction
+        formality_note = get_formality_guidance(formality.value)
+
+        system_prompt = f"""Task: Translate ONLY English sentences to {target_language}. Copy all {target_language} text exactly as-is, including line breaks.
 
 Example:
 Input:
-{example_input}
+{_EXAMPLE_INPUT}
 
 Output:
-{example_output}
+{_EXAMPLE_OUTPUT}"""
 
-Now translate this text ({formality_note}):
+        user_head = f"""Now translate this text ({formality_note}):
 Input:
-{variant.adapted_content}
-
-Output:"""
+"""
 
-        # Generate response from LLM
-        result = self.provider.generate(instructed_prompt, config)
+        return system_prompt, user_head
 
-        # Create structured response object
+    def _build_response(self, variant: PromptVariant, result: Dict) -> LLMResponse:
+        """Create the structured LLMResponse for a provider result."""
         variant_id = f"{variant.template_id}_{variant.language}_{variant.formality.value}"
 
         response = LLMResponse(
@@ -174,59 +466,185 @@ Output:"""
         template: PromptTemplate,
         languages: List[str],
         formality_levels: List[FormalityLevel],
-        config: Optional[GenerationConfig] = None
+        config: Optional[GenerationConfig] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ) -> Dict[str, Dict[str, LLMResponse]]:
         """
         Comprehensively evaluate a template across multiple languages and formality levels.
 
+        The (language, formality) combinations are independent, network-bound
+        LLM calls, so they run concurrently in a thread pool.
+
         Args:
             template: Base prompt template
             languages: List of language codes to test
             formality_levels: List of formality levels to test
             config: Generation configuration
+            max_concurrency: Maximum number of evaluations in flight at once
 
         Returns:
             Nested dictionary: {language: {formality: LLMResponse}}
         """
-        results = {}
+        # Seed keys so the result keeps combination order, not completion order
+        formality_values = [formality.value for formality in formality_levels]
+        results = {language: dict.fromkeys(formality_values) for language in languages}
+        for language, formality, response in self.iter_evaluate_template(
+            template, languages, formality_levels, config, max_concurrency
+        ):
+            results[language][formality.value] = response
+
+        return results
 
-        for language in languages:
-            results[language] = {}
-            for formality in formality_levels:
-                # Adapt prompt
-                variant = self.adapt_prompt(template, language, formality)
+    def iter_evaluate_template(
+        self,
+        template: PromptTemplate,
+        languages: List[str],
+        formality_levels: List[FormalityLevel],
+        config: Optional[GenerationConfig] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Iterator[Tuple[str, FormalityLevel, LLMResponse]]:
+        """
+        Evaluate a template like evaluate_template_comprehensive(), yielding results as they arrive.
 
-                # Evaluate variant
-                response = self.evaluate_variant(variant, config)
+        Responses are yielded in completion order, so a consumer can process
+        or display the first one without waiting for the slowest call.
+        Abandoning the iterator cancels evaluations that have not started.
 
-                results[language][formality.value] = response
+        Args:
+            template: Base prompt template
+            languages: List of language codes to test
+            formality_levels: List of formality levels to test
+            config: Generation configuration
+            max_concurrency: Maximum number of evaluations in flight at once
 
-        return results
+        Yields:
+            (language, formality, LLMResponse) tuples
+        """
+        combinations = [
+            (language, formality) for language in languages for formality in formality_levels
+        ]
+        for index, response in self._iter_concurrently(
+            [(template, language, formality) for language, formality in combinations],
+            config,
+            max_concurrency
+        ):
+            language, formality = combinations[index]
+            yield language, formality, response
 
     def batch_evaluate(
         self,
         templates: List[PromptTemplate],
         language: str,
         formality: FormalityLevel,
-        config: Optional[GenerationConfig] = None
+        config: Optional[GenerationConfig] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ) -> List[LLMResponse]:
         """
         Evaluate multiple templates for a specific language and formality level.
 
+        Templates are evaluated concurrently in a thread pool.
+
         Args:
             templates: List of prompt templates
             language: Target language code
             formality: Formality level
             config: Generation configuration
+            max_concurrency: Maximum number of evaluations in flight at once
 
         Returns:
-            List of LLMResponse objects
+            List of LLMResponse objects, in template order
         """
-        responses = []
+        responses: List[Optional[LLMResponse]] = [None] * len(templates)
+        for index, response in self._iter_concurrently(
+            [(template, language, formality) for template in templates],
+            config,
+            max_concurrency
+        ):
+            responses[index] = response
+        return responses
 
-        for template in templates:
-            variant = self.adapt_prompt(template, language, formality)
-            response = self.evaluate_variant(variant, config)
-            responses.append(response)
+    def _iter_concurrently(
+        self,
+        items: List[Tuple[PromptTemplate, str, FormalityLevel]],
+        config: Optional[GenerationConfig],
+        max_concurrency: int
+    ) -> Iterator[Tuple[int, LLMResponse]]:
+        """
+        Adapt and evaluate (template, language, formality) items in a thread pool.
+
+        Items are adapted per language with CulturalAdapter.adapt_batch(), so
+        hybrid Phase 2 refinements share multi-item LLM calls; the variants
+        are then evaluated concurrently. Variants with identical
+        (adapted content, language, formality) produce the same request, so
+        each distinct request is sent once and its result shared. Provider
+        calls are blocking HTTP requests that release the GIL, so threads
+        overlap their latency. Exceptions propagate to the caller.
+
+        Yields:
+            (item index, LLMResponse) pairs, in completion order
+        """
+        if not items:
+            return
 
-        return responses
+        # Group item positions by language (one adapter per group)
+        groups: Dict[str, List[int]] = {}
+        for index, (_, language, _) in enumerate(items):
+            groups.setdefault(language, []).append(index)
+
+        # Create adapters up front so worker threads never race to build them
+        self.warm_up(list(groups))
+
+        variants: List[Optional[PromptVariant]] = [None] * len(items)
+
+        def _adapt_group(language: str) -> None:
+            indices = groups[language]
+            for index, variant in zip(indices, self._adapt_items(language, [items[i] for i in indices])):
+                variants[index] = variant
+
+        if config is None:
+            config = _DEFAULT_GENERATION_CONFIG
+
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(items)))
+        try:
+            list(executor.map(_adapt_group, groups))
+
+            # One provider call per distinct request; duplicates share its result
+            unique: Dict[Tuple[str, str, FormalityLevel], List[int]] = {}
+            for index, variant in enumerate(variants):
+                unique.setdefault(
+                    (variant.adapted_content, variant.language, variant.formality), []
+                ).append(index)
+            futures = {
+                executor.submit(self._generate_result, variants[indices[0]], config): indices
+                for indices in unique.values()
+            }
+
+            for future in as_completed(futures):
+                result = future.result()
+                for index in futures[future]:
+                    yield index, self._build_response(variants[index], result)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _adapt_items(
+        self,
+        language: str,
+        items: List[Tuple[PromptTemplate, str, FormalityLevel]]
+    ) -> List[PromptVariant]:
+        """Adapt items of one language, batching the ones not yet memoized."""
+        keys = [
+            (template.id, template.content, template.domain, language, formality)
+            for template, _, formality in items
+        ]
+        variants = [self._recall_variant(key) for key in keys]
+
+        misses = [index for index, variant in enumerate(variants) if variant is None]
+        if misses:
+            adapted = self._get_adapter(language).adapt_batch(
+                [(items[index][0], items[index][2]) for index in misses]
+            )
+            for index, variant in zip(misses, adapted):
+                self._remember_variant(keys[index], variant)
+                variants[index] = variant
+
+        return variants
@@ -6,10 +6,11 @@ culturally-adapted variants across different languages.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional
 
+from .clock import utc_now_iso
+
 
 class PromptDomain(Enum):
     """Categories of prompt use cases."""
@@ -27,7 +28,11 @@ class FormalityLevel(Enum):
     FORMAL = "formal"
 
 
-@dataclass
+# Value -> member lookup table (a plain dict hit is much cheaper than Enum(value))
+_FORMALITY_BY_VALUE: Dict[str, FormalityLevel] = {m.value: m for m in FormalityLevel}
+
+
+@dataclass(slots=True)
 class PromptTemplate:
     """
     Base prompt template in English with metadata.
@@ -65,11 +70,14 @@ class PromptTemplate:
         return rendered
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptVariant:
     """
     Culturally adapted version of a prompt template.
 
+    Uses __slots__: batch runs create one variant per (template, language,
+    formality), so dropping the per-instance __dict__ noticeably cuts memory.
+
     Attributes:
         template_id: ID of the source PromptTemplate
         language: Target language code (e.g., 'de', 'es')
@@ -84,7 +92,7 @@ class PromptVariant:
     formality: FormalityLevel
     adapted_content: str
     adaptation_notes: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=utc_now_iso)
     metadata: Dict[str, any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
@@ -102,22 +110,31 @@ class PromptVariant:
     @classmethod
     def from_dict(cls, data: Dict) -> "PromptVariant":
         """Create PromptVariant from dictionary."""
+        # Hot path when reloading cached results: bind data.get once, pass
+        # fields positionally, and only build a timestamp when one is missing
+        _get = data.get
+        timestamp = _get("timestamp")
+        if timestamp is None:
+            timestamp = utc_now_iso()
         return cls(
-            template_id=data["template_id"],
-            language=data["language"],
-            formality=FormalityLevel(data["formality"]),
-            adapted_content=data["adapted_content"],
-            adaptation_notes=data.get("adaptation_notes", ""),
-            timestamp=data.get("timestamp", datetime.utcnow().isoformat()),
-            metadata=data.get("metadata", {})
+            data["template_id"],
+            data["language"],
+            _FORMALITY_BY_VALUE[data["formality"]],
+            data["adapted_content"],
+            _get("adaptation_notes", ""),
+            timestamp,
+            _get("metadata", {})
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """
     Response from an LLM for a given prompt variant.
 
+    Uses __slots__ like PromptVariant, since a benchmark keeps one response
+    per variant in memory (and in the CacheManager memo).
+
     Attributes:
         variant_id: Identifier linking to the PromptVariant
         content: The LLM's response text
@@ -132,7 +149,7 @@ class LLMResponse:
     model: str
     tokens_input: int = 0
     tokens_output: int = 0
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=utc_now_iso)
     metadata: Dict[str, any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
@@ -150,12 +167,17 @@ class LLMResponse:
     @classmethod
     def from_dict(cls, data: Dict) -> "LLMResponse":
         """Create LLMResponse from dictionary."""
+        # Same fast path as PromptVariant.from_dict
+        _get = data.get
+        timestamp = _get("timestamp")
+        if timestamp is None:
+            timestamp = utc_now_iso()
         return cls(
-            variant_id=data["variant_id"],
-            content=data["content"],
-            model=data["model"],
-            tokens_input=data.get("tokens_input", 0),
-            tokens_output=data.get("tokens_output", 0),
-            timestamp=data.get("timestamp", datetime.utcnow().isoformat()),
-            metadata=data.get("metadata", {})
+            data["variant_id"],
+            data["content"],
+            data["model"],
+            _get("tokens_input", 0),
+            _get("tokens_output", 0),
+            timestamp,
+            _get("metadata", {})
         )
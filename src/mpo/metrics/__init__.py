@@ -7,5 +7,7 @@ evaluation metrics.
 
 from . import quantitative
 from . import qualitative
+from .cached import get_response_metrics
+from .incremental import IncrementalMetricAccumulator
 
-__all__ = ["quantitative", "qualitative"]
+__all__ = ["quantitative", "qualitative", "get_response_metrics", "IncrementalMetricAccumulator"]
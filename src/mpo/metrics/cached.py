@@ -0,0 +1,69 @@
+"""
+Memoized metric computation for cached LLM responses.
+
+Metrics are a pure function of the response content, so they only need to
+be computed once per response: results are memoized in-process and
+persisted next to the response in the CacheManager.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict
+
+from ..core.prompt import LLMResponse
+from . import quantitative, qualitative
+
+if TYPE_CHECKING:
+    from ..storage.cache_manager import CacheManager
+
+
+@lru_cache(maxsize=1024)
+def _compute_metrics(
+    content: str,
+    tokens_output: int,
+    language: str,
+    formality: str,
+    domain: str
+) -> Dict:
+    """Compute quantitative and qualitative metrics for one response (memoized)."""
+    return {
+        "quantitative": quantitative.calculate_all_quantitative_metrics(
+            content, tokens_output, language
+        ),
+        "qualitative": qualitative.calculate_all_qualitative_metrics(
+            content, language, formality, domain
+        )
+    }
+
+
+def get_response_metrics(
+    cache: "CacheManager",
+    response: LLMResponse,
+    template_id: str,
+    language: str,
+    formality: str,
+    domain: str
+) -> Dict:
+    """
+    Get the metrics for a cached response, computing them only on a miss.
+
+    The returned dictionary may be shared with other callers and must be
+    treated as read-only.
+
+    Args:
+        cache: Cache manager holding the response
+        response: Response to evaluate
+        template_id: Prompt template ID
+        language: Language code
+        formality: Formality level
+        domain: Prompt domain for the qualitative scoring
+
+    Returns:
+        Dictionary with "quantitative" and "qualitative" results
+    """
+    metrics = cache.get_cached_metrics(response, template_id, language, formality, domain)
+    if metrics is None:
+        metrics = _compute_metrics(
+            response.content, response.tokens_output, language, formality, domain
+        )
+        cache.cache_metrics(response, template_id, language, formality, domain, metrics)
+    return metrics
@@ -0,0 +1,126 @@
+"""
+Incremental metrics for streamed responses.
+
+Running counts are updated as chunks arrive from a provider's
+stream_generate(), so length statistics and marker hits are available while
+the response is still being generated instead of after the last token.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List
+
+from .quantitative import _RE_SENT
+
+
+class IncrementalMetricAccumulator:
+    """
+    Running word, sentence and marker counts over a chunked response.
+
+    Counts follow the quantitative metrics: words are whitespace-separated
+    (as in calculate_token_efficiency), sentences are non-empty segments
+    between runs of '.', '!' and '?', and markers are literal substrings.
+    Words, sentences and markers split across chunk boundaries are counted
+    once.
+
+    Example:
+        >>> acc = IncrementalMetricAccumulator(markers=["Sehr geehrte"])
+        >>> for chunk in provider.stream_generate(prompt, config):
+        ...     acc.feed(chunk)
+        ...     show_progress(acc.snapshot())
+    """
+
+    def __init__(self, markers: Iterable[str] = ()):
+        """
+        Initialize the accumulator.
+
+        Args:
+            markers: Literal substrings to watch for (e.g. greetings)
+        """
+        self._markers = tuple(markers)
+        self._marker_hits = set()
+        # Enough trailing text to catch a marker that straddles two chunks
+        self._overlap = max((len(marker) for marker in self._markers), default=1) - 1
+        self._tail = ""
+
+        self._chunks: List[str] = []
+        self._char_count = 0
+        self._word_count = 0
+        self._sentence_count = 0
+        self._in_word = False  # Last character seen was part of a word
+        self._segment_has_content = False  # Current sentence segment is non-empty
+
+    def feed(self, chunk: str) -> None:
+        """
+        Add the next chunk of the response.
+
+        Args:
+            chunk: Newly generated text
+        """
+        if not chunk:
+            return
+
+        self._chunks.append(chunk)
+        self._char_count += len(chunk)
+
+        # Words: a word continuing from the previous chunk is not new
+        words = len(chunk.split())
+        if self._in_word and not chunk[0].isspace():
+            words -= 1
+        self._word_count += words
+        self._in_word = not chunk[-1].isspace()
+
+        # Sentences: each terminator run closes the current segment
+        for index, part in enumerate(_RE_SENT.split(chunk)):
+            if index and self._segment_has_content:
+                self._sentence_count += 1
+                self._segment_has_content = False
+            if not self._segment_has_content and part.strip():
+                self._segment_has_content = True
+
+        # Markers: search the chunk plus the tail of the previous one
+        if self._markers:
+            window = self._tail + chunk
+            for marker in self._markers:
+                if marker not in self._marker_hits and marker in window:
+                    self._marker_hits.add(marker)
+            self._tail = window[-self._overlap:] if self._overlap else ""
+
+    @property
+    def text(self) -> str:
+        """Response text received so far."""
+        return "".join(self._chunks)
+
+    @property
+    def char_count(self) -> int:
+        """Number of characters received so far."""
+        return self._char_count
+
+    @property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words so far."""
+        return self._word_count
+
+    @property
+    def sentence_count(self) -> int:
+        """Number of sentences so far, including an unterminated last one."""
+        return self._sentence_count + (1 if self._segment_has_content else 0)
+
+    @property
+    def marker_hits(self) -> FrozenSet[str]:
+        """Watched markers that have appeared so far."""
+        return frozenset(self._marker_hits)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current running metrics.
+
+        Returns:
+            Dictionary with character, word and sentence counts and the
+            markers seen so far
+        """
+        return {
+            "char_count": self.char_count,
+            "word_count": self.word_count,
+            "sentence_count": self.sentence_count,
+            "words_per_sentence": self.word_count / max(self.sentence_count, 1),
+            "marker_hits": sorted(self._marker_hits)
+        }
@@ -5,11 +5,59 @@ Provides rubric-based evaluation and readability metrics for
 culturally-adapted responses.
 """
 
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import textstat
 from enum import Enum
 
 
+# Greeting/closing rubrics: (language, formality) -> [(markers, score, note)],
+# checked in order; the first rule with any marker present decides the score
+_GREETING_RULES: Dict[Tuple[str, str], List[Tuple[Tuple[str, ...], int, str]]] = {
+    ("de", "formal"): [
+        (("Sehr geehrte",), 5, "Excellent: Very formal German greeting"),
+        (("Guten Tag",), 4, "Good: Appropriate formal greeting"),
+        (("Hallo",), 2, "Poor: Too casual for formal context"),
+    ],
+    ("de", "casual"): [
+        (("Hallo", "Hi"), 5, "Excellent: Casual greeting matches formality"),
+        (("Guten Tag",), 3, "Adequate: Slightly formal for casual context"),
+    ],
+    ("es", "formal"): [
+        (("Estimado", "Estimada"), 5, "Excellent: Formal Spanish greeting"),
+        (("Buenos días",), 4, "Good: Professional greeting"),
+        (("Hola",), 2, "Poor: Too casual for formal context"),
+    ],
+    ("es", "casual"): [
+        (("Hola", "¿Qué tal?"), 5, "Excellent: Casual greeting matches formality"),
+    ],
+}
+
+_CLOSING_RULES: Dict[Tuple[str, str], List[Tuple[Tuple[str, ...], int, str]]] = {
+    ("de", "formal"): [
+        (("Hochachtungsvoll",), 5, "Excellent: Very formal German closing"),
+        (("freundlichen Grüßen",), 4, "Good: Standard professional closing"),
+    ],
+    ("de", "neutral"): [
+        (("freundlichen Grüßen",), 4, "Good: Standard professional closing"),
+    ],
+    ("de", "casual"): [
+        (("freundlichen Grüßen",), 4, "Good: Standard professional closing"),
+        (("Viele Grüße",), 5, "Excellent: Casual closing matches formality"),
+    ],
+    ("es", "formal"): [
+        (("Cordialmente", "Atentamente"), 5, "Excellent: Formal Spanish closing"),
+    ],
+    ("es", "casual"): [
+        (("Saludos",), 5, "Excellent: Casual closing matches formality"),
+    ],
+    ("en", "formal"): [
+        (("Sincerely",), 5, "Excellent: Formal English closing"),
+    ],
+}
+
+
 class CulturalAppropriatenessScore(Enum):
     """Cultural appropriateness rating scale."""
     EXCELLENT = 5
@@ -30,6 +78,13 @@ def calculate_readability_metrics(response: str, language: str = "en") -> Dict[s
     Returns:
         Dictionary with readability scores
     """
+    # The scores are flat, so a shallow copy keeps the cached entry intact
+    return dict(_readability_cached(response, language))
+
+
+@lru_cache(maxsize=1024)
+def _readability_cached(response: str, language: str) -> Dict[str, any]:
+    """Compute readability metrics (memoized per response and language)."""
     metrics = {}
 
     # English readability metrics
@@ -113,28 +168,30 @@ def evaluate_cultural_appropriateness(
     }
 
     # Criteria 1: Greeting appropriateness
-    greeting_score = _evaluate_greeting(response, language, formality)
-    scores["criteria"]["greeting"] = greeting_score
+    greeting_score, greeting_notes = _evaluate_greeting(response, language, formality)
 
-    # Criteria 2: Formality match
-    formality_score = _evaluate_formality_match(response, language, formality)
-    scores["criteria"]["formality_match"] = formality_score
+    # Criteria 2: Formality match (pronoun checks are case-insensitive, so
+    # the text is lowercased once here for both languages that need it)
+    response_lower = response.lower() if language in ("de", "es") else response
+    formality_score, formality_notes = _evaluate_formality_match(
+        response, response_lower, language, formality
+    )
 
     # Criteria 3: Cultural markers
-    cultural_markers_score = _evaluate_cultural_markers(response, language, domain)
-    scores["criteria"]["cultural_markers"] = cultural_markers_score
+    markers_score, markers_notes = _evaluate_cultural_markers(response, language, domain)
 
     # Criteria 4: Closing appropriateness
-    closing_score = _evaluate_closing(response, language, formality)
-    scores["criteria"]["closing"] = closing_score
+    closing_score, closing_notes = _evaluate_closing(response, language, formality)
+
+    scores["criteria"] = {
+        "greeting": {"score": greeting_score, "notes": greeting_notes},
+        "formality_match": {"score": formality_score, "notes": formality_notes},
+        "cultural_markers": {"score": markers_score, "notes": markers_notes},
+        "closing": {"score": closing_score, "notes": closing_notes}
+    }
 
     # Overall score (average)
-    total_score = sum([
-        greeting_score["score"],
-        formality_score["score"],
-        cultural_markers_score["score"],
-        closing_score["score"]
-    ]) / 4
+    total_score = (greeting_score + formality_score + markers_score + closing_score) / 4
 
     scores["overall_score"] = round(total_score, 2)
     scores["overall_rating"] = _score_to_rating(total_score)
@@ -142,66 +199,33 @@ def evaluate_cultural_appropriateness(
     return scores
 
 
-def _evaluate_greeting(response: str, language: str, formality: str) -> Dict:
-    """Evaluate greeting appropriateness."""
-    score = 3  # Default: adequate
-    notes = []
-
-    if language == "de":
-        if formality == "formal":
-            if "Sehr geehrte" in response:
-                score = 5
-                notes.append("Excellent: Very formal German greeting")
-            elif "Guten Tag" in response:
-                score = 4
-                notes.append("Good: Appropriate formal greeting")
-            elif "Hallo" in response:
-                score = 2
-                notes.append("Poor: Too casual for formal context")
-        elif formality == "casual":
-            if "Hallo" in response or "Hi" in response:
-                score = 5
-                notes.append("Excellent: Casual greeting matches formality")
-            elif "Guten Tag" in response:
-                score = 3
-                notes.append("Adequate: Slightly formal for casual context")
-
-    elif language == "es":
-        if formality == "formal":
-            if "Estimado" in response or "Estimada" in response:
-                score = 5
-                notes.append("Excellent: Formal Spanish greeting")
-            elif "Buenos días" in response:
-                score = 4
-                notes.append("Good: Professional greeting")
-            elif "Hola" in response:
-                score = 2
-                notes.append("Poor: Too casual for formal context")
-        elif formality == "casual":
-            if "Hola" in response or "¿Qué tal?" in response:
-                score = 5
-                notes.append("Excellent: Casual greeting matches formality")
-
-    elif language == "en":
+def _evaluate_greeting(response: str, language: str, formality: str) -> Tuple[int, List[str]]:
+    """Evaluate greeting appropriateness; returns (score, notes)."""
+    if language == "en":
+        # English checks look at the opening of the response only
         if formality == "formal":
-            if "Dear" in response[:50]:
-                score = 5
-                notes.append("Excellent: Formal English greeting")
+            if response.find("Dear", 0, 50) != -1:  # Within the first 50 chars, no slice copy
+                return 5, ["Excellent: Formal English greeting"]
             elif response.startswith("Please"):
-                score = 4
-                notes.append("Good: Polite formal opening")
+                return 4, ["Good: Polite formal opening"]
+        return 3, []
 
-    return {"score": score, "notes": notes}
+    return _apply_rules(_GREETING_RULES, response, language, formality)
 
 
-def _evaluate_formality_match(response: str, language: str, formality: str) -> Dict:
-    """Evaluate formality match."""
+def _evaluate_formality_match(
+    response: str,
+    response_lower: str,
+    language: str,
+    formality: str
+) -> Tuple[int, List[str]]:
+    """Evaluate formality match (response_lower: the lowercased response); returns (score, notes)."""
     score = 3
     notes = []
 
     if language == "de":
         has_sie = "Sie" in response
-        has_du = "du" in response.lower()
+        has_du = "du" in response_lower
 
         if formality in ["formal", "neutral"]:
             if has_sie and not has_du:
@@ -216,8 +240,8 @@ def _evaluate_formality_match(response: str, language: str, formality: str) -> D
                 notes.append("Perfect: Uses 'du' for casual tone")
 
     elif language == "es":
-        has_usted = "usted" in response.lower()
-        has_tu = "tú" in response.lower()
+        has_usted = "usted" in response_lower
+        has_tu = "tú" in response_lower
 
         if formality in ["formal", "neutral"]:
             if has_usted and not has_tu:
@@ -231,11 +255,11 @@ def _evaluate_formality_match(response: str, language: str, formality: str) -> D
                 score = 5
                 notes.append("Perfect: Uses 'tú' for casual tone")
 
-    return {"score": score, "notes": notes}
+    return score, notes
 
 
-def _evaluate_cultural_markers(response: str, language: str, domain: str) -> Dict:
-    """Evaluate presence of cultural markers."""
+def _evaluate_cultural_markers(response: str, language: str, domain: str) -> Tuple[int, List[str]]:
+    """Evaluate presence of cultural markers; returns (score, notes)."""
     score = 3
     notes = []
 
@@ -256,39 +280,25 @@ def _evaluate_cultural_markers(response: str, language: str, domain: str) -> Dic
             notes.append("Good: Direct and structured (German cultural preference)")
 
     score = min(score, 5)  # Cap at 5
-    return {"score": score, "notes": notes}
-
-
-def _evaluate_closing(response: str, language: str, formality: str) -> Dict:
-    """Evaluate closing appropriateness."""
-    score = 3
-    notes = []
+    return score, notes
 
-    if language == "de":
-        if formality == "formal" and "Hochachtungsvoll" in response:
-            score = 5
-            notes.append("Excellent: Very formal German closing")
-        elif "freundlichen Grüßen" in response:
-            score = 4
-            notes.append("Good: Standard professional closing")
-        elif formality == "casual" and "Viele Grüße" in response:
-            score = 5
-            notes.append("Excellent: Casual closing matches formality")
 
-    elif language == "es":
-        if formality == "formal" and ("Cordialmente" in response or "Atentamente" in response):
-            score = 5
-            notes.append("Excellent: Formal Spanish closing")
-        elif "Saludos" in response and formality == "casual":
-            score = 5
-            notes.append("Excellent: Casual closing matches formality")
+def _evaluate_closing(response: str, language: str, formality: str) -> Tuple[int, List[str]]:
+    """Evaluate closing appropriateness; returns (score, notes)."""
+    return _apply_rules(_CLOSING_RULES, response, language, formality)
 
-    elif language == "en":
-        if formality == "formal" and "Sincerely" in response:
-            score = 5
-            notes.append("Excellent: Formal English closing")
 
-    return {"score": score, "notes": notes}
+def _apply_rules(
+    rules: Dict[Tuple[str, str], List[Tuple[Tuple[str, ...], int, str]]],
+    response: str,
+    language: str,
+    formality: str
+) -> Tuple[int, List[str]]:
+    """Score a response by the first rule whose markers occur in it (default: adequate)."""
+    for markers, score, note in rules.get((language, formality), ()):
+        if any(marker in response for marker in markers):
+            return score, [note]
+    return 3, []
 
 
 def _score_to_rating(score: float) -> str:
@@ -329,3 +339,35 @@ def calculate_all_qualitative_metrics(
             response, language, formality, domain
         )
     }
+
+
+def _qualitative_worker(item: Tuple[str, str, str, str]) -> Dict[str, any]:
+    """Process-pool worker: unpack one (response, language, formality, domain) item."""
+    response, language, formality, domain = item
+    return calculate_all_qualitative_metrics(response, language, formality, domain)
+
+
+def calculate_batch_qualitative(
+    items: List[Tuple[str, str, str, str]],
+    n_process: Optional[int] = None
+) -> List[Dict[str, any]]:
+    """
+    Calculate all qualitative metrics for many responses in parallel.
+
+    Readability scoring and the rubric checks are CPU-bound Python, so
+    responses are spread over worker processes (threads would serialize on
+    the GIL).
+
+    Args:
+        items: (response, language, formality, domain) tuples
+        n_process: Number of worker processes (default: one per CPU);
+            1 computes serially in this process
+
+    Returns:
+        One metrics dictionary per item, in input order
+    """
+    if n_process == 1 or len(items) < 2:
+        return [_qualitative_worker(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=n_process) as executor:
+        return list(executor.map(_qualitative_worker, items, chunksize=16))
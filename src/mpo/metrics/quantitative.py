@@ -5,12 +5,69 @@ Provides numerical measurements of prompt responses including
 token efficiency, length statistics, and basic NLP metrics.
 """
 
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import re
 from collections import Counter
 
-
-def calculate_token_efficiency(response: str, tokens_output: int) -> Dict[str, float]:
+# Patterns compiled once at import instead of per call
+_RE_SENT = re.compile(r'[.!?]+')
+_RE_WORD = re.compile(r'\b\w+\b')
+_RE_SIE = re.compile(r'\bSie\b')
+# Case-insensitive patterns are matched case-sensitively against the
+# lowercased text, which is computed once per response
+_RE_DU_CS = re.compile(r'\bdu\b')
+_RE_USTED_CS = re.compile(r'\busted\b')
+_RE_TU_CS = re.compile(r'\btú\b')
+_RE_BULLET = re.compile(r'[\n\r]\s*[-•*]\s+')
+_RE_NUMLIST = re.compile(r'[\n\r]\s*\d+[\.)]\s+')
+
+# Openings counted as a greeting by analyze_structural_features (prefix match)
+_GREETING_PREFIXES = ('Hello', 'Hi', 'Dear', 'Hola', 'Guten Tag', 'Buenos días')
+
+# Closings counted by analyze_structural_features (lowercase, substring match)
+_CLOSING_WORDS = ('sincerely', 'best', 'regards', 'saludos', 'grüße', 'cordialmente')
+
+# Simple positive/negative word lists (lowercase, matched against whole words)
+_POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'wonderful', 'fantastic', 'amazing',
+    'helpful', 'beneficial', 'valuable', 'effective', 'successful',
+    'bien', 'excelente', 'maravilloso', 'fantástico', 'útil',  # Spanish
+    'gut', 'großartig', 'wunderbar', 'hilfreich', 'effektiv'  # German
+})
+
+_NEGATIVE_WORDS = frozenset({
+    'bad', 'poor', 'terrible', 'awful', 'horrible', 'difficult',
+    'problem', 'issue', 'error', 'fail', 'unfortunately',
+    'malo', 'terrible', 'problema', 'error', 'desafortunadamente',  # Spanish
+    'schlecht', 'furchtbar', 'problem', 'fehler', 'schwierig'  # German
+})
+
+
+class _TextView(NamedTuple):
+    """Tokenizations of one response, shared by the metric functions."""
+    words: List[str]       # Whitespace-separated words
+    tokens: List[str]      # Lowercase \w+ tokens
+    sentence_count: int    # Non-empty segments between . ! ?
+    lower: str             # Lowercased response for case-insensitive checks
+
+
+def _build_view(response: str) -> _TextView:
+    """Tokenize a response once for all quantitative metrics."""
+    lower = response.lower()
+    return _TextView(
+        words=response.split(),
+        tokens=_RE_WORD.findall(lower),
+        sentence_count=sum(1 for s in _RE_SENT.split(response) if s.strip()),
+        lower=lower
+    )
+
+
+def calculate_token_efficiency(
+    response: str,
+    tokens_output: int,
+    _view: Optional[_TextView] = None
+) -> Dict[str, float]:
     """
     Calculate token efficiency metrics.
 
@@ -21,13 +78,14 @@ def calculate_token_efficiency(response: str, tokens_output: int) -> Dict[str, f
     Returns:
         Dictionary with efficiency metrics
     """
+    if _view is None:
+        _view = _build_view(response)
+
     # Count sentences (approximate)
-    sentences = [s.strip() for s in re.split(r'[.!?]+', response) if s.strip()]
-    num_sentences = len(sentences)
+    num_sentences = _view.sentence_count
 
     # Count words
-    words = response.split()
-    num_words = len(words)
+    num_words = len(_view.words)
 
     # Calculate metrics
     metrics = {
@@ -42,7 +100,7 @@ def calculate_token_efficiency(response: str, tokens_output: int) -> Dict[str, f
     return metrics
 
 
-def calculate_length_metrics(response: str) -> Dict[str, int]:
+def calculate_length_metrics(response: str, _view: Optional[_TextView] = None) -> Dict[str, int]:
     """
     Calculate length-based metrics.
 
@@ -52,18 +110,20 @@ def calculate_length_metrics(response: str) -> Dict[str, int]:
     Returns:
         Dictionary with length metrics
     """
+    words = _view.words if _view is not None else response.split()
+
     metrics = {
         "char_count": len(response),
-        "char_count_no_spaces": len(response.replace(" ", "")),
-        "word_count": len(response.split()),
-        "line_count": len(response.split('\n')),
+        "char_count_no_spaces": len(response) - response.count(" "),
+        "word_count": len(words),
+        "line_count": response.count('\n') + 1,
         "paragraph_count": len([p for p in response.split('\n\n') if p.strip()])
     }
 
     return metrics
 
 
-def calculate_lexical_diversity(response: str) -> Dict[str, float]:
+def calculate_lexical_diversity(response: str, _view: Optional[_TextView] = None) -> Dict[str, float]:
     """
     Calculate lexical diversity metrics.
 
@@ -74,7 +134,7 @@ def calculate_lexical_diversity(response: str) -> Dict[str, float]:
         Dictionary with diversity metrics
     """
     # Tokenize (simple word-based)
-    words = re.findall(r'\b\w+\b', response.lower())
+    words = _view.tokens if _view is not None else _RE_WORD.findall(response.lower())
 
     if not words:
         return {
@@ -83,15 +143,15 @@ def calculate_lexical_diversity(response: str) -> Dict[str, float]:
             "total_words": 0
         }
 
-    # Count unique words
-    unique_words = len(set(words))
+    # Count unique words (the frequency table doubles as the unique set)
+    word_freq = Counter(words)
+    unique_words = len(word_freq)
     total_words = len(words)
 
     # Type-Token Ratio (TTR)
     ttr = unique_words / total_words if total_words > 0 else 0.0
 
-    # Most common words
-    word_freq = Counter(words)
+    # Most common words (most_common(n) is a bounded heap, not a full sort)
     most_common = word_freq.most_common(10)
 
     metrics = {
@@ -104,7 +164,11 @@ def calculate_lexical_diversity(response: str) -> Dict[str, float]:
     return metrics
 
 
-def detect_formality_markers(response: str, language: str) -> Dict[str, any]:
+def detect_formality_markers(
+    response: str,
+    language: str,
+    _view: Optional[_TextView] = None
+) -> Dict[str, any]:
     """
     Detect formality markers in response.
 
@@ -120,11 +184,15 @@ def detect_formality_markers(response: str, language: str) -> Dict[str, any]:
         "detected_markers": []
     }
 
+    # The pronoun regexes scan the whole text in Python-level matching, so they
+    # only run when a C-level substring test (on the lowercased text for the
+    # case-insensitive ones) shows a match is possible at all
     if language == "de":
         # German formality markers
-        if re.search(r'\bSie\b', response):
+        lower = _view.lower if _view is not None else response.lower()
+        if "Sie" in response and _RE_SIE.search(response):
             markers["detected_markers"].append("formal_pronoun_Sie")
-        if re.search(r'\bdu\b', response, re.IGNORECASE):
+        if "du" in lower and _RE_DU_CS.search(lower):
             markers["detected_markers"].append("casual_pronoun_du")
         if "Sehr geehrte" in response:
             markers["detected_markers"].append("very_formal_greeting")
@@ -135,9 +203,10 @@ def detect_formality_markers(response: str, language: str) -> Dict[str, any]:
 
     elif language == "es":
         # Spanish formality markers
-        if re.search(r'\busted\b', response, re.IGNORECASE):
+        lower = _view.lower if _view is not None else response.lower()
+        if "usted" in lower and _RE_USTED_CS.search(lower):
             markers["detected_markers"].append("formal_pronoun_usted")
-        if re.search(r'\btú\b', response, re.IGNORECASE):
+        if "tú" in lower and _RE_TU_CS.search(lower):
             markers["detected_markers"].append("casual_pronoun_tu")
         if "Estimado" in response or "Estimada" in response:
             markers["detected_markers"].append("formal_greeting")
@@ -161,7 +230,7 @@ def detect_formality_markers(response: str, language: str) -> Dict[str, any]:
     return markers
 
 
-def calculate_sentiment_basic(response: str) -> Dict[str, any]:
+def calculate_sentiment_basic(response: str, _view: Optional[_TextView] = None) -> Dict[str, any]:
     """
     Calculate basic sentiment indicators.
 
@@ -174,26 +243,12 @@ def calculate_sentiment_basic(response: str) -> Dict[str, any]:
     Returns:
         Dictionary with sentiment metrics
     """
-    response_lower = response.lower()
-
-    # Simple positive/negative word lists
-    positive_words = {
-        'good', 'great', 'excellent', 'wonderful', 'fantastic', 'amazing',
-        'helpful', 'beneficial', 'valuable', 'effective', 'successful',
-        'bien', 'excelente', 'maravilloso', 'fantástico', 'útil',  # Spanish
-        'gut', 'großartig', 'wunderbar', 'hilfreich', 'effektiv'  # German
-    }
+    words = _view.tokens if _view is not None else _RE_WORD.findall(response.lower())
 
-    negative_words = {
-        'bad', 'poor', 'terrible', 'awful', 'horrible', 'difficult',
-        'problem', 'issue', 'error', 'fail', 'unfortunately',
-        'malo', 'terrible', 'problema', 'error', 'desafortunadamente',  # Spanish
-        'schlecht', 'furchtbar', 'Problem', 'Fehler', 'schwierig'  # German
-    }
-
-    # Count occurrences
-    pos_count = sum(1 for word in positive_words if word in response_lower)
-    neg_count = sum(1 for word in negative_words if word in response_lower)
+    # Count distinct sentiment words present (whole words, so "badge" is not "bad")
+    word_set = set(words)
+    pos_count = len(word_set & _POSITIVE_WORDS)
+    neg_count = len(word_set & _NEGATIVE_WORDS)
 
     # Calculate polarity
     total = pos_count + neg_count
@@ -210,7 +265,7 @@ def calculate_sentiment_basic(response: str) -> Dict[str, any]:
     }
 
 
-def analyze_structural_features(response: str) -> Dict[str, any]:
+def analyze_structural_features(response: str, _view: Optional[_TextView] = None) -> Dict[str, any]:
     """
     Analyze structural features of the response.
 
@@ -221,8 +276,9 @@ def analyze_structural_features(response: str) -> Dict[str, any]:
         Dictionary with structural metrics
     """
     # Check for common structural elements
-    has_greeting = bool(re.search(r'^(Hello|Hi|Dear|Hola|Guten Tag|Buenos días)', response))
-    has_closing = bool(re.search(r'(Sincerely|Best|Regards|Saludos|Grüße|Cordialmente)', response, re.IGNORECASE))
+    has_greeting = response.startswith(_GREETING_PREFIXES)
+    lower = _view.lower if _view is not None else response.lower()
+    has_closing = any(word in lower for word in _CLOSING_WORDS)
 
     # Count questions
     question_marks = response.count('?')
@@ -233,8 +289,8 @@ def analyze_structural_features(response: str) -> Dict[str, any]:
     exclamations_es = response.count('¡')  # Spanish opening exclamation
 
     # Detect lists or bullet points
-    has_bullets = bool(re.search(r'[\n\r]\s*[-•*]\s+', response))
-    has_numbers = bool(re.search(r'[\n\r]\s*\d+[\.)]\s+', response))
+    has_bullets = bool(_RE_BULLET.search(response))
+    has_numbers = bool(_RE_NUMLIST.search(response))
 
     return {
         "has_greeting": has_greeting,
@@ -263,11 +319,45 @@ def calculate_all_quantitative_metrics(
     Returns:
         Dictionary with all quantitative metrics
     """
+    # Tokenize once; every word- and sentence-based metric reuses the view
+    view = _build_view(response)
+
     return {
-        "token_efficiency": calculate_token_efficiency(response, tokens_output),
-        "length_metrics": calculate_length_metrics(response),
-        "lexical_diversity": calculate_lexical_diversity(response),
-        "formality_markers": detect_formality_markers(response, language),
-        "sentiment": calculate_sentiment_basic(response),
-        "structural_features": analyze_structural_features(response)
+        "token_efficiency": calculate_token_efficiency(response, tokens_output, view),
+        "length_metrics": calculate_length_metrics(response, view),
+        "lexical_diversity": calculate_lexical_diversity(response, view),
+        "formality_markers": detect_formality_markers(response, language, view),
+        "sentiment": calculate_sentiment_basic(response, view),
+        "structural_features": analyze_structural_features(response, view)
     }
+
+
+def _quantitative_worker(item: Tuple[str, int, str]) -> Dict[str, any]:
+    """Process-pool worker: unpack one (response, tokens_output, language) item."""
+    response, tokens_output, language = item
+    return calculate_all_quantitative_metrics(response, tokens_output, language)
+
+
+def calculate_batch_quantitative(
+    items: List[Tuple[str, int, str]],
+    n_process: Optional[int] = None
+) -> List[Dict[str, any]]:
+    """
+    Calculate all quantitative metrics for many responses in parallel.
+
+    The metrics are pure, CPU-bound Python, so responses are spread over
+    worker processes (threads would serialize on the GIL).
+
+    Args:
+        items: (response, tokens_output, language) tuples
+        n_process: Number of worker processes (default: one per CPU);
+            1 computes serially in this process
+
+    Returns:
+        One metrics dictionary per item, in input order
+    """
+    if n_process == 1 or len(items) < 2:
+        return [_quantitative_worker(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=n_process) as executor:
+        return list(executor.map(_quantitative_worker, items, chunksize=16))
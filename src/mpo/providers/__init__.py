@@ -1,11 +1,24 @@
 """
 LLM provider implementations.
+
+Provider classes are imported lazily (PEP 562), so importing the abstract
+interface from .base does not load every provider SDK.
 """
 
+from importlib import import_module
+
 from .base import AbstractLLMProvider, GenerationConfig
-from .anthropic_provider import AnthropicProvider, MockAnthropicProvider
-from .openai_provider import OpenAIProvider, MockOpenAIProvider
-from .local_provider import LocalLLMProvider
+
+# Provider class -> submodule that defines it (resolved on first access)
+_LAZY_IMPORTS = {
+    "AnthropicProvider": ".anthropic_provider",
+    "MockAnthropicProvider": ".anthropic_provider",
+    "OpenAIProvider": ".openai_provider",
+    "MockOpenAIProvider": ".openai_provider",
+    "LocalLLMProvider": ".local_provider",
+    "AsyncRateLimiter": ".rate_limit",
+    "CachedProvider": ".cached",
+}
 
 __all__ = [
     "AbstractLLMProvider",
@@ -15,4 +28,22 @@ __all__ = [
     "OpenAIProvider",
     "MockOpenAIProvider",
     "LocalLLMProvider",
+    "AsyncRateLimiter",
+    "CachedProvider",
 ]
+
+
+def __getattr__(name: str):
+    """Import provider classes on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,13 +5,19 @@ This module wraps the Anthropic API for text generation and embeddings,
 following the AbstractLLMProvider interface.
 """
 
+import asyncio
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterator, List, Optional, TYPE_CHECKING
 
-from anthropic import Anthropic
-from .base import AbstractLLMProvider, GenerationConfig
-from ..constants import CHARS_PER_TOKEN_ESTIMATE
+from .base import AbstractLLMProvider, GenerationConfig, mock_embedding
+from .http import get_shared_async_http_client, get_shared_http_client
+from ..constants import API_MAX_RETRIES, CHARS_PER_TOKEN_ESTIMATE
+from ..core.clock import utc_now_iso
+
+if TYPE_CHECKING:
+    import httpx
+    from anthropic import AsyncAnthropic
 
 
 class AnthropicProvider(AbstractLLMProvider):
@@ -25,7 +31,8 @@ class AnthropicProvider(AbstractLLMProvider):
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        http_client: Optional["httpx.Client"] = None
     ):
         """
         Initialize Anthropic provider.
@@ -33,6 +40,9 @@ class AnthropicProvider(AbstractLLMProvider):
         Args:
             api_key: Anthropic API key (if None, reads from ANTHROPIC_API_KEY env var)
             model_name: Model identifier (defaults to claude-sonnet-4)
+            http_client: Optional externally owned HTTP client; the caller
+                closes it. Defaults to the process-wide pooled client from
+                providers.http, shared by all provider instances.
         """
         super().__init__(api_key, model_name)
 
@@ -45,8 +55,18 @@ class AnthropicProvider(AbstractLLMProvider):
                 "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Initialize Anthropic client
-        self.client = Anthropic(api_key=self.api_key)
+        # Initialize Anthropic client (SDK imported here, so the mock provider
+        # in this module never loads it)
+        from anthropic import Anthropic
+        self.client = Anthropic(
+            api_key=self.api_key,
+            http_client=http_client or get_shared_http_client(),
+            max_retries=API_MAX_RETRIES
+        )
+
+        # Native async client for agenerate(), created on first use
+        self._async_client: Optional["AsyncAnthropic"] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Set model
         self.model_name = model_name or self.default_model
@@ -65,6 +85,7 @@ class AnthropicProvider(AbstractLLMProvider):
         self,
         prompt: str,
         config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Dict:
         """
@@ -73,6 +94,42 @@ class AnthropicProvider(AbstractLLMProvider):
         Args:
             prompt: Input prompt text
             config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional Anthropic-specific parameters
+
+        Returns:
+            Dictionary with generated content and metadata
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            # Call Anthropic API
+            response = self.client.messages.create(**api_params)
+            return self._build_result(response, config)
+
+        except Exception as e:
+            raise Exception(f"Anthropic API call failed: {str(e)}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Generate text using the native async Claude client.
+
+        Unlike the base implementation, no worker thread is tied up per
+        in-flight request, so many calls can be awaited concurrently.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
             **kwargs: Additional Anthropic-specific parameters
 
         Returns:
@@ -81,7 +138,70 @@ class AnthropicProvider(AbstractLLMProvider):
         if config is None:
             config = GenerationConfig()
 
-        # Prepare API parameters
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            response = await self._get_async_client().messages.create(**api_params)
+            return self._build_result(response, config)
+
+        except Exception as e:
+            raise Exception(f"Anthropic API call failed: {str(e)}") from e
+
+    def _get_async_client(self) -> "AsyncAnthropic":
+        """Return the async client for the running event loop, creating it if needed."""
+        # An async HTTP connection pool belongs to the loop it was created on,
+        # so a new loop (e.g. another asyncio.run()) gets a new client
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from anthropic import AsyncAnthropic
+            self._async_client = AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=get_shared_async_http_client(),
+                max_retries=API_MAX_RETRIES
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def stream_generate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream text from the Claude API as it is generated.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional Anthropic-specific parameters
+
+        Yields:
+            Text deltas in generation order
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            with self.client.messages.stream(**api_params) as stream:
+                for text in stream.text_stream:
+                    yield text
+
+        except Exception as e:
+            raise Exception(f"Anthropic API call failed: {str(e)}") from e
+
+    def _build_api_params(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """Build Messages API parameters shared by online and batch requests."""
         api_params = {
             "model": self.model_name,
             "max_tokens": config.max_tokens,
@@ -92,43 +212,102 @@ class AnthropicProvider(AbstractLLMProvider):
             ]
         }
 
+        # Static system prompt marked as a cacheable prefix
+        if system_prompt:
+            api_params["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
         # Add stop sequences if provided
         if config.stop_sequences:
-            api_params["stop_sequences"] = config.stop_sequences
+            api_params["stop_sequences"] = list(config.stop_sequences)
 
         # Override with any additional kwargs
         api_params.update(kwargs)
+        return api_params
 
-        try:
-            # Call Anthropic API
-            response = self.client.messages.create(**api_params)
+    def _build_result(self, response, config: GenerationConfig) -> Dict:
+        """Convert an Anthropic Message into the provider-neutral result dictionary."""
+        # Extract content (Claude returns list of content blocks)
+        content = response.content[0].text
+
+        # Get token counts
+        tokens_input = response.usage.input_tokens
+        tokens_output = response.usage.output_tokens
 
-            # Extract content (Claude returns list of content blocks)
-            content = response.content[0].text
-
-            # Get token counts
-            tokens_input = response.usage.input_tokens
-            tokens_output = response.usage.output_tokens
-
-            # Build response dictionary
-            result = {
-                "content": content,
-                "tokens_input": tokens_input,
-                "tokens_output": tokens_output,
-                "model": response.model,
-                "timestamp": datetime.utcnow().isoformat(),
-                "metadata": {
-                    "stop_reason": response.stop_reason,
-                    "stop_sequence": response.stop_sequence,
-                    "provider": self.provider_name,
-                    "config": config.to_dict()
-                }
+        return {
+            "content": content,
+            "tokens_input": tokens_input,
+            "tokens_output": tokens_output,
+            "model": response.model,
+            "timestamp": utc_now_iso(),
+            "metadata": {
+                "stop_reason": response.stop_reason,
+                "stop_sequence": response.stop_sequence,
+                "provider": self.provider_name,
+                "config": config.to_dict(),
+                # Prompt cache usage (input tokens read from / written to the cache)
+                "cache_read_input_tokens": getattr(response.usage, "cache_read_input_tokens", None) or 0,
+                "cache_creation_input_tokens": getattr(response.usage, "cache_creation_input_tokens", None) or 0
             }
+        }
+
+    def submit_batch(
+        self,
+        prompts: Dict[str, str],
+        config: Optional[GenerationConfig] = None,
+        poll_interval: float = 30.0,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Generate responses through the Anthropic Message Batches API.
 
-            return result
+        Submits one Messages request per prompt, polls until processing has
+        ended and collects the succeeded results by custom_id. Request IDs
+        must match Anthropic's custom_id format (letters, digits, '_' and
+        '-', at most 64 characters).
+
+        Args:
+            prompts: Mapping of request IDs (used as custom_id) to prompt text
+            config: Generation configuration shared by all requests
+            poll_interval: Seconds between batch status checks
+            system_prompt: Optional static instructions shared by all requests
+
+        Returns:
+            Mapping of request ID to a dictionary in the generate() format
+
+        Raises:
+            Exception: If the batch cannot be submitted or polled
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        requests = [
+            {"custom_id": request_id, "params": self._build_api_params(prompt, config, system_prompt)}
+            for request_id, prompt in prompts.items()
+        ]
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            results = {}
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    continue
+                result = self._build_result(entry.result.message, config)
+                result["metadata"]["batch_id"] = batch.id
+                results[entry.custom_id] = result
+
+            return results
 
         except Exception as e:
-            raise Exception(f"Anthropic API call failed: {str(e)}")
+            raise Exception(f"Anthropic batch API call failed: {str(e)}") from e
 
     def get_embeddings(self, text: str) -> List[float]:
         """
@@ -171,6 +350,18 @@ class AnthropicProvider(AbstractLLMProvider):
         # More accurate: use tiktoken or Anthropic's tokenization if available
         return len(text) // CHARS_PER_TOKEN_ESTIMATE
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in many texts with the same approximation as count_tokens().
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Approximate token count per text, in input order
+        """
+        return [len(text) // CHARS_PER_TOKEN_ESTIMATE for text in texts]
+
     def is_available(self) -> bool:
         """Check if provider is configured and available."""
         return self.api_key is not None
@@ -229,6 +420,7 @@ class MockAnthropicProvider(AbstractLLMProvider):
         self,
         prompt: str,
         config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Dict:
         """Generate mock response."""
@@ -249,7 +441,7 @@ class MockAnthropicProvider(AbstractLLMProvider):
             content += "In production, Claude would generate a culturally-appropriate response here."
 
         # Mock token counts (approximate)
-        tokens_input = len(prompt) // 4
+        tokens_input = (len(prompt) + len(system_prompt or "")) // 4
         tokens_output = len(content) // 4
 
         return {
@@ -257,7 +449,7 @@ class MockAnthropicProvider(AbstractLLMProvider):
             "tokens_input": tokens_input,
             "tokens_output": tokens_output,
             "model": self.model_name,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "metadata": {
                 "stop_reason": "end_turn",
                 "stop_sequence": None,
@@ -270,12 +462,13 @@ class MockAnthropicProvider(AbstractLLMProvider):
 
     def get_embeddings(self, text: str) -> List[float]:
         """Return mock embeddings."""
-        # Return a simple hash-based vector for testing
-        import hashlib
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        # Convert hex to list of floats (384-dim like Voyage AI)
-        return [float(int(text_hash[i:i+2], 16)) / 255.0 for i in range(0, 32, 2)] * 24
+        # Simple hash-based vector for testing (384-dim like Voyage AI)
+        return mock_embedding(text, 384)
 
     def count_tokens(self, text: str) -> int:
         """Mock token counting."""
         return len(text) // CHARS_PER_TOKEN_ESTIMATE
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Mock token counting for many texts (one comprehension, no per-text call)."""
+        return [len(text) // CHARS_PER_TOKEN_ESTIMATE for text in texts]
@@ -5,29 +5,54 @@ This module defines the contract that all LLM providers must implement,
 allowing easy swapping between different models (Claude, GPT-4, etc.).
 """
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 
+from ..constants import DEFAULT_MAX_CONCURRENCY
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class GenerationConfig:
-    """Configuration for LLM text generation."""
+    """
+    Configuration for LLM text generation.
+
+    Immutable (and therefore hashable), so one config can be shared across
+    threads, batches and cache keys. stop_sequences accepts any iterable of
+    strings (e.g. a list from models.yaml) and is stored as a tuple.
+    """
     temperature: float = 0.7
     max_tokens: int = 1024
     top_p: float = 1.0
-    stop_sequences: List[str] = None
+    stop_sequences: Tuple[str, ...] = ()
+    _dict: Dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normalize stop_sequences and build the to_dict() result once."""
+        if not isinstance(self.stop_sequences, tuple):
+            object.__setattr__(self, "stop_sequences", tuple(self.stop_sequences or ()))
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for API calls."""
         config = {
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
             "top_p": self.top_p
         }
         if self.stop_sequences:
-            config["stop_sequences"] = self.stop_sequences
-        return config
+            config["stop_sequences"] = list(self.stop_sequences)
+        object.__setattr__(self, "_dict", config)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to dictionary for API calls.
+
+        Providers embed this in the metadata of every result, so the
+        dictionary is built once per config. It is shared between callers
+        and must be treated as read-only.
+        """
+        return self._dict
 
 
 class AbstractLLMProvider(ABC):
@@ -56,6 +81,7 @@ class AbstractLLMProvider(ABC):
         self,
         prompt: str,
         config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Dict:
         """
@@ -64,6 +90,9 @@ class AbstractLLMProvider(ABC):
         Args:
             prompt: Input prompt text
             config: Generation configuration (temperature, max_tokens, etc.)
+            system_prompt: Optional static instructions sent ahead of the prompt.
+                Keeping them byte-identical across calls lets providers reuse
+                their prompt cache for this prefix.
             **kwargs: Provider-specific additional parameters
 
         Returns:
@@ -82,6 +111,197 @@ class AbstractLLMProvider(ABC):
         """
         pass
 
+    async def agenerate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Asynchronously generate text response from prompt.
+
+        The default implementation runs the blocking generate() call in a
+        worker thread, so every provider can take part in concurrent
+        workloads. Providers with a native async client should override it.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration (temperature, max_tokens, etc.)
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Provider-specific additional parameters
+
+        Returns:
+            Same dictionary structure as generate()
+
+        Raises:
+            Exception: If API call fails
+        """
+        return await asyncio.to_thread(self.generate, prompt, config, system_prompt, **kwargs)
+
+    async def agenerate_batch(
+        self,
+        prompts: List[str],
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Dict]:
+        """
+        Asynchronously generate responses for many prompts.
+
+        Awaits agenerate() for every prompt with asyncio.gather, keeping at
+        most concurrency requests in flight, so total time approaches the
+        slowest batch of calls instead of the sum of all calls.
+
+        Args:
+            prompts: Input prompt texts
+            config: Generation configuration shared by all prompts
+            system_prompt: Optional static instructions sent ahead of every prompt
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One result dictionary per prompt, in input order
+
+        Raises:
+            ValueError: If concurrency < 1
+            Exception: If any API call fails
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(prompt: str) -> Dict:
+            async with semaphore:
+                return await self.agenerate(prompt, config, system_prompt)
+
+        return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Dict]:
+        """
+        Generate responses for many prompts concurrently.
+
+        Synchronous wrapper around agenerate_batch(). Must not be called from
+        a running event loop; await agenerate_batch() directly there.
+
+        Args:
+            prompts: Input prompt texts
+            config: Generation configuration shared by all prompts
+            system_prompt: Optional static instructions sent ahead of every prompt
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One result dictionary per prompt, in input order
+
+        Raises:
+            ValueError: If concurrency < 1
+            Exception: If any API call fails
+        """
+        return asyncio.run(self.agenerate_batch(prompts, config, system_prompt, concurrency))
+
+    def stream_generate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate text and yield it in chunks as it is produced.
+
+        Total generation time is unchanged, but callers can show output from
+        the first token instead of waiting for the full response. The
+        default implementation yields the complete generate() output as a
+        single chunk; providers with a streaming API override it.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration (temperature, max_tokens, etc.)
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Provider-specific additional parameters
+
+        Yields:
+            Successive pieces of the generated text
+
+        Raises:
+            Exception: If API call fails
+        """
+        yield self.generate(prompt, config, system_prompt, **kwargs)["content"]
+
+    async def astream(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronous counterpart of stream_generate().
+
+        The default implementation pulls each chunk of the blocking
+        stream_generate() iterator in a worker thread.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration (temperature, max_tokens, etc.)
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Provider-specific additional parameters
+
+        Yields:
+            Successive pieces of the generated text
+
+        Raises:
+            Exception: If API call fails
+        """
+        chunks = self.stream_generate(prompt, config, system_prompt, **kwargs)
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, done)
+            if chunk is done:
+                break
+            yield chunk
+
+    def submit_batch(
+        self,
+        prompts: Dict[str, str],
+        config: Optional[GenerationConfig] = None,
+        poll_interval: float = 30.0,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Generate responses for many prompts as one offline batch job.
+
+        Providers with a native Batch API (cheaper, higher throughput, but
+        asynchronous with a completion window of hours) override this. The
+        default implementation simply calls generate() for each prompt.
+
+        Args:
+            prompts: Mapping of caller-chosen request IDs to prompt text
+            config: Generation configuration shared by all requests
+            poll_interval: Seconds between batch status checks
+            system_prompt: Optional static instructions shared by all requests
+
+        Returns:
+            Mapping of request ID to a dictionary in the generate() format.
+            Requests that failed inside the batch are omitted.
+
+        Raises:
+            Exception: If the batch job itself cannot be submitted or fails
+        """
+        results = {}
+        for request_id, prompt in prompts.items():
+            try:
+                results[request_id] = self.generate(prompt, config, system_prompt)
+            except Exception:
+                continue
+        return results
+
     @abstractmethod
     def get_embeddings(self, text: str) -> List[float]:
         """
@@ -98,6 +318,25 @@ class AbstractLLMProvider(ABC):
         """
         pass
 
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embedding vectors for many texts.
+
+        The default implementation calls get_embeddings() for each text;
+        providers whose embeddings API accepts several inputs per request
+        override it.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            One embedding vector per text, in input order
+
+        Raises:
+            Exception: If API call fails
+        """
+        return [self.get_embeddings(text) for text in texts]
+
     @abstractmethod
     def count_tokens(self, text: str) -> int:
         """
@@ -114,6 +353,21 @@ class AbstractLLMProvider(ABC):
         """
         pass
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in many texts.
+
+        The default implementation calls count_tokens() for each text;
+        providers with a batch tokenizer override it.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Token count per text, in input order
+        """
+        return [self.count_tokens(text) for text in texts]
+
     def is_available(self) -> bool:
         """
         Check if provider is properly configured and available.
@@ -134,3 +388,31 @@ class AbstractLLMProvider(ABC):
     def default_model(self) -> str:
         """Return the default model identifier for this provider."""
         pass
+
+
+def mock_embedding(text: str, dimensions: int) -> List[float]:
+    """
+    Deterministic hash-based embedding used by the mock providers.
+
+    The 16 BLAKE2b digest bytes, scaled to [0, 1], are repeated up to the
+    requested dimensionality. Vectors are memoized per text, since tests and
+    demo runs embed the same prompts over and over.
+
+    Args:
+        text: Text to embed
+        dimensions: Length of the returned vector
+
+    Returns:
+        Embedding vector (a fresh list the caller may modify)
+    """
+    return list(_mock_embedding_cached(text, dimensions))
+
+
+@lru_cache(maxsize=2048)
+def _mock_embedding_cached(text: str, dimensions: int) -> Tuple[float, ...]:
+    """Build the mock embedding for a text (memoized)."""
+    # Raw digest bytes: no hex string formatting and re-parsing. BLAKE2b is
+    # faster than MD5 at prompt-sized inputs (a few KB)
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    base_vector = tuple(byte / 255.0 for byte in digest)
+    return (base_vector * (dimensions // len(base_vector) + 1))[:dimensions]
@@ -0,0 +1,272 @@
+"""
+Exact-match result cache for LLM providers.
+
+CachedProvider wraps any provider and answers repeated requests (same model,
+prompt, system prompt and generation config) from memory or disk instead of
+the API: a SHA-256 lookup takes microseconds, an API round trip seconds.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from .base import AbstractLLMProvider, GenerationConfig
+from ..constants import MEMORY_CACHE_MAX_ENTRIES
+from ..core.clock import utc_now_iso
+from ..storage.serialization import read_json, write_json
+
+
+class CachedProvider(AbstractLLMProvider):
+    """
+    Provider wrapper that reuses results of identical generate() calls.
+
+    Only deterministic calls (temperature 0) are cached by default, since
+    sampled outputs are expected to vary between calls. Calls with extra
+    provider-specific keyword arguments always go to the wrapped provider.
+    Results are kept in an in-memory LRU layer and, if cache_dir is given,
+    persisted as one JSON file per request.
+
+    Usage:
+        provider = CachedProvider(AnthropicProvider(), cache_dir=CACHE_DIR / "provider_results")
+    """
+
+    def __init__(
+        self,
+        provider: AbstractLLMProvider,
+        cache_dir: Optional[Union[str, Path]] = None,
+        memory_cache_size: int = MEMORY_CACHE_MAX_ENTRIES,
+        cache_stochastic: bool = False
+    ):
+        """
+        Initialize cached provider.
+
+        Args:
+            provider: Provider whose results are cached
+            cache_dir: Optional directory for persisting results across runs
+            memory_cache_size: Maximum number of results kept in memory
+                (least recently used entries are evicted)
+            cache_stochastic: Also cache calls with temperature > 0
+        """
+        super().__init__(provider.api_key, provider.model_name)
+        self.provider = provider
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_stochastic = cache_stochastic
+        self.stats = {"hits": 0, "misses": 0}
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._memory_cache_size = memory_cache_size
+        self._memo: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()  # generate() may be called from worker threads
+
+    @property
+    def provider_name(self) -> str:
+        """Return the wrapped provider's name."""
+        return self.provider.provider_name
+
+    @property
+    def default_model(self) -> str:
+        """Return the wrapped provider's default model."""
+        return self.provider.default_model
+
+    def generate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Generate text, reusing the result of an identical earlier call.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Provider-specific parameters (bypass the cache)
+
+        Returns:
+            Dictionary with generated content and metadata; cached results
+            get a fresh timestamp and metadata["cache_hit"] = True
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        key = self._cache_key(prompt, config, system_prompt, kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        result = self.provider.generate(prompt, config, system_prompt, **kwargs)
+        self._put(key, result)
+        return result
+
+    async def agenerate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Asynchronous counterpart of generate().
+
+        Returns:
+            Same dictionary structure as generate()
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        key = self._cache_key(prompt, config, system_prompt, kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        result = await self.provider.agenerate(prompt, config, system_prompt, **kwargs)
+        self._put(key, result)
+        return result
+
+    def stream_generate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Stream from the wrapped provider (streams are not cached)."""
+        return self.provider.stream_generate(prompt, config, system_prompt, **kwargs)
+
+    def submit_batch(
+        self,
+        prompts: Dict[str, str],
+        config: Optional[GenerationConfig] = None,
+        poll_interval: float = 30.0,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Submit a batch job for the prompts that are not cached yet.
+
+        Returns:
+            Mapping of request ID to a dictionary in the generate() format
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        results = {}
+        pending = {}
+        keys = {}
+        for request_id, prompt in prompts.items():
+            key = self._cache_key(prompt, config, system_prompt, {})
+            cached = self._get(key)
+            if cached is not None:
+                results[request_id] = cached
+            else:
+                pending[request_id] = prompt
+                keys[request_id] = key
+
+        if pending:
+            fresh = self.provider.submit_batch(pending, config, poll_interval, system_prompt)
+            for request_id, result in fresh.items():
+                self._put(keys[request_id], result)
+            results.update(fresh)
+
+        return results
+
+    def get_embeddings(self, text: str) -> List[float]:
+        """Return embeddings from the wrapped provider."""
+        return self.provider.get_embeddings(text)
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for many texts from the wrapped provider."""
+        return self.provider.get_embeddings_batch(texts)
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the wrapped provider."""
+        return self.provider.count_tokens(text)
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens in many texts with the wrapped provider."""
+        return self.provider.count_tokens_batch(texts)
+
+    def is_available(self) -> bool:
+        """Check if the wrapped provider is available."""
+        return self.provider.is_available()
+
+    def clear(self) -> None:
+        """Drop all in-memory results (files in cache_dir are kept)."""
+        with self._lock:
+            self._memo.clear()
+
+    def _cache_key(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_prompt: Optional[str],
+        kwargs: Dict
+    ) -> Optional[str]:
+        """Build the SHA-256 key of a request, or None if it must not be cached."""
+        if kwargs or (config.temperature > 0 and not self.cache_stochastic):
+            return None
+        payload = json.dumps(
+            {
+                "model": self.provider.model_name or self.provider.default_model,
+                "prompt": prompt,
+                "system": system_prompt,
+                "config": config.to_dict()
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get(self, key: Optional[str]) -> Optional[Dict]:
+        """Return a copy of a cached result (memory first, then disk), or None."""
+        if key is None:
+            return None
+
+        with self._lock:
+            result = self._memo.get(key)
+            if result is not None:
+                self._memo.move_to_end(key)
+
+        if result is None and self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            if path.exists():
+                try:
+                    result = read_json(path)
+                except ValueError:
+                    # Unreadable file (e.g. cut off by a crash): regenerate it
+                    result = None
+                else:
+                    self._remember(key, result)
+
+        if result is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return {
+            **result,
+            "timestamp": utc_now_iso(),
+            "metadata": {**result.get("metadata", {}), "cache_hit": True}
+        }
+
+    def _put(self, key: Optional[str], result: Dict) -> None:
+        """Store a fresh result in memory and on disk."""
+        if key is None:
+            return
+        self._remember(key, result)
+        if self.cache_dir is not None:
+            write_json(self.cache_dir / f"{key}.json", result, atomic=True)
+
+    def _remember(self, key: str, result: Dict) -> None:
+        """Insert into the in-memory LRU layer, evicting the oldest entry if full."""
+        with self._lock:
+            self._memo[key] = result
+            self._memo.move_to_end(key)
+            if len(self._memo) > self._memory_cache_size:
+                self._memo.popitem(last=False)
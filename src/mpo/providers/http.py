@@ -0,0 +1,107 @@
+"""
+Shared HTTP connection pools for the provider SDK clients.
+
+Every provider SDK client otherwise opens its own connection pool, so each
+new provider instance (and each concurrent request beyond the pool's
+keep-alive set) pays a fresh TCP + TLS handshake. The clients returned here
+are created once per process (async clients once per event loop), speak
+HTTP/2 when the h2 package is installed and keep up to
+HTTP_MAX_KEEPALIVE_CONNECTIONS connections alive.
+"""
+
+import asyncio
+import importlib.util
+import threading
+from typing import Dict, Optional, TYPE_CHECKING
+
+from ..constants import (
+    HTTP_CONNECT_RETRIES,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_client: Optional["httpx.Client"] = None
+_async_clients: Dict[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = {}
+_lock = threading.Lock()
+
+
+def _import_httpx():
+    """Import httpx on first client creation (None if it is not installed)."""
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - the SDKs fall back to their own clients
+        return None
+    return httpx
+
+
+def _limits(httpx) -> "httpx.Limits":
+    """Connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+def _timeout(httpx) -> "httpx.Timeout":
+    """Request timeouts matching the SDK defaults (10 min read, 5 s connect)."""
+    return httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+
+
+def get_shared_http_client() -> Optional["httpx.Client"]:
+    """
+    Return the process-wide pooled HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.Client, or None if httpx is not installed (the SDK then
+        uses its own default client)
+    """
+    global _client
+
+    with _lock:
+        if _client is None:
+            httpx = _import_httpx()
+            if httpx is None:
+                return None
+            transport = httpx.HTTPTransport(
+                http2=_HTTP2, limits=_limits(httpx), retries=HTTP_CONNECT_RETRIES
+            )
+            _client = httpx.Client(transport=transport, timeout=_timeout(httpx), follow_redirects=True)
+        return _client
+
+
+def get_shared_async_http_client() -> Optional["httpx.AsyncClient"]:
+    """
+    Return the pooled async HTTP client for the running event loop.
+
+    Async connections belong to the loop they were opened on, so each loop
+    gets its own client; clients of closed loops are dropped.
+
+    Returns:
+        Shared httpx.AsyncClient, or None if httpx is not installed
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            httpx = _import_httpx()
+            if httpx is None:
+                return None
+            for stale in [other for other in _async_clients if other.is_closed()]:
+                del _async_clients[stale]
+            transport = httpx.AsyncHTTPTransport(
+                http2=_HTTP2, limits=_limits(httpx), retries=HTTP_CONNECT_RETRIES
+            )
+            client = httpx.AsyncClient(transport=transport, timeout=_timeout(httpx), follow_redirects=True)
+            _async_clients[loop] = client
+        return client
@@ -5,13 +5,19 @@ This module provides integration with LMStudio for running local models
 (Gemma 3 12B, Mistral 7B Instruct) without API costs.
 """
 
+import asyncio
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
-from openai import OpenAI
-from .base import AbstractLLMProvider, GenerationConfig
-from ..constants import CHARS_PER_TOKEN_ESTIMATE
+from .base import AbstractLLMProvider, GenerationConfig, mock_embedding
+from .http import get_shared_async_http_client, get_shared_http_client
+from ..constants import CHARS_PER_TOKEN_ESTIMATE, LOCAL_MODELS_PROBE_TTL_SECONDS
+from ..core.clock import utc_now_iso
+
+if TYPE_CHECKING:
+    import httpx
+    from openai import AsyncOpenAI
 
 
 class LocalLLMProvider(AbstractLLMProvider):
@@ -28,7 +34,8 @@ class LocalLLMProvider(AbstractLLMProvider):
         self,
         api_key: Optional[str] = "not-needed",
         model_name: Optional[str] = "",
-        base_url: str = "http://localhost:1234/v1"
+        base_url: str = "http://localhost:1234/v1",
+        http_client: Optional["httpx.Client"] = None
     ):
         """
         Initialize LMStudio provider.
@@ -37,19 +44,31 @@ class LocalLLMProvider(AbstractLLMProvider):
             api_key: Not required for local models (default: "not-needed")
             model_name: Model identifier (empty string auto-selects loaded model)
             base_url: LMStudio server URL (default: http://localhost:1234/v1)
+            http_client: Optional externally owned HTTP client; the caller
+                closes it. Defaults to the process-wide pooled client from
+                providers.http.
         """
         super().__init__(api_key, model_name)
 
         # Initialize OpenAI client pointing to LMStudio
+        from openai import OpenAI
         self.client = OpenAI(
             base_url=base_url,
-            api_key=api_key  # LMStudio doesn't validate this
+            api_key=api_key,  # LMStudio doesn't validate this
+            http_client=http_client or get_shared_http_client()
         )
 
         # Model name (empty string tells LMStudio to use currently loaded model)
         self.model_name = model_name or ""
         self.base_url = base_url
 
+        # (monotonic time, models listing or the exception raised) of the last probe
+        self._models_probe: Optional[Tuple[float, object]] = None
+
+        # Native async client for agenerate(), created on first use
+        self._async_client: Optional["AsyncOpenAI"] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
     @property
     def provider_name(self) -> str:
         """Return provider name."""
@@ -64,6 +83,7 @@ class LocalLLMProvider(AbstractLLMProvider):
         self,
         prompt: str,
         config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Dict:
         """
@@ -72,6 +92,7 @@ class LocalLLMProvider(AbstractLLMProvider):
         Args:
             prompt: Input prompt text
             config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
             **kwargs: Additional OpenAI-compatible parameters
 
         Returns:
@@ -80,12 +101,159 @@ class LocalLLMProvider(AbstractLLMProvider):
         if config is None:
             config = GenerationConfig()
 
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            # Call LMStudio API (OpenAI-compatible)
+            response = self.client.chat.completions.create(**api_params)
+            return self._build_result(response, prompt, config, system_prompt)
+
+        except Exception as e:
+            raise Exception(
+                f"LMStudio API call failed: {str(e)}\n"
+                f"Make sure LMStudio is running at {self.base_url} with a model loaded."
+            ) from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Generate text using the native async OpenAI-compatible client.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional OpenAI-compatible parameters
+
+        Returns:
+            Dictionary with generated content and metadata
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            response = await self._get_async_client().chat.completions.create(**api_params)
+            return self._build_result(response, prompt, config, system_prompt)
+
+        except Exception as e:
+            raise Exception(
+                f"LMStudio API call failed: {str(e)}\n"
+                f"Make sure LMStudio is running at {self.base_url} with a model loaded."
+            ) from e
+
+    def stream_generate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream text from the local LLM as it is generated.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional OpenAI-compatible parameters
+
+        Yields:
+            Content deltas in generation order
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            # Closing the stream (also when the caller stops iterating early)
+            # stops generation and frees the local model for the next request
+            with self.client.chat.completions.create(**api_params, stream=True) as stream:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise Exception(
+                f"LMStudio API call failed: {str(e)}\n"
+                f"Make sure LMStudio is running at {self.base_url} with a model loaded."
+            ) from e
+
+    async def astream(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream text from the local LLM using the native async client.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional OpenAI-compatible parameters
+
+        Yields:
+            Content deltas in generation order
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            client = self._get_async_client()
+            async with await client.chat.completions.create(**api_params, stream=True) as stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise Exception(
+                f"LMStudio API call failed: {str(e)}\n"
+                f"Make sure LMStudio is running at {self.base_url} with a model loaded."
+            ) from e
+
+    def _get_async_client(self) -> "AsyncOpenAI":
+        """Return the async client for the running event loop, creating it if needed."""
+        # An async HTTP connection pool belongs to the loop it was created on,
+        # so a new loop (e.g. another asyncio.run()) gets a new client
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                http_client=get_shared_async_http_client()
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _build_api_params(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """Build OpenAI-compatible chat completion parameters."""
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
         # Prepare API parameters (OpenAI-compatible format)
         api_params = {
             "model": self.model_name,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
+            "messages": messages,
             "max_tokens": config.max_tokens,
             "temperature": config.temperature,
             "top_p": config.top_p,
@@ -93,54 +261,50 @@ class LocalLLMProvider(AbstractLLMProvider):
 
         # Add stop sequences if provided
         if config.stop_sequences:
-            api_params["stop"] = config.stop_sequences
+            api_params["stop"] = list(config.stop_sequences)
 
         # Override with any additional kwargs
         api_params.update(kwargs)
+        return api_params
 
-        try:
-            # Call LMStudio API (OpenAI-compatible)
-            response = self.client.chat.completions.create(**api_params)
+    def _build_result(
+        self,
+        response,
+        prompt: str,
+        config: GenerationConfig,
+        system_prompt: Optional[str] = None
+    ) -> Dict:
+        """Convert a chat completion into the provider-neutral result dictionary."""
+        # Extract content
+        content = response.choices[0].message.content
+
+        # Get token counts, estimating from character counts (as in
+        # count_tokens(), without joining the prompts) if not reported
+        usage = response.usage
+        tokens_input = (usage and getattr(usage, 'prompt_tokens', 0)) or (
+            (len(system_prompt or "") + len(prompt)) // CHARS_PER_TOKEN_ESTIMATE
+        )
+        tokens_output = (usage and getattr(usage, 'completion_tokens', 0)) or (
+            len(content) // CHARS_PER_TOKEN_ESTIMATE
+        )
 
-            # Extract content
-            content = response.choices[0].message.content
-
-            # Get token counts (if available)
-            tokens_input = getattr(response.usage, 'prompt_tokens', 0) if response.usage else 0
-            tokens_output = getattr(response.usage, 'completion_tokens', 0) if response.usage else 0
-
-            # If token counts not available, estimate
-            if tokens_input == 0:
-                tokens_input = self.count_tokens(prompt)
-            if tokens_output == 0:
-                tokens_output = self.count_tokens(content)
-
-            # Get actual model used (LMStudio returns this)
-            model_used = getattr(response, 'model', self.model_name or 'unknown')
-
-            # Build response dictionary
-            result = {
-                "content": content,
-                "tokens_input": tokens_input,
-                "tokens_output": tokens_output,
-                "model": model_used,
-                "timestamp": datetime.utcnow().isoformat(),
-                "metadata": {
-                    "stop_reason": getattr(response.choices[0], 'finish_reason', 'stop'),
-                    "stop_sequence": None,
-                    "provider": self.provider_name,
-                    "base_url": self.base_url,
-                    "config": config.to_dict()
-                }
+        # Get actual model used (LMStudio returns this)
+        model_used = getattr(response, 'model', self.model_name or 'unknown')
+
+        return {
+            "content": content,
+            "tokens_input": tokens_input,
+            "tokens_output": tokens_output,
+            "model": model_used,
+            "timestamp": utc_now_iso(),
+            "metadata": {
+                "stop_reason": getattr(response.choices[0], 'finish_reason', 'stop'),
+                "stop_sequence": None,
+                "provider": self.provider_name,
+                "base_url": self.base_url,
+                "config": config.to_dict()
             }
-
-            return result
-
-        except Exception as e:
-            raise Exception(
-                f"LMStudio API call failed: {str(e)}\n"
-                f"Make sure LMStudio is running at {self.base_url} with a model loaded."
-            )
+        }
 
     def get_embeddings(self, text: str) -> List[float]:
         """
@@ -166,11 +330,8 @@ class LocalLLMProvider(AbstractLLMProvider):
             )
             return response.data[0].embedding
         except Exception:
-            # Fall back to mock embeddings if not available
-            import hashlib
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-            # Convert hex to list of floats (384-dim vector)
-            return [float(int(text_hash[i:i+2], 16)) / 255.0 for i in range(0, 32, 2)] * 24
+            # Fall back to mock embeddings if not available (384-dim vector)
+            return mock_embedding(text, 384)
 
     def count_tokens(self, text: str) -> int:
         """
@@ -188,45 +349,70 @@ class LocalLLMProvider(AbstractLLMProvider):
         # Rough approximation using constant
         return len(text) // CHARS_PER_TOKEN_ESTIMATE
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in many texts with the same approximation as count_tokens().
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Approximate token count per text, in input order
+        """
+        return [len(text) // CHARS_PER_TOKEN_ESTIMATE for text in texts]
+
     def is_available(self) -> bool:
         """
         Check if LMStudio is available and has a model loaded.
 
+        The result is reused for LOCAL_MODELS_PROBE_TTL_SECONDS, so polling
+        callers do not pay an HTTP round trip each time.
+
         Returns:
             True if LMStudio is reachable, False otherwise
         """
-        try:
-            # Try to list models to check if server is running
-            models = self.client.models.list()
-            return True
-        except Exception:
-            return False
+        return not isinstance(self._list_models(), Exception)
 
     def get_loaded_model_info(self) -> Dict:
         """
         Get information about currently loaded model in LMStudio.
 
+        Shares the cached model listing of is_available().
+
         Returns:
             Dictionary with model information
         """
-        try:
-            models = self.client.models.list()
-            if models.data:
-                model = models.data[0]
-                return {
-                    "id": model.id,
-                    "owned_by": getattr(model, 'owned_by', 'local'),
-                    "available": True
-                }
-            else:
-                return {
-                    "id": "none",
-                    "available": False,
-                    "message": "No model loaded in LMStudio"
-                }
-        except Exception as e:
+        models = self._list_models()
+        if isinstance(models, Exception):
             return {
                 "available": False,
-                "error": str(e),
+                "error": str(models),
                 "message": f"Cannot connect to LMStudio at {self.base_url}"
             }
+
+        if models.data:
+            model = models.data[0]
+            return {
+                "id": model.id,
+                "owned_by": getattr(model, 'owned_by', 'local'),
+                "available": True
+            }
+        return {
+            "id": "none",
+            "available": False,
+            "message": "No model loaded in LMStudio"
+        }
+
+    def _list_models(self):
+        """Return the server's model listing (or the exception raised), cached briefly."""
+        now = time.monotonic()
+        probe = self._models_probe
+        if probe is not None and now - probe[0] < LOCAL_MODELS_PROBE_TTL_SECONDS:
+            return probe[1]
+
+        try:
+            models = self.client.models.list()
+        except Exception as e:
+            models = e
+        self._models_probe = (now, models)
+        return models
@@ -5,13 +5,46 @@ This module wraps the OpenAI API for text generation and embeddings,
 following the AbstractLLMProvider interface.
 """
 
+import asyncio
+import hashlib
+import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
-from openai import OpenAI
-from .base import AbstractLLMProvider, GenerationConfig
-from ..constants import CHARS_PER_TOKEN_ESTIMATE
+from .base import AbstractLLMProvider, GenerationConfig, mock_embedding
+from .http import get_shared_async_http_client, get_shared_http_client
+from ..constants import API_MAX_RETRIES, CHARS_PER_TOKEN_ESTIMATE
+from ..core.clock import utc_now_iso
+
+if TYPE_CHECKING:
+    import httpx
+    from openai import AsyncOpenAI
+
+# tiktoken encoding used by gpt-4 and gpt-3.5-turbo
+_ENCODING_NAME = "cl100k_base"
+
+# Embedding model and its per-request limits (inputs, total tokens)
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_MAX_INPUTS = 2048
+_EMBEDDING_MAX_TOKENS = 300_000
+
+
+@lru_cache(maxsize=64)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Return a short stable key identifying a static prompt prefix."""
+    return hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _get_encoder(name: str):
+    """Load a tiktoken encoding once per process (None if tiktoken is not installed)."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding(name)
 
 
 class OpenAIProvider(AbstractLLMProvider):
@@ -24,7 +57,8 @@ class OpenAIProvider(AbstractLLMProvider):
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        http_client: Optional["httpx.Client"] = None
     ):
         """
         Initialize OpenAI provider.
@@ -32,6 +66,9 @@ class OpenAIProvider(AbstractLLMProvider):
         Args:
             api_key: OpenAI API key (if None, reads from OPENAI_API_KEY env var)
             model_name: Model identifier (defaults to gpt-4-turbo)
+            http_client: Optional externally owned HTTP client; the caller
+                closes it. Defaults to the process-wide pooled client from
+                providers.http, shared by all provider instances.
         """
         super().__init__(api_key, model_name)
 
@@ -44,21 +81,22 @@ class OpenAIProvider(AbstractLLMProvider):
                 "Set OPENAI_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=self.api_key)
+        # Initialize OpenAI client (SDK imported here, so the mock provider
+        # in this module never loads it)
+        from openai import OpenAI
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=http_client or get_shared_http_client(),
+            max_retries=API_MAX_RETRIES
+        )
+
+        # Native async client for agenerate(), created on first use
+        self._async_client: Optional["AsyncOpenAI"] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Set model
         self.model_name = model_name or self.default_model
 
-        # Try to import tiktoken for accurate token counting
-        try:
-            import tiktoken
-            self.tiktoken = tiktoken
-            self.encoder = None  # Lazy load when needed
-        except ImportError:
-            self.tiktoken = None
-            self.encoder = None
-
     @property
     def provider_name(self) -> str:
         """Return provider name."""
@@ -73,6 +111,7 @@ class OpenAIProvider(AbstractLLMProvider):
         self,
         prompt: str,
         config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Dict:
         """
@@ -81,6 +120,42 @@ class OpenAIProvider(AbstractLLMProvider):
         Args:
             prompt: Input prompt text
             config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional OpenAI-specific parameters
+
+        Returns:
+            Dictionary with generated content and metadata
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            # Call OpenAI API
+            response = self.client.chat.completions.create(**api_params)
+            return self._build_result(response, config)
+
+        except Exception as e:
+            raise Exception(f"OpenAI API call failed: {str(e)}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Generate text using the native async OpenAI client.
+
+        Unlike the base implementation, no worker thread is tied up per
+        in-flight request, so many calls can be awaited concurrently.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
             **kwargs: Additional OpenAI-specific parameters
 
         Returns:
@@ -89,54 +164,264 @@ class OpenAIProvider(AbstractLLMProvider):
         if config is None:
             config = GenerationConfig()
 
-        # Prepare API parameters
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            response = await self._get_async_client().chat.completions.create(**api_params)
+            return self._build_result(response, config)
+
+        except Exception as e:
+            raise Exception(f"OpenAI API call failed: {str(e)}") from e
+
+    def _get_async_client(self) -> "AsyncOpenAI":
+        """Return the async client for the running event loop, creating it if needed."""
+        # An async HTTP connection pool belongs to the loop it was created on,
+        # so a new loop (e.g. another asyncio.run()) gets a new client
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=get_shared_async_http_client(),
+                max_retries=API_MAX_RETRIES
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _build_result(self, response, config: GenerationConfig) -> Dict:
+        """Convert a chat completion into the provider-neutral result dictionary."""
+        # Extract content
+        content = response.choices[0].message.content
+
+        # Get token counts
+        tokens_input = response.usage.prompt_tokens
+        tokens_output = response.usage.completion_tokens
+
+        return {
+            "content": content,
+            "tokens_input": tokens_input,
+            "tokens_output": tokens_output,
+            "model": response.model,
+            "timestamp": utc_now_iso(),
+            "metadata": {
+                "finish_reason": response.choices[0].finish_reason,
+                "provider": self.provider_name,
+                "config": config.to_dict(),
+                "system_fingerprint": getattr(response, 'system_fingerprint', None),
+                # Prompt tokens served from OpenAI's automatic prompt cache
+                "cache_read_input_tokens": getattr(
+                    getattr(response.usage, 'prompt_tokens_details', None), 'cached_tokens', None
+                ) or 0
+            }
+        }
+
+    def stream_generate(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream text from the OpenAI GPT API as it is generated.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional OpenAI-specific parameters
+
+        Yields:
+            Content deltas in generation order
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            # Closing the stream (also when the caller stops iterating early)
+            # ends generation server-side and releases the connection
+            with self.client.chat.completions.create(**api_params, stream=True) as stream:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise Exception(f"OpenAI API call failed: {str(e)}") from e
+
+    async def astream(
+        self,
+        prompt: str,
+        config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream text from the OpenAI GPT API using the native async client.
+
+        Args:
+            prompt: Input prompt text
+            config: Generation configuration
+            system_prompt: Optional static instructions sent ahead of the prompt
+            **kwargs: Additional OpenAI-specific parameters
+
+        Yields:
+            Content deltas in generation order
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        api_params = self._build_api_params(prompt, config, system_prompt, **kwargs)
+
+        try:
+            client = self._get_async_client()
+            async with await client.chat.completions.create(**api_params, stream=True) as stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise Exception(f"OpenAI API call failed: {str(e)}") from e
+
+    def _build_api_params(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """Build chat completion parameters shared by online and batch requests."""
+        messages = [{"role": "user", "content": prompt}]
         api_params = {
             "model": self.model_name,
             "max_tokens": config.max_tokens,
             "temperature": config.temperature,
             "top_p": config.top_p,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ]
+            "messages": messages
         }
 
+        if system_prompt:
+            # Static prefix first, so OpenAI's automatic prompt caching can reuse it
+            messages.insert(0, {"role": "system", "content": system_prompt})
+            # Route requests sharing the prefix to the same cache; sent via
+            # extra_body because older SDK releases reject the keyword
+            api_params["extra_body"] = {"prompt_cache_key": _prompt_cache_key(system_prompt)}
+
         # Add stop sequences if provided
         if config.stop_sequences:
-            api_params["stop"] = config.stop_sequences
+            api_params["stop"] = list(config.stop_sequences)
 
-        # Override with any additional kwargs
+        # Override with any additional kwargs (extra_body fields are merged)
+        if "extra_body" in kwargs and "extra_body" in api_params:
+            kwargs["extra_body"] = {**api_params["extra_body"], **kwargs["extra_body"]}
         api_params.update(kwargs)
+        return api_params
+
+    def _build_batch_body(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_prompt: Optional[str] = None
+    ) -> Dict:
+        """Build a batch request body (extra_body fields become top-level fields)."""
+        body = self._build_api_params(prompt, config, system_prompt)
+        body.update(body.pop("extra_body", {}))
+        return body
+
+    def submit_batch(
+        self,
+        prompts: Dict[str, str],
+        config: Optional[GenerationConfig] = None,
+        poll_interval: float = 30.0,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Generate responses through the OpenAI Batch API.
+
+        Serializes one chat completion request per prompt into a JSONL file,
+        uploads it, polls the batch until it finishes and maps the output
+        file back by custom_id. Batch requests are billed at a discount but
+        may take up to the 24h completion window.
+
+        Args:
+            prompts: Mapping of request IDs (used as custom_id) to prompt text
+            config: Generation configuration shared by all requests
+            poll_interval: Seconds between batch status checks
+            system_prompt: Optional static instructions shared by all requests
+
+        Returns:
+            Mapping of request ID to a dictionary in the generate() format
+
+        Raises:
+            Exception: If the batch cannot be submitted or does not complete
+        """
+        if config is None:
+            config = GenerationConfig()
+
+        lines = [
+            json.dumps({
+                "custom_id": request_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_batch_body(prompt, config, system_prompt)
+            }, ensure_ascii=False)
+            for request_id, prompt in prompts.items()
+        ]
 
         try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(**api_params)
+            batch_file = self.client.files.create(
+                file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
 
-            # Extract content
-            content = response.choices[0].message.content
+            if batch.status != "completed":
+                raise Exception(f"batch {batch.id} ended with status '{batch.status}'")
 
-            # Get token counts
-            tokens_input = response.usage.prompt_tokens
-            tokens_output = response.usage.completion_tokens
+            output = self.client.files.content(batch.output_file_id).text if batch.output_file_id else ""
 
-            # Build response dictionary
-            result = {
-                "content": content,
-                "tokens_input": tokens_input,
-                "tokens_output": tokens_output,
-                "model": response.model,
-                "timestamp": datetime.utcnow().isoformat(),
+        except Exception as e:
+            raise Exception(f"OpenAI batch API call failed: {str(e)}") from e
+
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+
+            body = response["body"]
+            choice = body["choices"][0]
+            results[record["custom_id"]] = {
+                "content": choice["message"]["content"],
+                "tokens_input": body["usage"]["prompt_tokens"],
+                "tokens_output": body["usage"]["completion_tokens"],
+                "model": body["model"],
+                "timestamp": utc_now_iso(),
                 "metadata": {
-                    "finish_reason": response.choices[0].finish_reason,
+                    "finish_reason": choice.get("finish_reason"),
                     "provider": self.provider_name,
                     "config": config.to_dict(),
-                    "system_fingerprint": getattr(response, 'system_fingerprint', None)
+                    "system_fingerprint": body.get("system_fingerprint"),
+                    "cache_read_input_tokens": (
+                        body["usage"].get("prompt_tokens_details") or {}
+                    ).get("cached_tokens") or 0,
+                    "batch_id": batch.id
                 }
             }
 
-            return result
-
-        except Exception as e:
-            raise Exception(f"OpenAI API call failed: {str(e)}")
+        return results
 
     def get_embeddings(self, text: str) -> List[float]:
         """
@@ -148,15 +433,50 @@ class OpenAIProvider(AbstractLLMProvider):
         Returns:
             Embedding vector (1536-dimensional for text-embedding-3-small)
         """
+        return self.get_embeddings_batch([text])[0]
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for many texts with as few API requests as possible.
+
+        Texts are sent in chunks that stay within the endpoint's per-request
+        limits on input count and total tokens.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            One embedding vector per text, in input order
+        """
+        embeddings: List[List[float]] = []
         try:
-            response = self.client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text
-            )
-            return response.data[0].embedding
+            for start, end in self._embedding_chunks(texts):
+                response = self.client.embeddings.create(
+                    model=_EMBEDDING_MODEL,
+                    input=texts[start:end]
+                )
+                # Sort by index: the API documents no ordering guarantee
+                embeddings.extend(
+                    item.embedding for item in sorted(response.data, key=lambda item: item.index)
+                )
+            return embeddings
 
         except Exception as e:
-            raise Exception(f"OpenAI embeddings API call failed: {str(e)}")
+            raise Exception(f"OpenAI embeddings API call failed: {str(e)}") from e
+
+    def _embedding_chunks(self, texts: List[str]) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) slices of texts that fit into one embeddings request."""
+        start = 0
+        tokens = 0
+        for index, count in enumerate(self.count_tokens_batch(texts)):
+            if index > start and (
+                index - start >= _EMBEDDING_MAX_INPUTS or tokens + count > _EMBEDDING_MAX_TOKENS
+            ):
+                yield start, index
+                start, tokens = index, 0
+            tokens += count
+        if start < len(texts):
+            yield start, len(texts)
 
     def count_tokens(self, text: str) -> int:
         """
@@ -170,15 +490,10 @@ class OpenAIProvider(AbstractLLMProvider):
         Returns:
             Token count
         """
-        if self.tiktoken:
+        encoder = _get_encoder(_ENCODING_NAME)
+        if encoder is not None:
             try:
-                # Lazy load encoder
-                if self.encoder is None:
-                    # Use cl100k_base encoding (used by gpt-4, gpt-3.5-turbo)
-                    self.encoder = self.tiktoken.get_encoding("cl100k_base")
-
-                tokens = self.encoder.encode(text)
-                return len(tokens)
+                return len(encoder.encode_ordinary(text))
             except Exception:
                 # Fall back to approximation if encoding fails
                 pass
@@ -186,6 +501,33 @@ class OpenAIProvider(AbstractLLMProvider):
         # Fallback: rough approximation
         return len(text) // CHARS_PER_TOKEN_ESTIMATE
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in many texts at once.
+
+        tiktoken's batch encoder runs its Rust BPE on a thread pool without
+        holding the GIL, so this is much faster than a loop over
+        count_tokens() for large batches.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Token count per text, in input order
+        """
+        encoder = _get_encoder(_ENCODING_NAME)
+        if encoder is not None:
+            try:
+                return [
+                    len(tokens)
+                    for tokens in encoder.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+                ]
+            except Exception:
+                # Fall back to approximation if encoding fails
+                pass
+
+        return [len(text) // CHARS_PER_TOKEN_ESTIMATE for text in texts]
+
     def is_available(self) -> bool:
         """Check if provider is configured and available."""
         return self.api_key is not None
@@ -278,6 +620,7 @@ class MockOpenAIProvider(AbstractLLMProvider):
         self,
         prompt: str,
         config: Optional[GenerationConfig] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Dict:
         """Generate mock response."""
@@ -298,7 +641,7 @@ class MockOpenAIProvider(AbstractLLMProvider):
             content += "In production, GPT would generate a culturally-appropriate response here."
 
         # Mock token counts (approximate)
-        tokens_input = len(prompt) // 4
+        tokens_input = (len(prompt) + len(system_prompt or "")) // 4
         tokens_output = len(content) // 4
 
         return {
@@ -306,7 +649,7 @@ class MockOpenAIProvider(AbstractLLMProvider):
             "tokens_input": tokens_input,
             "tokens_output": tokens_output,
             "model": self.model_name,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "metadata": {
                 "finish_reason": "stop",
                 "provider": self.provider_name,
@@ -318,18 +661,17 @@ class MockOpenAIProvider(AbstractLLMProvider):
 
     def get_embeddings(self, text: str) -> List[float]:
         """Return mock embeddings."""
-        # Return a simple hash-based vector for testing
-        import hashlib
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        # Convert hex to list of floats (1536-dim like OpenAI's text-embedding-3-small)
-        # Create pattern by repeating the hash
-        base_vector = [float(int(text_hash[i:i+2], 16)) / 255.0 for i in range(0, 32, 2)]
-        return (base_vector * 96)[:1536]  # 16 * 96 = 1536
+        # Simple hash-based vector for testing (1536-dim like OpenAI's text-embedding-3-small)
+        return mock_embedding(text, 1536)
 
     def count_tokens(self, text: str) -> int:
         """Mock token counting."""
         return len(text) // CHARS_PER_TOKEN_ESTIMATE
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Mock token counting for many texts (one comprehension, no per-text call)."""
+        return [len(text) // CHARS_PER_TOKEN_ESTIMATE for text in texts]
+
     def is_available(self) -> bool:
         """Mock is always available."""
         return True
@@ -0,0 +1,78 @@
+"""
+Client-side rate limiting for provider API calls.
+
+Concurrent Phase 2 refinements can easily exceed a provider's requests-per-
+minute quota; the resulting 429 responses and retry backoff cost more time
+than the concurrency saves. AsyncRateLimiter spaces requests out so they stay
+under the quota instead.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Leaky-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to max_rate requests, then admits new requests at a
+    steady max_rate per time_period. Waiters are served in arrival order.
+
+    Usage:
+        limiter = AsyncRateLimiter(max_rate=50, time_period=60)
+        async with limiter:
+            await provider.agenerate(prompt)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_rate: Maximum number of requests per time period
+            time_period: Length of the time period in seconds
+
+        Raises:
+            ValueError: If max_rate or time_period is not positive
+        """
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        if time_period <= 0:
+            raise ValueError(f"time_period must be positive, got {time_period}")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _leak(self) -> None:
+        """Drain the bucket by the capacity that has freed up since the last check."""
+        now = time.monotonic()
+        elapsed = now - self._last_check
+        self._level = max(0.0, self._level - elapsed * self._rate_per_sec)
+        self._last_check = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until amount requests fit within the rate limit, then take them.
+
+        Args:
+            amount: Number of requests to account for
+        """
+        async with self._lock:
+            while True:
+                self._leak()
+                if self._level + amount <= self.max_rate:
+                    self._level += amount
+                    return
+                await asyncio.sleep(
+                    (self._level + amount - self.max_rate) / self._rate_per_sec
+                )
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -5,18 +5,305 @@ Generates interactive HTML reports comparing prompt performance across
 languages and formality levels.
 """
 
+import base64
+import hashlib
+import html
 import json
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, TextIO, Tuple
 from datetime import datetime
 
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
 from plotly.subplots import make_subplots
 import plotly.express as px
 
+from ..core.prompt import LLMResponse
 from ..storage.cache_manager import CacheManager
-from ..metrics import quantitative, qualitative
-from ..constants import FORMALITY_LEVELS, SUPPORTED_LANGUAGES, REPORTS_DIR
+from ..metrics import get_response_metrics
+from ..constants import DEFAULT_MAX_CONCURRENCY, FORMALITY_LEVELS, SUPPORTED_LANGUAGES, REPORTS_DIR
+
+# plotly.js build matching the installed plotly package
+_PLOTLY_CDN_URL = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+# Default plotly trace colors, one per formality level in the token chart
+_COLORWAY = px.colors.qualitative.Plotly
+
+# Output buffer for report files (a report is written in one or two flushes)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Per-variant metrics pivoted into the chart grids
+_GRID_METRICS = ('tokens_out', 'word_count', 'lexical_diversity', 'cultural_score')
+
+
+@dataclass
+class VariantMatrices:
+    """
+    Variant metrics of one prompt, pivoted into (formality x language) grids.
+
+    Each grid has one row per formality level (FORMALITY_LEVELS order) and
+    one column per language with at least one cached response (sorted);
+    cells without a cached response are None. The original per-variant
+    rows are kept for the data table.
+    """
+
+    languages: List[str]
+    formalities: List[str]
+    tokens_out: List[List[Optional[int]]]
+    word_count: List[List[Optional[int]]]
+    lexical_diversity: List[List[Optional[float]]]
+    cultural_score: List[List[Optional[float]]]
+    rows: List[Dict]
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict]) -> "VariantMatrices":
+        """Pivot per-variant rows into grids in a single pass."""
+        languages = sorted({row['language'] for row in rows})
+        formalities = list(FORMALITY_LEVELS)
+        lang_index = {lang: j for j, lang in enumerate(languages)}
+        formality_index = {formality: i for i, formality in enumerate(formalities)}
+
+        grids = {
+            metric: [[None] * len(languages) for _ in formalities]
+            for metric in _GRID_METRICS
+        }
+        for row in rows:
+            i = formality_index[row['formality']]
+            j = lang_index[row['language']]
+            for metric in _GRID_METRICS:
+                grids[metric][i][j] = row[metric]
+
+        return cls(languages=languages, formalities=formalities, rows=rows, **grids)
+
+    @staticmethod
+    def columns(grid: List[List]) -> List[Tuple]:
+        """Return the per-language columns of a grid."""
+        return list(zip(*grid)) if grid else []
+
+
+# Document head up to the stylesheet
+_HTML_HEAD = string.Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Multilingual Prompt Report: ${prompt_id}</title>
+    <script charset="utf-8" src="${plotly_url}" integrity="${plotly_integrity}" crossorigin="anonymous"></script>
+""")
+
+# Report stylesheet (static)
+_HTML_CSS = """    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            margin: 0 0 10px 0;
+        }
+        .header p {
+            margin: 0;
+            opacity: 0.9;
+        }
+        .section {
+            background: white;
+            padding: 30px;
+            margin-bottom: 20px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .section h2 {
+            margin-top: 0;
+            color: #667eea;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th {
+            background-color: #667eea;
+            color: white;
+            font-weight: 600;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        .footer {
+            text-align: center;
+            color: #666;
+            margin-top: 40px;
+            padding: 20px;
+        }
+        .metric-card {
+            display: inline-block;
+            background: #f8f9fa;
+            padding: 20px;
+            margin: 10px;
+            border-radius: 8px;
+            min-width: 150px;
+        }
+        .metric-value {
+            font-size: 32px;
+            font-weight: bold;
+            color: #667eea;
+        }
+        .metric-label {
+            font-size: 14px;
+            color: #666;
+            margin-top: 5px;
+        }
+        .plot {
+            min-height: 400px;
+        }
+    </style>
+"""
+
+# Page header and the opening of the summary section
+_HTML_HEADER = string.Template("""</head>
+<body>
+    <div class="header">
+        <h1>🌍 Multilingual Prompt Optimization Report</h1>
+        <p><strong>Prompt ID:</strong> ${prompt_id}</p>
+        <p><strong>Generated:</strong> ${generated_at}</p>
+        <p><strong>Variants Analyzed:</strong> ${variant_count}</p>
+    </div>
+
+    <div class="section">
+        <h2>📊 Summary Metrics</h2>
+""")
+
+# One summary metric card
+_METRIC_CARD = string.Template("""        <div class="metric-card">
+            <div class="metric-value">${value}</div>
+            <div class="metric-label">${label}</div>
+        </div>
+""")
+
+# Closes the summary section; chart placeholders and the data table header
+_HTML_CHARTS = """    </div>
+
+    <div class="section">
+        <h2>📈 Token Usage Analysis</h2>
+        <div id="plot_0" class="plot" data-plot-idx="0"></div>
+    </div>
+
+    <div class="section">
+        <h2>🎯 Cultural Appropriateness</h2>
+        <div id="plot_1" class="plot" data-plot-idx="1"></div>
+    </div>
+
+    <div class="section">
+        <h2>📚 Lexical Diversity</h2>
+        <div id="plot_2" class="plot" data-plot-idx="2"></div>
+    </div>
+
+    <div class="section">
+        <h2>📏 Response Length Distribution</h2>
+        <div id="plot_3" class="plot" data-plot-idx="3"></div>
+    </div>
+
+    <div class="section">
+        <h2>🎭 Formality Comparison</h2>
+        <div id="plot_4" class="plot" data-plot-idx="4"></div>
+    </div>
+
+    <div class="section">
+        <h2>📋 Detailed Data Table</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Language</th>
+                    <th>Formality</th>
+                    <th>Tokens In</th>
+                    <th>Tokens Out</th>
+                    <th>Words</th>
+                    <th>Lexical Diversity</th>
+                    <th>Cultural Score</th>
+                </tr>
+            </thead>
+            <tbody>
+                """
+
+# Closes the data table
+_HTML_TABLE_END = """
+            </tbody>
+        </table>
+    </div>
+
+"""
+
+# Page footer (static)
+_HTML_FOOTER = """    <div class="footer">
+        <p>Generated with <strong>Multilingual Prompt Optimizer</strong></p>
+        <p>Powered by Gemma 2 9B (LMStudio) • Plotly Visualizations</p>
+    </div>
+"""
+
+# Holds one figure spec as inert JSON (plotly escapes '<' and '/' in strings)
+_HTML_SPEC = string.Template("""    <script type="application/json" id="spec_${index}">${spec}</script>
+""")
+
+# Renders each spec into its placeholder div once the div scrolls near the
+# viewport, so off-screen charts cost nothing at page load
+_HTML_END = """    <script>
+        const renderPlot = (div) => {
+            const spec = JSON.parse(document.getElementById('spec_' + div.dataset.plotIdx).textContent);
+            Plotly.newPlot(div, spec.data, spec.layout, {responsive: true, scrollZoom: false});
+        };
+        const plots = document.querySelectorAll('[data-plot-idx]');
+        if ('IntersectionObserver' in window) {
+            const observer = new IntersectionObserver((entries) => {
+                entries.forEach((entry) => {
+                    if (entry.isIntersecting) {
+                        observer.unobserve(entry.target);
+                        renderPlot(entry.target);
+                    }
+                });
+            }, {rootMargin: '200px'});
+            plots.forEach((div) => observer.observe(div));
+        } else {
+            plots.forEach(renderPlot);
+        }
+    </script>
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=1)
+def _plotly_sri_hash() -> str:
+    """Subresource integrity hash of the plotly.js bundle (hashed once per process)."""
+    digest = hashlib.sha256(get_plotlyjs().encode("utf-8")).digest()
+    return "sha256-" + base64.b64encode(digest).decode("ascii")
+
+
+def _mean(values: List[Optional[float]]) -> Optional[float]:
+    """Average the filled cells of a grid row (None if all are empty)."""
+    present = [value for value in values if value is not None]
+    return sum(present) / len(present) if present else None
 
 
 class HTMLReportGenerator:
@@ -72,114 +359,128 @@ class HTMLReportGenerator:
         figs.append(self._create_length_distribution(data))
         figs.append(self._create_formality_radar(data))
 
-        # Build HTML report
-        html = self._build_html_report(prompt_id, data, figs)
-
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        # Stream HTML report to file
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            self._write_html_report(f, prompt_id, data, figs)
 
         return str(output_path)
 
-    def _collect_variant_data(self, prompt_id: str) -> List[Dict]:
+    def _collect_variant_data(self, prompt_id: str) -> VariantMatrices:
         """Collect metrics data for all variants of a prompt."""
         # Use first 3 supported languages (en, de, es) - fr adapter not yet implemented
         languages = SUPPORTED_LANGUAGES[:3]
 
-        data = []
-
-        for lang in languages:
-            for formality in FORMALITY_LEVELS:
-                response = self.cache.get_cached_response(prompt_id, lang, formality)
-
-                if response:
-                    # Calculate metrics
-                    quant_metrics = quantitative.calculate_all_quantitative_metrics(
-                        response.content,
-                        response.tokens_output,
-                        lang
-                    )
-
-                    qual_metrics = qualitative.calculate_all_qualitative_metrics(
-                        response.content,
-                        lang,
-                        formality,
-                        'business'  # Default domain
-                    )
-
-                    # Extract cultural score - handle both numeric and string formats
-                    cultural_rating = qual_metrics['cultural_appropriateness'].get('overall_rating', 3.0)
-                    if isinstance(cultural_rating, str):
-                        # Try to parse string ratings like "Good" → 4.0
-                        rating_map = {'Excellent': 5.0, 'Good': 4.0, 'Adequate': 3.0, 'Fair': 2.0, 'Poor': 1.0}
-                        cultural_score = rating_map.get(cultural_rating, 3.0)
-                    else:
-                        cultural_score = float(cultural_rating)
-
-                    data.append({
-                        'language': lang,
-                        'formality': formality,
-                        'tokens_in': response.tokens_input,
-                        'tokens_out': response.tokens_output,
-                        'word_count': quant_metrics['length_metrics']['word_count'],
-                        'lexical_diversity': quant_metrics['lexical_diversity']['type_token_ratio'],
-                        'cultural_score': cultural_score,
-                        'content': response.content[:200] + '...' if len(response.content) > 200 else response.content
-                    })
-
-        return data
-
-    def _create_token_comparison(self, data: List[Dict]) -> go.Figure:
-        """Create grouped bar chart comparing token usage across variants."""
-        fig = go.Figure()
-
-        languages = sorted(set(d['language'] for d in data))
+        # All cached responses of the prompt in one pass, in report order
+        responses = self.cache.get_cached_responses(prompt_id)
+        variants = [
+            (lang, formality, responses[(lang, formality)])
+            for lang in languages
+            for formality in FORMALITY_LEVELS
+            if (lang, formality) in responses
+        ]
+        if not variants:
+            return VariantMatrices.from_rows([])
+
+        # Variants are independent: overlap their metric cache reads and work
+        with ThreadPoolExecutor(
+            max_workers=min(DEFAULT_MAX_CONCURRENCY, len(variants)),
+            thread_name_prefix="mpo-report"
+        ) as executor:
+            rows = list(executor.map(
+                lambda variant: self._collect_variant_row(prompt_id, *variant), variants
+            ))
 
-        for formality in FORMALITY_LEVELS:
-            tokens_out = []
-            for lang in languages:
-                matching = [d for d in data if d['language'] == lang and d['formality'] == formality]
-                tokens_out.append(matching[0]['tokens_out'] if matching else 0)
+        return VariantMatrices.from_rows(rows)
 
-            fig.add_trace(go.Bar(
-                name=formality.capitalize(),
-                x=languages,
-                y=tokens_out,
-                text=tokens_out,
-                textposition='auto'
-            ))
+    def _collect_variant_row(
+        self,
+        prompt_id: str,
+        language: str,
+        formality: str,
+        response: LLMResponse
+    ) -> Dict:
+        """Collect the metrics row of one variant."""
+        # Calculate metrics (cached per response)
+        metrics = get_response_metrics(
+            self.cache,
+            response,
+            prompt_id,
+            language,
+            formality,
+            'business'  # Default domain
+        )
+        quant_metrics = metrics['quantitative']
+        qual_metrics = metrics['qualitative']
+
+        # Extract cultural score - handle both numeric and string formats
+        cultural_rating = qual_metrics['cultural_appropriateness'].get('overall_rating', 3.0)
+        if isinstance(cultural_rating, str):
+            # Try to parse string ratings like "Good" → 4.0
+            rating_map = {'Excellent': 5.0, 'Good': 4.0, 'Adequate': 3.0, 'Fair': 2.0, 'Poor': 1.0}
+            cultural_score = rating_map.get(cultural_rating, 3.0)
+        else:
+            cultural_score = float(cultural_rating)
+
+        return {
+            'language': language,
+            'formality': formality,
+            'tokens_in': response.tokens_input,
+            'tokens_out': response.tokens_output,
+            'word_count': quant_metrics['length_metrics']['word_count'],
+            'lexical_diversity': quant_metrics['lexical_diversity']['type_token_ratio'],
+            'cultural_score': cultural_score
+        }
+
+    def _create_token_comparison(self, data: VariantMatrices) -> go.Figure:
+        """Create bar chart comparing token usage across variants."""
+        # One trace on a two-level (language, formality) axis instead of one
+        # trace per formality level; bars keep a color per formality level
+        languages = []
+        formalities = []
+        tokens_out = []
+        colors = []
+        for lang, column in zip(data.languages, data.columns(data.tokens_out)):
+            for i, (formality, value) in enumerate(zip(data.formalities, column)):
+                languages.append(lang)
+                formalities.append(formality.capitalize())
+                tokens_out.append(value if value is not None else 0)
+                colors.append(_COLORWAY[i % len(_COLORWAY)])
+
+        fig = go.Figure(go.Bar(
+            x=[languages, formalities],
+            y=tokens_out,
+            text=tokens_out,
+            textposition='auto',
+            marker_color=colors
+        ))
 
         fig.update_layout(
             title='Token Output by Language and Formality',
             xaxis_title='Language',
             yaxis_title='Tokens',
-            barmode='group',
             template='plotly_white',
             height=400
         )
 
         return fig
 
-    def _create_cultural_appropriateness_heatmap(self, data: List[Dict]) -> go.Figure:
+    def _create_cultural_appropriateness_heatmap(self, data: VariantMatrices) -> go.Figure:
         """Create heatmap of cultural appropriateness scores."""
-        languages = sorted(set(d['language'] for d in data))
+        matrix = [
+            [value if value is not None else 0 for value in row]
+            for row in data.cultural_score
+        ]
 
-        # Build matrix
-        matrix = []
-        for formality in FORMALITY_LEVELS:
-            row = []
-            for lang in languages:
-                matching = [d for d in data if d['language'] == lang and d['formality'] == formality]
-                row.append(matching[0]['cultural_score'] if matching else 0)
-            matrix.append(row)
+        # Cell labels formatted once here rather than by d3-format on every render
+        text = [[f"{value:.1f}" for value in row] for row in matrix]
 
         fig = go.Figure(data=go.Heatmap(
             z=matrix,
-            x=languages,
-            y=FORMALITY_LEVELS,
+            x=data.languages,
+            y=data.formalities,
             colorscale='RdYlGn',
-            text=matrix,
-            texttemplate='%{text:.1f}',
+            text=text,
+            texttemplate='%{text}',
             textfont={"size": 14},
             colorbar=dict(title="Score")
         ))
@@ -194,18 +495,21 @@ class HTMLReportGenerator:
 
         return fig
 
-    def _create_lexical_diversity_comparison(self, data: List[Dict]) -> go.Figure:
+    def _create_lexical_diversity_comparison(self, data: VariantMatrices) -> go.Figure:
         """Create scatter plot of lexical diversity."""
         fig = go.Figure()
 
-        languages = sorted(set(d['language'] for d in data))
-
-        for lang in languages:
-            lang_data = [d for d in data if d['language'] == lang]
-
-            fig.add_trace(go.Scatter(
-                x=[d['formality'] for d in lang_data],
-                y=[d['lexical_diversity'] for d in lang_data],
+        for lang, column in zip(data.languages, data.columns(data.lexical_diversity)):
+            points = [
+                (formality, value)
+                for formality, value in zip(data.formalities, column)
+                if value is not None
+            ]
+
+            # WebGL trace: rendered on a canvas instead of one SVG node per point
+            fig.add_trace(go.Scattergl(
+                x=[formality for formality, _ in points],
+                y=[value for _, value in points],
                 mode='markers+lines',
                 name=lang.upper(),
                 marker=dict(size=12),
@@ -223,15 +527,12 @@ class HTMLReportGenerator:
 
         return fig
 
-    def _create_length_distribution(self, data: List[Dict]) -> go.Figure:
+    def _create_length_distribution(self, data: VariantMatrices) -> go.Figure:
         """Create box plot of word count distribution."""
         fig = go.Figure()
 
-        languages = sorted(set(d['language'] for d in data))
-
-        for lang in languages:
-            lang_data = [d for d in data if d['language'] == lang]
-            word_counts = [d['word_count'] for d in lang_data]
+        for lang, column in zip(data.languages, data.columns(data.word_count)):
+            word_counts = [value for value in column if value is not None]
 
             fig.add_trace(go.Box(
                 y=word_counts,
@@ -243,23 +544,23 @@ class HTMLReportGenerator:
             title='Response Length Distribution by Language',
             yaxis_title='Word Count',
             template='plotly_white',
-            height=400
+            height=400,
+            hovermode='x'
         )
 
         return fig
 
-    def _create_formality_radar(self, data: List[Dict]) -> go.Figure:
+    def _create_formality_radar(self, data: VariantMatrices) -> go.Figure:
         """Create radar chart comparing metrics across formality levels."""
         fig = go.Figure()
 
-        for formality in FORMALITY_LEVELS:
-            formal_data = [d for d in data if d['formality'] == formality]
+        for i, formality in enumerate(data.formalities):
+            avg_tokens = _mean(data.tokens_out[i])
 
-            if formal_data:
-                avg_tokens = sum(d['tokens_out'] for d in formal_data) / len(formal_data)
-                avg_words = sum(d['word_count'] for d in formal_data) / len(formal_data)
-                avg_diversity = sum(d['lexical_diversity'] for d in formal_data) / len(formal_data)
-                avg_cultural = sum(d['cultural_score'] for d in formal_data) / len(formal_data)
+            if avg_tokens is not None:
+                avg_words = _mean(data.word_count[i])
+                avg_diversity = _mean(data.lexical_diversity[i])
+                avg_cultural = _mean(data.cultural_score[i])
 
                 fig.add_trace(go.Scatterpolar(
                     r=[avg_tokens / 100, avg_words / 50, avg_diversity * 100, avg_cultural * 20],
@@ -279,22 +580,41 @@ class HTMLReportGenerator:
 
         return fig
 
-    def _build_html_report(
+    def _write_html_report(
         self,
+        f: TextIO,
         prompt_id: str,
-        data: List[Dict],
+        data: VariantMatrices,
         figures: List[go.Figure]
-    ) -> str:
-        """Build complete HTML report with visualizations and data tables."""
+    ) -> None:
+        """Write the complete HTML report with visualizations and data tables to a file."""
+        safe_prompt_id = html.escape(prompt_id)
+        f.write(_HTML_HEAD.substitute(
+            prompt_id=safe_prompt_id,
+            plotly_url=_PLOTLY_CDN_URL,
+            plotly_integrity=_plotly_sri_hash()
+        ))
+        f.write(_HTML_CSS)
+        f.write(_HTML_HEADER.substitute(
+            prompt_id=safe_prompt_id,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            variant_count=len(data.rows)
+        ))
 
-        # Convert figures to HTML
-        fig_htmls = [fig.to_html(include_plotlyjs='cdn', div_id=f'plot_{i}')
-                     for i, fig in enumerate(figures)]
+        # Summary metric cards
+        cards = (
+            (len(data.languages), 'Languages'),
+            (len(set(d['formality'] for d in data.rows)), 'Formality Levels'),
+            (sum(d['tokens_out'] for d in data.rows), 'Total Tokens'),
+            (sum(d['word_count'] for d in data.rows), 'Total Words')
+        )
+        for value, label in cards:
+            f.write(_METRIC_CARD.substitute(value=value, label=label))
+        f.write(_HTML_CHARTS)
 
-        # Build data table
-        table_rows = []
-        for d in data:
-            table_rows.append(f"""
+        # Data table
+        for d in data.rows:
+            f.write(f"""
                 <tr>
                     <td>{d['language'].upper()}</td>
                     <td>{d['formality'].capitalize()}</td>
@@ -306,170 +626,12 @@ class HTMLReportGenerator:
                 </tr>
             """)
 
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Multilingual Prompt Report: {prompt_id}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .header h1 {{
-            margin: 0 0 10px 0;
-        }}
-        .header p {{
-            margin: 0;
-            opacity: 0.9;
-        }}
-        .section {{
-            background: white;
-            padding: 30px;
-            margin-bottom: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .section h2 {{
-            margin-top: 0;
-            color: #667eea;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #667eea;
-            color: white;
-            font-weight: 600;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .footer {{
-            text-align: center;
-            color: #666;
-            margin-top: 40px;
-            padding: 20px;
-        }}
-        .metric-card {{
-            display: inline-block;
-            background: #f8f9fa;
-            padding: 20px;
-            margin: 10px;
-            border-radius: 8px;
-            min-width: 150px;
-        }}
-        .metric-value {{
-            font-size: 32px;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        .metric-label {{
-            font-size: 14px;
-            color: #666;
-            margin-top: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🌍 Multilingual Prompt Optimization Report</h1>
-        <p><strong>Prompt ID:</strong> {prompt_id}</p>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p><strong>Variants Analyzed:</strong> {len(data)}</p>
-    </div>
-
-    <div class="section">
-        <h2>📊 Summary Metrics</h2>
-        <div class="metric-card">
-            <div class="metric-value">{len(set(d['language'] for d in data))}</div>
-            <div class="metric-label">Languages</div>
-        </div>
-        <div class="metric-card">
-            <div class="metric-value">{len(set(d['formality'] for d in data))}</div>
-            <div class="metric-label">Formality Levels</div>
-        </div>
-        <div class="metric-card">
-            <div class="metric-value">{sum(d['tokens_out'] for d in data)}</div>
-            <div class="metric-label">Total Tokens</div>
-        </div>
-        <div class="metric-card">
-            <div class="metric-value">{sum(d['word_count'] for d in data)}</div>
-            <div class="metric-label">Total Words</div>
-        </div>
-    </div>
-
-    <div class="section">
-        <h2>📈 Token Usage Analysis</h2>
-        {fig_htmls[0]}
-    </div>
+        f.write(_HTML_TABLE_END)
+        f.write(_HTML_FOOTER)
 
-    <div class="section">
-        <h2>🎯 Cultural Appropriateness</h2>
-        {fig_htmls[1]}
-    </div>
-
-    <div class="section">
-        <h2>📚 Lexical Diversity</h2>
-        {fig_htmls[2]}
-    </div>
+        # Serialize figures once; plotly.js is loaded once and renders each spec
+        # into its placeholder div (figures are validated when built)
+        for i, fig in enumerate(figures):
+            f.write(_HTML_SPEC.substitute(index=i, spec=pio.to_json(fig, validate=False)))
 
-    <div class="section">
-        <h2>📏 Response Length Distribution</h2>
-        {fig_htmls[3]}
-    </div>
-
-    <div class="section">
-        <h2>🎭 Formality Comparison</h2>
-        {fig_htmls[4]}
-    </div>
-
-    <div class="section">
-        <h2>📋 Detailed Data Table</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Language</th>
-                    <th>Formality</th>
-                    <th>Tokens In</th>
-                    <th>Tokens Out</th>
-                    <th>Words</th>
-                    <th>Lexical Diversity</th>
-                    <th>Cultural Score</th>
-                </tr>
-            </thead>
-            <tbody>
-                {''.join(table_rows)}
-            </tbody>
-        </table>
-    </div>
-
-    <div class="footer">
-        <p>Generated with <strong>Multilingual Prompt Optimizer</strong></p>
-        <p>Powered by Gemma 2 9B (LMStudio) • Plotly Visualizations</p>
-    </div>
-</body>
-</html>
-"""
-        return html
+        f.write(_HTML_END)
@@ -4,10 +4,12 @@ Storage module for caching and experiment tracking.
 
 from .cache_manager import CacheManager
 from .experiment_tracker import ExperimentTracker, ExperimentConfig, ExperimentRun
+from .experiment_tracker_sqlite import SQLiteExperimentTracker
 
 __all__ = [
     "CacheManager",
     "ExperimentTracker",
     "ExperimentConfig",
     "ExperimentRun",
+    "SQLiteExperimentTracker",
 ]
@@ -5,13 +5,27 @@ This module handles storage and retrieval of pre-generated prompt variants
 and LLM responses, enabling the demo to run without API keys.
 """
 
+import hashlib
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Optional
-from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+from ..core.clock import utc_now_iso
 from ..core.prompt import PromptVariant, LLMResponse, FormalityLevel
+from ..constants import (
+    CACHE_JOURNAL_COMPACT_LINES,
+    CACHE_METADATA_FILE,
+    CACHE_METADATA_JOURNAL_FILE,
+    MEMORY_CACHE_MAX_ENTRIES,
+)
+from .semantic_cache import SemanticCache, DEFAULT_MAX_ENTRIES, DEFAULT_SIMILARITY_THRESHOLD
+from .serialization import dumps_json, read_json, read_json_lines, write_json
 
 
 class CacheManager:
@@ -22,43 +36,157 @@ class CacheManager:
     eliminating the need for API calls during demonstrations.
     """
 
-    def __init__(self, cache_dir: str = "data/cache"):
+    def __init__(
+        self,
+        cache_dir: str = "data/cache",
+        memory_cache_size: int = MEMORY_CACHE_MAX_ENTRIES
+    ):
         """
         Initialize cache manager.
 
         Args:
             cache_dir: Root directory for cache storage
+            memory_cache_size: Maximum number of variants and of responses
+                kept in memory (least recently used entries are evicted)
         """
         self.cache_dir = Path(cache_dir)
         self.prompts_dir = self.cache_dir / "prompts"
         self.responses_dir = self.cache_dir / "responses"
+        self.llm_outputs_dir = self.cache_dir / "llm_outputs"
+        self.metrics_dir = self.cache_dir / "metrics"
 
         # Create directories if they don't exist
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
         self.responses_dir.mkdir(parents=True, exist_ok=True)
-
-        # Cache metadata
-        self.metadata_file = self.cache_dir / "cache_metadata.json"
-        self._load_metadata()
+        self.llm_outputs_dir.mkdir(parents=True, exist_ok=True)
+        self.metrics_dir.mkdir(parents=True, exist_ok=True)
+
+        # In-memory LRU layer over the per-key variant/response files, so
+        # repeated lookups (e.g. report loops) skip the file read and parse
+        self._memory_cache_size = memory_cache_size
+        self._variant_memo: "OrderedDict[Tuple[str, str, str], PromptVariant]" = OrderedDict()
+        self._response_memo: "OrderedDict[Tuple[str, str, str], LLMResponse]" = OrderedDict()
+        self._memo_lock = threading.Lock()  # Lookups may come from worker threads (e.g. reports)
+
+        # Index of response files on disk, built by one directory scan on the
+        # first lookup so misses don't each cost a stat() call
+        self._response_index: Optional[Dict[Tuple[str, str, str], Path]] = None
+
+        # Content-addressed LLM output cache (memory layer + hit/miss counters)
+        self._llm_outputs: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.llm_cache_stats = {"hits": 0, "misses": 0}
+        self.semantic_dir = self.cache_dir / "semantic"
+        self._semantic_caches: Dict[str, SemanticCache] = {}
+
+        # Cache metadata (loaded from disk on first access): a snapshot file
+        # plus an append-only journal of the entries recorded since, so each
+        # cached item appends one line instead of rewriting the whole file
+        self.metadata_file = self.cache_dir / CACHE_METADATA_FILE
+        self.journal_file = self.cache_dir / CACHE_METADATA_JOURNAL_FILE
+        self._metadata: Optional[Dict] = None
+        self._journal = None  # Journal kept open by bulk()
+        self._journal_lines = 0  # Entries in the journal since the last compaction
+
+    @property
+    def metadata(self) -> Dict:
+        """Cache metadata, loaded from disk the first time it is needed."""
+        if self._metadata is None:
+            self._load_metadata()
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict) -> None:
+        self._metadata = value
 
     def _load_metadata(self):
-        """Load cache metadata."""
+        """Load cache metadata (snapshot, then journaled entries)."""
         if self.metadata_file.exists():
-            with open(self.metadata_file, 'r') as f:
-                self.metadata = json.load(f)
+            self.metadata = read_json(self.metadata_file)
         else:
             self.metadata = {
                 "version": "1.0.0",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": utc_now_iso(),
                 "cached_variants": {},
                 "cached_responses": {}
             }
 
+        self._journal_lines = 0
+        if self.journal_file.exists():
+            # A torn last line (process killed mid-append) is dropped
+            for entry in read_json_lines(self.journal_file):
+                self._apply_journal_entry(entry)
+                self._journal_lines += 1
+
+    def _apply_journal_entry(self, entry: Dict) -> None:
+        """Apply one journaled metadata entry to the in-memory metadata."""
+        self.metadata[entry["kind"]][entry["key"]] = entry["info"]
+        self.metadata["updated_at"] = entry["info"]["cached_at"]
+
+    def _record_metadata(self, kind: str, key: str, info: Dict) -> None:
+        """Record a cached item in memory and append it to the metadata journal."""
+        entry = {"kind": kind, "key": key, "info": info}
+        self._apply_journal_entry(entry)
+        line = dumps_json(entry) + b"\n"
+        self._journal_lines += 1
+        if self._journal is not None:
+            self._journal.write(line)
+            return
+        with open(self.journal_file, 'ab') as f:
+            f.write(line)
+        if self._journal_lines >= CACHE_JOURNAL_COMPACT_LINES:
+            self.compact()
+
+    @contextmanager
+    def bulk(self, fsync: bool = False) -> Iterator["CacheManager"]:
+        """
+        Cache many items with a single metadata journal write.
+
+        Inside the block the journal stays open and its lines are buffered;
+        they are flushed (and optionally fsync'ed) once on exit, and the
+        journal is then folded into the snapshot file. Nested bulk() blocks
+        join the outermost one.
+
+        Args:
+            fsync: Force the journal to disk on exit
+
+        Example:
+            >>> with cache.bulk():
+            ...     for variant in variants:
+            ...         cache.cache_variant(variant)
+        """
+        if self._journal is not None:
+            yield self
+            return
+
+        self._journal = open(self.journal_file, 'ab')
+        try:
+            yield self
+        finally:
+            journal, self._journal = self._journal, None
+            journal.flush()
+            if fsync:
+                os.fsync(journal.fileno())
+            journal.close()
+            if self._journal_lines:
+                self.compact()
+
     def _save_metadata(self):
         """Save cache metadata."""
-        self.metadata["updated_at"] = datetime.utcnow().isoformat()
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+        self.metadata["updated_at"] = utc_now_iso()
+        write_json(self.metadata_file, self.metadata, indent=True, atomic=True)
+
+    def compact(self) -> None:
+        """
+        Fold the metadata journal into the metadata snapshot file.
+
+        Raises:
+            RuntimeError: If called inside a bulk() block
+        """
+        if self._journal is not None:
+            raise RuntimeError("compact() cannot run inside a bulk() block")
+        self._save_metadata()
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_lines = 0
 
     def _get_variant_cache_path(
         self,
@@ -98,16 +226,15 @@ class CacheManager:
         )
 
         # Save variant to file
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(variant.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(cache_path, variant.to_dict(), indent=True)
+        self._remember(self._variant_memo, (variant.template_id, variant.language, formality_str), variant)
 
         # Update metadata
         cache_key = f"{variant.template_id}_{variant.language}_{formality_str}"
-        self.metadata["cached_variants"][cache_key] = {
+        self._record_metadata("cached_variants", cache_key, {
             "file": str(cache_path.name),
-            "cached_at": datetime.utcnow().isoformat()
-        }
-        self._save_metadata()
+            "cached_at": utc_now_iso()
+        })
 
     def get_cached_variant(
         self,
@@ -126,15 +253,21 @@ class CacheManager:
         Returns:
             PromptVariant if cached, None otherwise
         """
+        key = (template_id, language, formality)
+        variant = self._recall(self._variant_memo, key)
+        if variant is not None:
+            return variant
+
         cache_path = self._get_variant_cache_path(template_id, language, formality)
 
         if not cache_path.exists():
             return None
 
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(cache_path)
 
-        return PromptVariant.from_dict(data)
+        variant = PromptVariant.from_dict(data)
+        self._remember(self._variant_memo, key, variant)
+        return variant
 
     def cache_response(
         self,
@@ -155,17 +288,19 @@ class CacheManager:
         cache_path = self._get_response_cache_path(template_id, language, formality)
 
         # Save response to file
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(response.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(cache_path, response.to_dict(), indent=True)
+        key = (template_id, language, formality)
+        self._remember(self._response_memo, key, response)
+        if self._response_index is not None:
+            self._response_index[key] = cache_path
 
         # Update metadata
         cache_key = f"{template_id}_{language}_{formality}"
-        self.metadata["cached_responses"][cache_key] = {
+        self._record_metadata("cached_responses", cache_key, {
             "file": str(cache_path.name),
-            "cached_at": datetime.utcnow().isoformat(),
+            "cached_at": utc_now_iso(),
             "model": response.model
-        }
-        self._save_metadata()
+        })
 
     def get_cached_response(
         self,
@@ -184,15 +319,261 @@ class CacheManager:
         Returns:
             LLMResponse if cached, None otherwise
         """
-        cache_path = self._get_response_cache_path(template_id, language, formality)
+        key = (template_id, language, formality)
+        response = self._recall(self._response_memo, key)
+        if response is not None:
+            return response
+
+        cache_path = self._get_response_index().get(key)
+        if cache_path is None:
+            return None
+
+        data = read_json(cache_path)
+
+        response = LLMResponse.from_dict(data)
+        self._remember(self._response_memo, key, response)
+        return response
+
+    def get_cached_responses(self, template_id: str) -> Dict[Tuple[str, str], LLMResponse]:
+        """
+        Retrieve all cached LLM responses of a prompt template.
+
+        Uses the response file index, so files are only opened for the
+        variants that exist (no per-pair existence checks).
+
+        Args:
+            template_id: Prompt template ID
+
+        Returns:
+            Mapping of (language, formality) to LLMResponse
+        """
+        keys = [key for key in self._get_response_index() if key[0] == template_id]
+        responses = {}
+        for key in keys:
+            response = self.get_cached_response(*key)
+            if response is not None:
+                responses[key[1:]] = response
+        return responses
+
+    def _get_response_index(self) -> Dict[Tuple[str, str, str], Path]:
+        """Map (template_id, language, formality) to response files, scanning the directory once."""
+        if self._response_index is None:
+            index = {}
+            for path in self.responses_dir.glob("*_response.json"):
+                # Template IDs may contain underscores; language/formality don't
+                parts = path.stem.rsplit("_", 3)
+                if len(parts) == 4:
+                    index[(parts[0], parts[1], parts[2])] = path
+            self._response_index = index
+        return self._response_index
+
+    def _recall(self, memo: OrderedDict, key: Tuple[str, str, str]):
+        """Look up a copy of an in-memory entry, marking it as most recently used."""
+        with self._memo_lock:
+            value = memo.get(key)
+            if value is None:
+                return None
+            memo.move_to_end(key)
+        # Copies (with their own metadata dict), so callers can't alter the memo
+        return replace(value, metadata=dict(value.metadata))
+
+    def _remember(self, memo: OrderedDict, key: Tuple[str, str, str], value) -> None:
+        """Store a copy of an in-memory entry, evicting the least recently used one if full."""
+        if self._memory_cache_size <= 0:
+            return
+        value = replace(value, metadata=dict(value.metadata))
+        with self._memo_lock:
+            memo[key] = value
+            memo.move_to_end(key)
+            if len(memo) > self._memory_cache_size:
+                memo.popitem(last=False)
+
+    def _get_metrics_cache_path(
+        self,
+        template_id: str,
+        language: str,
+        formality: str
+    ) -> Path:
+        """Get file path for cached response metrics."""
+        filename = f"{template_id}_{language}_{formality}_metrics.json"
+        return self.metrics_dir / filename
+
+    @staticmethod
+    def _response_fingerprint(response: LLMResponse) -> str:
+        """Hash the response fields that metrics are computed from."""
+        payload = f"{response.tokens_output}\n{response.content}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cache_metrics(
+        self,
+        response: LLMResponse,
+        template_id: str,
+        language: str,
+        formality: str,
+        domain: str,
+        metrics: Dict
+    ) -> None:
+        """
+        Cache the metrics computed for a cached LLM response.
+
+        Entries are tied to a hash of the response content, so metrics of a
+        response that has since been regenerated are never returned.
+
+        Args:
+            response: LLMResponse the metrics were computed for
+            template_id: Associated prompt template ID
+            language: Language code
+            formality: Formality level
+            domain: Prompt domain the qualitative metrics were scored for
+            metrics: Dictionary with "quantitative" and "qualitative" results
+        """
+        cache_path = self._get_metrics_cache_path(template_id, language, formality)
+        fingerprint = self._response_fingerprint(response)
+
+        entry = {"response_hash": fingerprint, "domains": {}}
+        if cache_path.exists():
+            existing = read_json(cache_path)
+            if existing.get("response_hash") == fingerprint:
+                entry = existing
+
+        entry["domains"][domain] = metrics
+        write_json(cache_path, entry)
+
+    def get_cached_metrics(
+        self,
+        response: LLMResponse,
+        template_id: str,
+        language: str,
+        formality: str,
+        domain: str
+    ) -> Optional[Dict]:
+        """
+        Retrieve cached metrics for an LLM response.
+
+        Args:
+            response: LLMResponse the metrics should belong to
+            template_id: Prompt template ID
+            language: Language code
+            formality: Formality level
+            domain: Prompt domain the qualitative metrics were scored for
+
+        Returns:
+            Dictionary with "quantitative" and "qualitative" results, or None
+            if not cached (or cached for different response content)
+        """
+        cache_path = self._get_metrics_cache_path(template_id, language, formality)
 
         if not cache_path.exists():
             return None
 
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        entry = read_json(cache_path)
 
-        return LLMResponse.from_dict(data)
+        if entry.get("response_hash") != self._response_fingerprint(response):
+            return None
+        return entry["domains"].get(domain)
+
+    @staticmethod
+    def make_llm_cache_key(model: str, prompt: str, temperature: float, **context) -> str:
+        """
+        Build a content-addressed key for a deterministic LLM call.
+
+        Args:
+            model: Model identifier the prompt is sent to
+            prompt: Full prompt text
+            temperature: Sampling temperature
+            **context: Extra fields that influence the output (e.g. max_tokens)
+
+        Returns:
+            SHA-256 hex digest identifying the call
+        """
+        payload = json.dumps(
+            {"model": model, "prompt": prompt, "temperature": temperature, **context},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_llm_output(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached LLM output by content-addressed key.
+
+        Checks the in-memory layer first, then the on-disk store. Expired
+        entries are treated as misses.
+
+        Args:
+            key: Key from make_llm_cache_key()
+
+        Returns:
+            Cached output text, or None on a miss
+        """
+        entry = self._llm_outputs.get(key)
+        if entry is None:
+            cache_path = self.llm_outputs_dir / f"{key}.json"
+            if cache_path.exists():
+                data = read_json(cache_path)
+                entry = (data["content"], data.get("expires_at"))
+                self._llm_outputs[key] = entry
+
+        content = None
+        if entry is not None and (entry[1] is None or entry[1] > time.time()):
+            content = entry[0]
+
+        if content is None:
+            self.llm_cache_stats["misses"] += 1
+        else:
+            self.llm_cache_stats["hits"] += 1
+        return content
+
+    def cache_llm_output(self, key: str, content: str, ttl: Optional[float] = None) -> None:
+        """
+        Store an LLM output under a content-addressed key.
+
+        Args:
+            key: Key from make_llm_cache_key()
+            content: Output text to cache
+            ttl: Optional lifetime in seconds (None = never expires)
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._llm_outputs[key] = (content, expires_at)
+        entry = {
+            "content": content,
+            "cached_at": utc_now_iso(),
+            "expires_at": expires_at
+        }
+        write_json(self.llm_outputs_dir / f"{key}.json", entry)
+
+    def get_semantic_cache(
+        self,
+        namespace: str,
+        embed: Callable[[str], List[float]],
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> SemanticCache:
+        """
+        Get (or create) the semantic similarity cache for a namespace.
+
+        Each namespace (e.g. a language code) is persisted to its own file
+        under cache_dir/semantic, so embeddings from different models or
+        languages are never compared with each other.
+
+        Args:
+            namespace: Cache namespace
+            embed: Function returning an embedding vector for a text
+            similarity_threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of entries kept (least recently
+                used are evicted first)
+
+        Returns:
+            SemanticCache for the namespace
+        """
+        if namespace not in self._semantic_caches:
+            self._semantic_caches[namespace] = SemanticCache(
+                embed,
+                cache_file=self.semantic_dir / f"{namespace}.json",
+                similarity_threshold=similarity_threshold,
+                max_entries=max_entries
+            )
+        return self._semantic_caches[namespace]
 
     def is_cached(
         self,
@@ -252,15 +633,30 @@ class CacheManager:
 
         for file in self.responses_dir.glob("*.json"):
             file.unlink()
+        self._variant_memo.clear()
+        self._response_memo.clear()
+        self._response_index = None
+
+        for file in self.metrics_dir.glob("*.json"):
+            file.unlink()
+
+        for file in self.llm_outputs_dir.glob("*.json"):
+            file.unlink()
+        self._llm_outputs.clear()
+
+        for pattern in ("*.json", "*.jsonl"):
+            for file in self.semantic_dir.glob(pattern):
+                file.unlink()
+        self._semantic_caches.clear()
 
         # Reset metadata
         self.metadata = {
             "version": "1.0.0",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": utc_now_iso(),
             "cached_variants": {},
             "cached_responses": {}
         }
-        self._save_metadata()
+        self.compact()
 
     def validate_cache(self) -> Dict:
         """
@@ -270,11 +666,14 @@ class CacheManager:
             Dictionary with validation results
         """
         issues = []
+        # One directory scan each instead of a glob plus a stat() per entry
+        variant_files = _json_file_names(self.prompts_dir)
+        response_files = _json_file_names(self.responses_dir)
         stats = {
             "variants_in_metadata": len(self.metadata["cached_variants"]),
-            "variants_on_disk": len(list(self.prompts_dir.glob("*.json"))),
+            "variants_on_disk": len(variant_files),
             "responses_in_metadata": len(self.metadata["cached_responses"]),
-            "responses_on_disk": len(list(self.responses_dir.glob("*.json"))),
+            "responses_on_disk": len(response_files),
             "issues": []
         }
 
@@ -287,16 +686,23 @@ class CacheManager:
 
         # Check if files in metadata actually exist
         for key, info in self.metadata["cached_variants"].items():
-            file_path = self.prompts_dir / info["file"]
-            if not file_path.exists():
+            if info["file"] not in variant_files:
                 issues.append(f"Missing variant file: {info['file']}")
 
         for key, info in self.metadata["cached_responses"].items():
-            file_path = self.responses_dir / info["file"]
-            if not file_path.exists():
+            if info["file"] not in response_files:
                 issues.append(f"Missing response file: {info['file']}")
 
         stats["issues"] = issues
         stats["valid"] = len(issues) == 0
 
         return stats
+
+
+def _json_file_names(directory: Path) -> Set[str]:
+    """Return the names of the JSON files directly inside a directory."""
+    with os.scandir(directory) as entries:
+        return {
+            entry.name for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        }
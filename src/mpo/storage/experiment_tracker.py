@@ -5,26 +5,94 @@ This module provides structured tracking of evaluation experiments,
 enabling reproducibility and analysis.
 """
 
-import json
-from datetime import datetime
+import bisect
+import copy
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 
+from ..constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    EXPERIMENT_INDEX_COMPACT_LINES,
+    EXPERIMENT_INDEX_FLUSH_INTERVAL_SECONDS,
+    EXPERIMENT_RESULTS_FILE,
+)
+from ..core.clock import utc_now_iso, utc_now_iso_us
+from .serialization import atomic_open, dumps_json, loads_json, read_json, read_json_lines, write_json
 
-@dataclass
+# Buffer for streamed exports, which write one small chunk per result
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Maximum number of loaded experiments kept in memory
+_EXPERIMENT_MEMO_MAX_ENTRIES = 256
+
+# Sort key of index entries
+_started_at = itemgetter("started_at")
+
+
+
+def _append_lines(path: Path, lines: List[bytes]) -> None:
+    """Append queued journal lines to a file and empty the queue."""
+    if lines:
+        with open(path, 'ab') as f:
+            f.write(b"".join(lines))
+        lines.clear()
+
+
+@dataclass(frozen=True, slots=True)
 class ExperimentConfig:
-    """Configuration for an evaluation experiment."""
-    prompt_ids: List[str]
-    languages: List[str]
-    formality_levels: List[str]
+    """
+    Configuration for an evaluation experiment.
+
+    Immutable (and therefore hashable), so one config can be shared by the
+    runs of a sweep. The ID, language and formality fields accept any
+    iterable of strings and are stored as tuples.
+    """
+    prompt_ids: Tuple[str, ...]
+    languages: Tuple[str, ...]
+    formality_levels: Tuple[str, ...]
     model: str
     temperature: float = 0.7
     max_tokens: int = 1024
     demo_mode: bool = False
+    _dict: Dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normalize the sequence fields and build the to_dict() result once."""
+        for name in ("prompt_ids", "languages", "formality_levels"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+        object.__setattr__(self, "_dict", {
+            "prompt_ids": list(self.prompt_ids),
+            "languages": list(self.languages),
+            "formality_levels": list(self.formality_levels),
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "demo_mode": self.demo_mode
+        })
 
+    def to_dict(self) -> Dict:
+        """
+        Convert to dictionary for serialization.
+
+        Every save of an experiment embeds this, so the dictionary is built
+        once per config. It is shared between callers and must be treated
+        as read-only.
+        """
+        return self._dict
 
-@dataclass
+
+@dataclass(slots=True)
 class ExperimentRun:
     """
     Record of a complete experiment run.
@@ -34,7 +102,7 @@ class ExperimentRun:
     id: str
     name: str
     config: ExperimentConfig
-    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    started_at: str = field(default_factory=utc_now_iso_us)
     completed_at: Optional[str] = None
     status: str = "running"  # running, completed, failed
     results_summary: Dict = field(default_factory=dict)
@@ -42,11 +110,18 @@ class ExperimentRun:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        # Convert ExperimentConfig to dict
-        if isinstance(data['config'], ExperimentConfig):
-            data['config'] = asdict(data['config'])
-        return data
+        # Explicit literal rather than dataclasses.asdict(), which walks
+        # fields() and deep-copies every nested dict and list
+        return {
+            "id": self.id,
+            "name": self.name,
+            "config": self.config.to_dict(),
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "status": self.status,
+            "results_summary": self.results_summary,
+            "metadata": self.metadata
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "ExperimentRun":
@@ -62,7 +137,13 @@ class ExperimentTracker:
     Tracks evaluation experiments and stores results.
 
     Provides structured logging of experimental runs for reproducibility
-    and analysis.
+    and analysis. The index is a snapshot file plus an append-only journal
+    of the index events (created/updated experiments) since; events are
+    coalesced and appended at most once per
+    EXPERIMENT_INDEX_FLUSH_INTERVAL_SECONDS, and pending ones are written by
+    flush() (also when the tracker is garbage collected or at interpreter
+    exit). compact() folds the journal into the snapshot; flush() calls it
+    once the journal holds EXPERIMENT_INDEX_COMPACT_LINES events.
     """
 
     def __init__(self, experiments_dir: str = "data/experiments"):
@@ -75,32 +156,105 @@ class ExperimentTracker:
         self.experiments_dir = Path(experiments_dir)
         self.experiments_dir.mkdir(parents=True, exist_ok=True)
 
-        # Index of all experiments
+        # Index of all experiments (snapshot, then journaled events)
         self.index_file = self.experiments_dir / "experiments_index.json"
+        self.index_journal_file = self.experiments_dir / "experiments_index.jsonl"
         self._load_index()
+        self._pending_index_events: List[bytes] = []
+        self._last_index_flush = 0.0
+        # Writes queued events if the tracker is collected or alive at exit;
+        # unlike atexit.register(self.flush) it doesn't keep the tracker alive
+        weakref.finalize(self, _append_lines, self.index_journal_file, self._pending_index_events)
+
+        # Loaded experiments by ID with the file mtime they were parsed at,
+        # least recently used first
+        self._experiment_memo: "OrderedDict[str, Tuple[int, ExperimentRun]]" = OrderedDict()
+        self._memo_lock = threading.Lock()  # load_experiments() loads from worker threads
 
     def _load_index(self):
-        """Load experiments index."""
+        """Load experiments index (snapshot, then journaled events)."""
         if self.index_file.exists():
-            with open(self.index_file, 'r') as f:
-                self.index = json.load(f)
+            self.index = read_json(self.index_file)
         else:
             self.index = {
                 "experiments": [],
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": utc_now_iso_us()
             }
+            # Events are journaled from here on, so persist created_at now
+            self._save_index()
+        # Index entries by experiment ID (same dicts as in the list)
+        self._by_id = {exp["id"]: exp for exp in self.index["experiments"]}
+        # The same entries kept sorted by started_at; reversed before sorting
+        # so that reverse iteration lists ties in index order
+        self._by_start = sorted(reversed(self.index["experiments"]), key=_started_at)
+
+        self._index_journal_lines = 0
+        if self.index_journal_file.exists():
+            # A torn last line (process killed mid-append) is dropped
+            for event in read_json_lines(self.index_journal_file):
+                self._apply_index_event(event)
+                self._index_journal_lines += 1
+
+    def _apply_index_event(self, event: Dict) -> None:
+        """Apply one index event to the in-memory index."""
+        entry = event["entry"]
+        existing = self._by_id.get(entry["id"])
+        if existing is not None:
+            # An update, or a create replayed after a compact() that saved the
+            # snapshot but was interrupted before removing the journal
+            existing.update(entry)
+        elif event["op"] == "create":
+            self.index["experiments"].append(entry)
+            self._by_id[entry["id"]] = entry
+            bisect.insort_left(self._by_start, entry, key=_started_at)
+        self.index["updated_at"] = event["at"]
+
+    def _record_index_event(self, op: str, entry: Dict, durable: bool = False) -> None:
+        """
+        Apply an index event and queue it for the journal.
+
+        Queued events are appended unless the journal was written just now.
+
+        Args:
+            op: "create" (entry is a new index entry) or "update" (entry holds
+                the ID and the changed fields)
+            entry: Index entry fields
+            durable: Append the queued events immediately
+        """
+        event = {"op": op, "entry": entry, "at": utc_now_iso()}
+        self._pending_index_events.append(dumps_json(event) + b"\n")
+        # Applied after encoding, so the created entry isn't aliased in the queue
+        self._apply_index_event(event)
+        if durable or time.monotonic() - self._last_index_flush > EXPERIMENT_INDEX_FLUSH_INTERVAL_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """Append pending index events to the journal, compacting it once it is large."""
+        self._index_journal_lines += len(self._pending_index_events)
+        _append_lines(self.index_journal_file, self._pending_index_events)
+        self._last_index_flush = time.monotonic()
+        if self._index_journal_lines >= EXPERIMENT_INDEX_COMPACT_LINES:
+            self.compact()
 
     def _save_index(self):
-        """Save experiments index."""
-        self.index["updated_at"] = datetime.utcnow().isoformat()
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        """Save experiments index (compact: it is internal and rewritten often)."""
+        self.index["updated_at"] = utc_now_iso()
+        write_json(self.index_file, self.index, atomic=True)
+
+    def compact(self) -> None:
+        """Fold the index journal (and pending events) into the index snapshot file."""
+        # Cleared in place: the finalizer holds the same list
+        self._pending_index_events.clear()
+        self._save_index()
+        self.index_journal_file.unlink(missing_ok=True)
+        self._index_journal_lines = 0
 
     def create_experiment(
         self,
         name: str,
         config: ExperimentConfig,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        durable: bool = False
     ) -> ExperimentRun:
         """
         Create a new experiment run.
@@ -109,12 +263,13 @@ class ExperimentTracker:
             name: Human-readable experiment name
             config: Experiment configuration
             metadata: Additional metadata
+            durable: Write the index immediately instead of coalescing
 
         Returns:
             ExperimentRun instance
         """
         # Generate unique ID
-        exp_id = f"exp_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        exp_id = time.strftime("exp_%Y%m%d_%H%M%S", time.gmtime())
 
         experiment = ExperimentRun(
             id=exp_id,
@@ -127,13 +282,12 @@ class ExperimentTracker:
         self._save_experiment(experiment)
 
         # Update index
-        self.index["experiments"].append({
+        self._record_index_event("create", {
             "id": exp_id,
             "name": name,
             "started_at": experiment.started_at,
             "status": experiment.status
-        })
-        self._save_index()
+        }, durable)
 
         return experiment
 
@@ -144,8 +298,10 @@ class ExperimentTracker:
     def _save_experiment(self, experiment: ExperimentRun):
         """Save experiment to disk."""
         exp_path = self._get_experiment_path(experiment.id)
-        with open(exp_path, 'w') as f:
-            json.dump(experiment.to_dict(), f, indent=2)
+        write_json(exp_path, experiment.to_dict(), atomic=True)
+        # Don't rely on the mtime alone, its resolution may be coarse
+        with self._memo_lock:
+            self._experiment_memo.pop(experiment.id, None)
 
     def load_experiment(self, exp_id: str) -> Optional[ExperimentRun]:
         """
@@ -158,19 +314,68 @@ class ExperimentTracker:
             ExperimentRun if found, None otherwise
         """
         exp_path = self._get_experiment_path(exp_id)
-        if not exp_path.exists():
+        try:
+            mtime_ns = exp_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
 
-        with open(exp_path, 'r') as f:
-            data = json.load(f)
+        # Reuse the parsed record while the file is unchanged; callers get a
+        # copy so their edits don't leak into the memo
+        with self._memo_lock:
+            cached = self._experiment_memo.get(exp_id)
+            if cached is not None and cached[0] == mtime_ns:
+                self._experiment_memo.move_to_end(exp_id)
+                return copy.deepcopy(cached[1])
+
+        experiment = ExperimentRun.from_dict(read_json(exp_path))
+        with self._memo_lock:
+            self._experiment_memo[exp_id] = (mtime_ns, experiment)
+            self._experiment_memo.move_to_end(exp_id)
+            if len(self._experiment_memo) > _EXPERIMENT_MEMO_MAX_ENTRIES:
+                self._experiment_memo.popitem(last=False)
+        return copy.deepcopy(experiment)
+
+    def load_experiments(self, exp_ids: List[str]) -> List[ExperimentRun]:
+        """
+        Load many experiments, reading their files concurrently.
 
-        return ExperimentRun.from_dict(data)
+        Args:
+            exp_ids: Experiment IDs
+
+        Returns:
+            ExperimentRuns of the IDs that exist, in the order given
+        """
+        if len(exp_ids) <= 1:
+            experiments = [self.load_experiment(exp_id) for exp_id in exp_ids]
+        else:
+            workers = min(DEFAULT_MAX_CONCURRENCY, len(exp_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                experiments = list(executor.map(self.load_experiment, exp_ids))
+        return [experiment for experiment in experiments if experiment is not None]
+
+    def get_experiment_pretty(self, exp_id: str) -> Optional[str]:
+        """
+        Get an experiment record as indented JSON for reading.
+
+        Experiment files are stored compactly; this re-encodes one on demand.
+
+        Args:
+            exp_id: Experiment ID
+
+        Returns:
+            Pretty-printed JSON if found, None otherwise
+        """
+        exp_path = self._get_experiment_path(exp_id)
+        if not exp_path.exists():
+            return None
+        return dumps_json(read_json(exp_path), indent=True).decode('utf-8')
 
     def update_experiment(
         self,
         experiment: ExperimentRun,
         status: Optional[str] = None,
-        results_summary: Optional[Dict] = None
+        results_summary: Optional[Dict] = None,
+        durable: bool = False
     ):
         """
         Update experiment status and results.
@@ -179,11 +384,12 @@ class ExperimentTracker:
             experiment: ExperimentRun to update
             status: New status (if changing)
             results_summary: Results summary to add/update
+            durable: Write the index immediately instead of coalescing
         """
         if status:
             experiment.status = status
             if status == "completed":
-                experiment.completed_at = datetime.utcnow().isoformat()
+                experiment.completed_at = utc_now_iso_us()
 
         if results_summary:
             experiment.results_summary.update(results_summary)
@@ -192,14 +398,11 @@ class ExperimentTracker:
         self._save_experiment(experiment)
 
         # Update index
-        for exp in self.index["experiments"]:
-            if exp["id"] == experiment.id:
-                exp["status"] = experiment.status
-                if experiment.completed_at:
-                    exp["completed_at"] = experiment.completed_at
-                break
-
-        self._save_index()
+        if experiment.id in self._by_id:
+            changes = {"id": experiment.id, "status": experiment.status}
+            if experiment.completed_at:
+                changes["completed_at"] = experiment.completed_at
+            self._record_index_event("update", changes, durable)
 
     def store_result(
         self,
@@ -215,21 +418,21 @@ class ExperimentTracker:
             result_data: Result data to store
             result_type: Type of result (evaluation, metric, etc.)
         """
-        # Create results subdirectory for this experiment
-        results_dir = self.experiments_dir / exp_id / "results"
-        results_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate result filename
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')
-        result_file = results_dir / f"{result_type}_{timestamp}.json"
-
-        # Save result
-        with open(result_file, 'w') as f:
-            json.dump({
-                "type": result_type,
-                "timestamp": datetime.utcnow().isoformat(),
-                "data": result_data
-            }, f, indent=2)
+        # Append one JSON Lines record to the experiment's results log
+        exp_dir = self.experiments_dir / exp_id
+        exp_dir.mkdir(parents=True, exist_ok=True)
+
+        # Framed by hand so only the result data goes through the encoder
+        # (timestamps are plain ASCII and need no escaping)
+        line = b'{"type":%b,"timestamp":"%b","data":%b}\n' % (
+            dumps_json(result_type), utc_now_iso().encode('ascii'), dumps_json(result_data)
+        )
+        with open(self._get_results_path(exp_id), 'ab') as f:
+            f.write(line)
+
+    def _get_results_path(self, exp_id: str) -> Path:
+        """Get file path for an experiment's results log."""
+        return self.experiments_dir / exp_id / EXPERIMENT_RESULTS_FILE
 
     def get_experiment_results(self, exp_id: str) -> List[Dict]:
         """
@@ -239,18 +442,25 @@ class ExperimentTracker:
             exp_id: Experiment ID
 
         Returns:
-            List of result dictionaries
+            List of result dictionaries in the order they were stored
         """
-        results_dir = self.experiments_dir / exp_id / "results"
-        if not results_dir.exists():
-            return []
-
-        results = []
-        for result_file in sorted(results_dir.glob("*.json")):
-            with open(result_file, 'r') as f:
-                results.append(json.load(f))
-
-        return results
+        return [loads_json(line) for line in self._iter_result_lines(exp_id)]
+
+    def _iter_result_lines(self, exp_id: str) -> Iterator[bytes]:
+        """Yield the stored results of an experiment as encoded JSON documents."""
+        # Results stored as one file each by earlier versions
+        legacy_dir = self.experiments_dir / exp_id / "results"
+        if legacy_dir.exists():
+            for result_file in sorted(legacy_dir.glob("*.json")):
+                yield dumps_json(read_json(result_file))
+
+        results_path = self._get_results_path(exp_id)
+        if results_path.exists():
+            with open(results_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield line
 
     def list_experiments(
         self,
@@ -267,22 +477,13 @@ class ExperimentTracker:
         Returns:
             List of experiment metadata dictionaries
         """
-        experiments = self.index["experiments"]
+        # Most recent first, from the list kept sorted by started_at
+        experiments = reversed(self._by_start)
 
         if status:
-            experiments = [e for e in experiments if e["status"] == status]
-
-        # Sort by started_at (most recent first)
-        experiments = sorted(
-            experiments,
-            key=lambda x: x["started_at"],
-            reverse=True
-        )
-
-        if limit:
-            experiments = experiments[:limit]
+            experiments = (e for e in experiments if e["status"] == status)
 
-        return experiments
+        return list(islice(experiments, limit or None))
 
     def get_latest_experiment(self, status: Optional[str] = None) -> Optional[ExperimentRun]:
         """
@@ -302,7 +503,7 @@ class ExperimentTracker:
 
     def export_experiment(self, exp_id: str, output_path: str):
         """
-        Export experiment data to a single file.
+        Export experiment data to a single (compact) JSON file.
 
         Args:
             exp_id: Experiment ID
@@ -312,13 +513,11 @@ class ExperimentTracker:
         if not experiment:
             raise ValueError(f"Experiment not found: {exp_id}")
 
-        results = self.get_experiment_results(exp_id)
-
-        export_data = {
-            "experiment": experiment.to_dict(),
-            "results": results,
-            "exported_at": datetime.utcnow().isoformat()
-        }
-
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        # Stream the results from the log so they are never all in memory
+        with atomic_open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(b'{"experiment":' + dumps_json(experiment.to_dict()) + b',"results":[')
+            for index, line in enumerate(self._iter_result_lines(exp_id)):
+                if index:
+                    f.write(b',')
+                f.write(line)
+            f.write(b'],"exported_at":' + dumps_json(utc_now_iso_us()) + b'}')
@@ -0,0 +1,339 @@
+"""
+SQLite-backed experiment tracking.
+
+Alternative to the file-based ExperimentTracker for long-running setups with
+many experiments and results: everything lives in one database file, result
+lookups are indexed queries instead of directory scans, and WAL journaling
+keeps each write a cheap append. The file-based tracker stays the default.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..core.clock import utc_now_iso, utc_now_iso_us
+from .experiment_tracker import ExperimentConfig, ExperimentRun
+from .serialization import atomic_open, dumps_json, loads_json
+
+# Buffer for streamed exports, which write one small chunk per result
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed_at TEXT,
+    json BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS experiments_started_at ON experiments (started_at);
+CREATE TABLE IF NOT EXISTS results (
+    exp_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    type TEXT NOT NULL,
+    json BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_exp_id_ts ON results (exp_id, ts);
+"""
+
+
+class SQLiteExperimentTracker:
+    """
+    Tracks evaluation experiments and stores results in a SQLite database.
+
+    Has the same public interface as ExperimentTracker. Every call commits
+    its own transaction; the database runs in WAL mode with
+    synchronous=NORMAL, so a commit is an append to the write-ahead log
+    rather than a rewrite of the database pages. Safe to share between
+    threads.
+
+    Usage:
+        tracker = SQLiteExperimentTracker(EXPERIMENTS_DIR / "experiments.db")
+    """
+
+    def __init__(self, db_path: Union[str, Path] = "data/experiments/experiments.db"):
+        """
+        Initialize experiment tracker.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()  # One connection, shared by all threads
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def flush(self):
+        """Commit pending writes (writes are committed as they happen)."""
+        with self._lock:
+            self._conn.commit()
+
+    def create_experiment(
+        self,
+        name: str,
+        config: ExperimentConfig,
+        metadata: Optional[Dict] = None,
+        durable: bool = False
+    ) -> ExperimentRun:
+        """
+        Create a new experiment run.
+
+        Args:
+            name: Human-readable experiment name
+            config: Experiment configuration
+            metadata: Additional metadata
+            durable: Accepted for compatibility with ExperimentTracker
+                (every write is committed immediately)
+
+        Returns:
+            ExperimentRun instance
+        """
+        exp_id = time.strftime("exp_%Y%m%d_%H%M%S", time.gmtime())
+
+        experiment = ExperimentRun(
+            id=exp_id,
+            name=name,
+            config=config,
+            metadata=metadata or {}
+        )
+        self._save_experiment(experiment)
+        return experiment
+
+    def _save_experiment(self, experiment: ExperimentRun):
+        """Insert or replace an experiment row."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO experiments VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    experiment.id,
+                    experiment.name,
+                    experiment.started_at,
+                    experiment.status,
+                    experiment.completed_at,
+                    dumps_json(experiment.to_dict())
+                )
+            )
+
+    def _get_experiment_json(self, exp_id: str) -> Optional[bytes]:
+        """Return the encoded record of an experiment, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json FROM experiments WHERE id = ?", (exp_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def load_experiment(self, exp_id: str) -> Optional[ExperimentRun]:
+        """
+        Load experiment by ID.
+
+        Args:
+            exp_id: Experiment ID
+
+        Returns:
+            ExperimentRun if found, None otherwise
+        """
+        data = self._get_experiment_json(exp_id)
+        if data is None:
+            return None
+        return ExperimentRun.from_dict(loads_json(data))
+
+    def load_experiments(self, exp_ids: List[str]) -> List[ExperimentRun]:
+        """
+        Load many experiments with one query.
+
+        Args:
+            exp_ids: Experiment IDs
+
+        Returns:
+            ExperimentRuns of the IDs that exist, in the order given
+        """
+        if not exp_ids:
+            return []
+        unique_ids = list(dict.fromkeys(exp_ids))
+        placeholders = ",".join("?" * len(unique_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, json FROM experiments WHERE id IN ({placeholders})", unique_ids
+            ).fetchall()
+        found = dict(rows)
+        return [
+            ExperimentRun.from_dict(loads_json(found[exp_id]))
+            for exp_id in exp_ids if exp_id in found
+        ]
+
+    def get_experiment_pretty(self, exp_id: str) -> Optional[str]:
+        """
+        Get an experiment record as indented JSON for reading.
+
+        Args:
+            exp_id: Experiment ID
+
+        Returns:
+            Pretty-printed JSON if found, None otherwise
+        """
+        data = self._get_experiment_json(exp_id)
+        if data is None:
+            return None
+        return dumps_json(loads_json(data), indent=True).decode('utf-8')
+
+    def update_experiment(
+        self,
+        experiment: ExperimentRun,
+        status: Optional[str] = None,
+        results_summary: Optional[Dict] = None,
+        durable: bool = False
+    ):
+        """
+        Update experiment status and results.
+
+        Args:
+            experiment: ExperimentRun to update
+            status: New status (if changing)
+            results_summary: Results summary to add/update
+            durable: Accepted for compatibility with ExperimentTracker
+                (every write is committed immediately)
+        """
+        if status:
+            experiment.status = status
+            if status == "completed":
+                experiment.completed_at = utc_now_iso_us()
+
+        if results_summary:
+            experiment.results_summary.update(results_summary)
+
+        self._save_experiment(experiment)
+
+    def store_result(
+        self,
+        exp_id: str,
+        result_data: Dict,
+        result_type: str = "evaluation"
+    ):
+        """
+        Store individual result within an experiment.
+
+        Args:
+            exp_id: Experiment ID
+            result_data: Result data to store
+            result_type: Type of result (evaluation, metric, etc.)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?)",
+                (exp_id, utc_now_iso(), result_type, dumps_json(result_data))
+            )
+
+    def _query_results(self, exp_id: str) -> sqlite3.Cursor:
+        """Select (type, timestamp, data) of an experiment's results; caller holds the lock."""
+        return self._conn.execute(
+            "SELECT type, ts, json FROM results WHERE exp_id = ? ORDER BY ts, rowid",
+            (exp_id,)
+        )
+
+    def get_experiment_results(self, exp_id: str) -> List[Dict]:
+        """
+        Get all results for an experiment.
+
+        Args:
+            exp_id: Experiment ID
+
+        Returns:
+            List of result dictionaries in the order they were stored
+        """
+        with self._lock:
+            rows = self._query_results(exp_id).fetchall()
+        return [
+            {"type": result_type, "timestamp": timestamp, "data": loads_json(data)}
+            for result_type, timestamp, data in rows
+        ]
+
+    def list_experiments(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        List experiments with optional filtering.
+
+        Args:
+            status: Filter by status
+            limit: Maximum number of experiments to return
+
+        Returns:
+            List of experiment metadata dictionaries (most recent first)
+        """
+        query = "SELECT id, name, started_at, status, completed_at FROM experiments"
+        params: List = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY started_at DESC, rowid"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        experiments = []
+        for exp_id, name, started_at, exp_status, completed_at in rows:
+            entry = {"id": exp_id, "name": name, "started_at": started_at, "status": exp_status}
+            if completed_at:
+                entry["completed_at"] = completed_at
+            experiments.append(entry)
+        return experiments
+
+    def get_latest_experiment(self, status: Optional[str] = None) -> Optional[ExperimentRun]:
+        """
+        Get the most recent experiment.
+
+        Args:
+            status: Filter by status
+
+        Returns:
+            Latest ExperimentRun or None
+        """
+        experiments = self.list_experiments(status=status, limit=1)
+        if not experiments:
+            return None
+
+        return self.load_experiment(experiments[0]["id"])
+
+    def export_experiment(self, exp_id: str, output_path: str):
+        """
+        Export experiment data to a single (compact) JSON file.
+
+        Produces the same document as ExperimentTracker.export_experiment().
+
+        Args:
+            exp_id: Experiment ID
+            output_path: Output file path
+        """
+        experiment = self._get_experiment_json(exp_id)
+        if experiment is None:
+            raise ValueError(f"Experiment not found: {exp_id}")
+
+        # Stream the results from the cursor so they are never all in memory
+        with atomic_open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f, self._lock:
+            f.write(b'{"experiment":' + experiment + b',"results":[')
+            for index, (result_type, timestamp, data) in enumerate(self._query_results(exp_id)):
+                if index:
+                    f.write(b',')
+                # Same record framing as the file-based results log
+                f.write(b'{"type":%b,"timestamp":"%b","data":%b}' % (
+                    dumps_json(result_type), timestamp.encode('ascii'), data
+                ))
+            f.write(b'],"exported_at":' + dumps_json(utc_now_iso_us()) + b'}')
@@ -0,0 +1,275 @@
+"""
+Semantic similarity cache for near-duplicate prompts.
+
+Complements the exact, content-addressed LLM output cache in CacheManager:
+prompts that differ only in whitespace or minor wording map to nearby
+embeddings, so a cosine-similarity lookup can reuse a previous output for
+a slight paraphrase of the same request.
+
+Lookups score every entry with one matrix-vector product when numpy is
+installed and fall back to a pure-Python dot product loop otherwise. Each
+scope's matrix is updated in place on insert and eviction. The
+matrix is float32: half the memory of float64 and several times faster to
+scan, with ample precision for comparing cosine scores against a threshold
+(numpy has no fast float16 matrix product, so halving again would be slower).
+
+Persistence follows the cache metadata: a snapshot file plus an append-only
+JSON Lines journal next to it, so an insert appends one entry instead of
+rewriting every embedding in the cache.
+"""
+
+import math
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .serialization import dumps_json, read_json, read_json_lines, write_json
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None
+
+# Default minimum cosine similarity for a hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+# Default number of entries kept before the least recently used is evicted
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Rows preallocated for a scope's embedding matrix (doubled when full)
+_INITIAL_CAPACITY = 64
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache of (embedding, output) pairs.
+
+    Embeddings are L2-normalized on insert, so similarity is a plain dot
+    product. Entries are grouped by scope (e.g. model and generation
+    settings), and only entries of the same scope are compared. The cache
+    holds at most max_entries entries and evicts the least recently used
+    one beyond that. Entries are persisted to a JSON snapshot file plus a
+    journal of later inserts (the snapshot path with a .jsonl suffix) and
+    reloaded on construction; the journal is folded into the snapshot once
+    it holds max_entries entries.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], List[float]],
+        cache_file: Optional[Path] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed: Function returning an embedding vector for a text
+                (e.g. AbstractLLMProvider.get_embeddings)
+            cache_file: Optional JSON snapshot file for persisting entries
+            similarity_threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of cached entries
+
+        Raises:
+            ValueError: If max_entries < 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self._embed = embed
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.journal_file = self.cache_file.with_suffix(".jsonl") if self.cache_file else None
+        self._journal_lines = 0  # Entries in the journal since the last compaction
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        # Entry ID -> (scope, normalized embedding, output), least recently used first
+        self._entries: "OrderedDict[int, Tuple[str, List[float], str]]" = OrderedDict()
+        self._next_id = 0
+        # Scope -> embedding index, built on the scope's first lookup
+        self._index: Dict[str, _ScopeIndex] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+        if self.cache_file is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def lookup(self, text: str, scope: str = "") -> Optional[str]:
+        """
+        Find the cached output of the most similar previous text.
+
+        Args:
+            text: Text to look up (e.g. a Phase 2 prompt)
+            scope: Only entries added with the same scope are considered
+
+        Returns:
+            Cached output if the best match reaches the similarity threshold,
+            None otherwise
+        """
+        entry_id, score = self._best_match(_normalize(self._embed(text)), scope)
+        if entry_id is not None and score >= self.similarity_threshold:
+            self._entries.move_to_end(entry_id)
+            self.stats["hits"] += 1
+            return self._entries[entry_id][2]
+
+        self.stats["misses"] += 1
+        return None
+
+    def add(self, text: str, output: str, scope: str = "") -> None:
+        """
+        Store the output produced for a text.
+
+        Args:
+            text: Text that produced the output
+            output: Output to return for similar texts
+            scope: Scope the entry belongs to (see lookup())
+        """
+        embedding = _normalize(self._embed(text))
+        self._insert(scope, embedding, output)
+        self._append(scope, embedding, output)
+
+    def _insert(self, scope: str, embedding: List[float], output: str) -> None:
+        """Add a normalized entry, evicting the least recently used ones if full."""
+        entry_id = self._next_id
+        self._entries[entry_id] = (scope, embedding, output)
+        self._next_id += 1
+        index = self._index.get(scope)
+        if index is not None:
+            index.append(entry_id, embedding)
+
+        while len(self._entries) > self.max_entries:
+            evicted_id, (evicted_scope, _, _) = self._entries.popitem(last=False)
+            index = self._index.get(evicted_scope)
+            if index is not None:
+                index.remove(evicted_id)
+
+    def _scope_index(self, scope: str) -> "_ScopeIndex":
+        """Return the index of a scope, building it on first use."""
+        index = self._index.get(scope)
+        if index is None:
+            index = _ScopeIndex()
+            for entry_id, (entry_scope, embedding, _) in self._entries.items():
+                if entry_scope == scope:
+                    index.append(entry_id, embedding)
+            self._index[scope] = index
+        return index
+
+    def _best_match(self, query: List[float], scope: str) -> Tuple[Optional[int], float]:
+        """Return (entry ID, similarity) of the most similar entry in the scope."""
+        return self._scope_index(scope).best_match(query)
+
+    def _load(self) -> None:
+        """Load entries from the snapshot and journal files."""
+        entries: List[Dict] = []
+        if self.cache_file.exists():
+            try:
+                entries = read_json(self.cache_file).get("entries", [])
+            except ValueError:
+                # Unreadable snapshot (e.g. cut off by a crash): start from the journal
+                entries = []
+        if self.journal_file.exists():
+            # A torn last line (process killed mid-append) is dropped
+            journaled = read_json_lines(self.journal_file)
+            self._journal_lines = len(journaled)
+            entries.extend(journaled)
+
+        for entry in entries[-self.max_entries:]:
+            self._insert(entry.get("scope", ""), entry["embedding"], entry["output"])
+
+    def _append(self, scope: str, embedding: List[float], output: str) -> None:
+        """Journal a new entry, compacting once the journal is as large as the cache."""
+        if self.cache_file is None:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        line = dumps_json({"scope": scope, "embedding": embedding, "output": output}) + b"\n"
+        with open(self.journal_file, 'ab') as f:
+            f.write(line)
+        self._journal_lines += 1
+        if self._journal_lines >= self.max_entries:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot file (written atomically)."""
+        if self.cache_file is None:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        entries: List[Dict] = [
+            {"scope": scope, "embedding": embedding, "output": output}
+            for scope, embedding, output in self._entries.values()
+        ]
+        write_json(self.cache_file, {"entries": entries}, atomic=True)
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_lines = 0
+
+
+class _ScopeIndex:
+    """
+    Embedding rows of one scope, updated in place as entries come and go.
+
+    With numpy the rows live in a preallocated float32 matrix that doubles
+    in capacity when full, so an insert copies one row rather than
+    rebuilding the matrix; a removed row is overwritten by the last one.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._ids: List[int] = []
+        self._positions: Dict[int, int] = {}
+        self._rows = None if np is not None else []
+
+    def append(self, entry_id: int, embedding: List[float]) -> None:
+        """Add the row of an entry."""
+        count = len(self._ids)
+        if np is not None:
+            if self._rows is None:
+                self._rows = np.empty((_INITIAL_CAPACITY, len(embedding)), dtype=np.float32)
+            elif count == len(self._rows):
+                grown = np.empty((2 * count, self._rows.shape[1]), dtype=np.float32)
+                grown[:count] = self._rows
+                self._rows = grown
+            self._rows[count] = embedding
+        else:
+            self._rows.append(embedding)
+        self._positions[entry_id] = count
+        self._ids.append(entry_id)
+
+    def remove(self, entry_id: int) -> None:
+        """Remove the row of an entry by moving the last row into its place."""
+        position = self._positions.pop(entry_id)
+        last = len(self._ids) - 1
+        last_id = self._ids.pop()
+        if position != last:
+            self._rows[position] = self._rows[last]
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+        if np is None:
+            self._rows.pop()
+
+    def best_match(self, query: List[float]) -> Tuple[Optional[int], float]:
+        """Return (entry ID, similarity) of the row most similar to a normalized query."""
+        if not self._ids:
+            return None, -1.0
+
+        if np is not None:
+            scores = self._rows[:len(self._ids)] @ np.asarray(query, dtype=np.float32)
+            best = int(scores.argmax())
+            return self._ids[best], float(scores[best])
+
+        best_id = None
+        best_score = -1.0
+        for entry_id, embedding in zip(self._ids, self._rows):
+            score = sum(map(float.__mul__, embedding, query))
+            if score > best_score:
+                best_id, best_score = entry_id, score
+        return best_id, best_score
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    """Return the L2-normalized copy of a vector."""
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return [float(value) for value in vector]
+    return [float(value) / norm for value in vector]
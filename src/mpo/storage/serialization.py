@@ -0,0 +1,174 @@
+"""
+JSON file serialization for caches, experiments and CLI output.
+
+Uses orjson when it is installed (several times faster than the stdlib for
+both dumping and loading, and able to serialize numpy values directly) and
+falls back to the standard json module otherwise. Both paths write UTF-8
+without ASCII escaping, so files stay readable for German and Spanish text.
+"""
+
+import json
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import IO, Any, Iterator, List, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Files at least this large are parsed from a memory map instead of a bytes copy
+_MMAP_MIN_SIZE = 256 * 1024
+
+
+def write_json(path: Union[str, Path], data: Any, indent: bool = False, atomic: bool = False) -> None:
+    """
+    Serialize data to a JSON file.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation
+        atomic: Write to a temporary file and rename it over path, so a
+            crash mid-write leaves the previous file intact
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with (atomic_open(path, 'wb') if atomic else open(path, 'wb')) as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        opener = atomic_open(path, 'w', encoding='utf-8') if atomic else open(path, 'w', encoding='utf-8')
+        with opener as f:
+            json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+@contextmanager
+def atomic_open(path: Union[str, Path], mode: str = 'wb', **kwargs) -> Iterator[IO]:
+    """
+    Open a temporary file that is renamed over path once the block succeeds.
+
+    The temporary file gets a unique name in the same directory (os.replace()
+    is only atomic within a file system), so concurrent writers of one path
+    never share it; it is removed if the block raises.
+
+    Args:
+        path: Final file path
+        mode: Write mode passed to open()
+        **kwargs: Other open() arguments (e.g. encoding, buffering)
+
+    Yields:
+        The open temporary file
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with open(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file.
+
+    Args:
+        path: File path to read
+
+    Returns:
+        Parsed JSON content
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes (e.g. one JSON Lines record).
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document without a trailing newline
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document from bytes or text.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Parsed JSON content
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_lines(path: Union[str, Path]) -> List[Any]:
+    """
+    Parse an append-only JSON Lines file, repairing a torn last line.
+
+    A process killed mid-append can leave the last line cut off. Such a
+    line is dropped and truncated from the file, so the next append starts
+    on a clean line; a complete last line that only lacks its newline gets
+    one appended.
+
+    Args:
+        path: File path to read
+
+    Returns:
+        Parsed records in file order
+
+    Raises:
+        ValueError: If a line other than the last one cannot be parsed
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    records = []
+    lines = data.split(b"\n")
+    # Everything before the last newline must be complete records
+    for line in lines[:-1]:
+        if line.strip():
+            records.append(loads_json(line))
+
+    tail = lines[-1]
+    if tail.strip():
+        try:
+            records.append(loads_json(tail))
+        except ValueError:
+            with open(path, 'r+b') as f:
+                f.truncate(len(data) - len(tail))
+        else:
+            with open(path, 'ab') as f:
+                f.write(b"\n")
+    return records